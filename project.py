@@ -15,14 +15,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from io import TextIOWrapper
-from os import environ as os_environ, pathsep as os_pathsep, getcwd as os_getcwd
+from contextlib import contextmanager
+from collections.abc import Iterator
+from hashlib import sha256, file_digest
+from io import StringIO, TextIOWrapper
+from marshal import dump as marshal_dump, load as marshal_load
+from json import dumps as json_dumps, loads as json_loads
+from os import environ as os_environ, pathsep as os_pathsep, getcwd as os_getcwd, cpu_count, walk as os_walk, \
+    stat as os_stat, chdir as os_chdir, close as os_close, dup2 as os_dup2, replace as os_replace, \
+    stat_result as os_stat_result
+import os
+from signal import signal, SIGCHLD, SIG_DFL, SIG_IGN
+import socket
+from struct import Struct
 from pathlib import Path
-from subprocess import run as subprocess_run, CalledProcessError
-from sys import argv as sys_argv, stderr as sys_stderr, stdin as sys_stdin, stdout as sys_stdout, exit as sys_exit
+from re import compile as re_compile
+from subprocess import run as subprocess_run, CalledProcessError, Popen, PIPE, STDOUT, DEVNULL
+from sys import argv as sys_argv, stderr as sys_stderr, stdin as sys_stdin, stdout as sys_stdout, exit as sys_exit, \
+    platform as sys_platform, executable as sys_executable
+from shutil import rmtree
 from textwrap import dedent
-from tomllib import loads as tomllib_loads
-from typing import Final, TypeVar, Any, Self
+from threading import Lock
+from time import perf_counter, sleep, time
+from traceback import print_exc
+from typing import Final, TypeVar, Any, Self, NamedTuple, TextIO
 
 # CONSTANTS
 # - project
@@ -32,15 +48,34 @@ PROJECT_PATH: Final[Path] = Path(__file__).parent.absolute()
 PROJECT_TOML_FILE_PATH: Final[str] = PROJECT_PATH.joinpath('pyproject.toml').as_posix()
 PROJECT_SECTION: Final[str] = 'tool.poetry'
 STRUCTURE_OPTION: Final[str] = 'packages'
+PYMSDL_SECTION: Final[str] = 'tool.pymsdl'
+RESOURCE_BUNDLER_OPTION: Final[str] = 'resource-bundler'
+RESOURCE_BUNDLE_COMPRESS_OPTION: Final[str] = 'resource-bundle-compress'
+RESOURCE_PATHS_OPTION: Final[str] = 'resource-paths'
+EMBEDDED_RESOURCES_OPTION: Final[str] = 'embedded-resources'
+BENCH_BASELINE_OPTION: Final[str] = 'bench-baseline'
+BENCH_REGRESSION_THRESHOLD_OPTION: Final[str] = 'bench-regression-threshold'
+CLEAN_EXCLUDES_OPTION: Final[str] = 'clean-excludes'
+IMAGE_BASE_OPTION: Final[str] = 'image-base'
+IMAGE_ENTRYPOINT_OPTION: Final[str] = 'image-entrypoint'
+IMAGE_WHEELHOUSE_OPTION: Final[str] = 'image-wheelhouse'
+DEFAULT_IMAGE_BASE: Final[str] = 'python:3.11-alpine'
 
 # - sources / test default paths
 DEFAULT_DIST_PATH: Final[str] = 'dist'
 DEFAULT_BUILD_PATH: Final[str] = 'build'
+DEFAULT_CACHE_PATH: Final[str] = 'build/cache'
+PROPERTIES_CACHE_FILE_NAME: Final[str] = 'pyproject.marshal'
 
 
 # CLASSES
 # - Project Configuration class
 class ProjectProperties:
+    """
+    Project properties lazily loaded from the pyproject file: a section is parsed on its first access only (see
+    get_section) and parsed sections are cached in the PROPERTIES_CACHE_FILE_NAME file (in the cache path) until the
+    pyproject file changes, so that project.py startup (ie: --help) doesn't parse the pyproject file
+    """
     T = TypeVar('T')
 
     def __init__(
@@ -49,42 +84,160 @@ class ProjectProperties:
             toml_file_path: str = PROJECT_TOML_FILE_PATH,
             project_section: str = PROJECT_SECTION,
             structure_option: str = STRUCTURE_OPTION,
+            pymsdl_section: str = PYMSDL_SECTION,
             dist_path: str = DEFAULT_DIST_PATH,
-            build_path: str = DEFAULT_BUILD_PATH
+            build_path: str = DEFAULT_BUILD_PATH,
+            cache_path: str = DEFAULT_CACHE_PATH
     ):
         self.__toml_file_path: Final[str] = toml_file_path
         self.__project_section: Final[str] = project_section
         self.__structure_option: Final[str] = structure_option
-        self.__toml_file_content: Final[dict[str, Any]] = self._load_toml()
+        self.__pymsdl_section: Final[str] = pymsdl_section
+        self.__sections: dict[str, Any] | None = None
+        self.__sections_stamp: tuple[str, int, int] | None = None
+        self.__sections_lock: Final[Lock] = Lock()
+        self.__document: dict[str, Any] | None = None  # The whole parsed file (on sections cache miss only)
 
         # - Global
         self.project_path: Final[Path] = project_path
         self.dist_path: Final[str] = dist_path
         self.build_path: Final[str] = build_path
-        self.src_rsrc_paths: Final[list[str]] = self._get_sources_and_resources_paths()
+        self.cache_path: Final[str] = cache_path
+        # True when project.py already runs in the project virtual env (ie: daemon worker): 'poetry run' is useless
+        self.venv_resolved: bool = False
 
-    def _load_toml(self) -> dict[str, Any]:
-        with open(self.__toml_file_path, "r", encoding="UTF-8") as toml_file:
-            return tomllib_loads(toml_file.read())
-
-    def _get_option(self, section: str, option: str, default: T | None = None) -> T | None:
-        option_path: list[str] = section.split('.')
-        path_dict: Any = self.__toml_file_content
-        for path in option_path:
-            path_dict = path_dict.get(path)
-            if not (path_dict and isinstance(path_dict, dict)):
-                return default
-        return path_dict.get(option, default)
-
-    def _get_sources_and_resources_paths(self) -> list[str]:
+    @property
+    def src_rsrc_paths(self) -> list[str]:
         return [
             self.project_path.joinpath(pkg_cnf['from']).as_posix()
             for pkg_cnf in self._get_option(self.__project_section, self.__structure_option, default=[])
             if 'from' in pkg_cnf
         ]
 
+    # - Resource bundles
+    @property
+    def resource_bundler(self) -> str | None:
+        return self._get_option(self.__pymsdl_section, RESOURCE_BUNDLER_OPTION)
+
+    @property
+    def resource_bundle_compress(self) -> bool:
+        return bool(self._get_option(self.__pymsdl_section, RESOURCE_BUNDLE_COMPRESS_OPTION, default=False))
+
+    @property
+    def resource_paths(self) -> list[str]:
+        resource_paths: Final[list[str]] = self._get_option(self.__pymsdl_section, RESOURCE_PATHS_OPTION) or []
+        return [self.project_path.joinpath(resource_path).as_posix() for resource_path in resource_paths]
+
+    @property
+    def embedded_resources(self) -> list[str]:
+        return self._get_option(self.__pymsdl_section, EMBEDDED_RESOURCES_OPTION, default=[]) or []
+
+    # - Benchmarks
+    @property
+    def bench_baseline(self) -> str | None:
+        return self._get_option(self.__pymsdl_section, BENCH_BASELINE_OPTION)
+
+    @property
+    def bench_regression_threshold(self) -> float | None:
+        return self._get_option(self.__pymsdl_section, BENCH_REGRESSION_THRESHOLD_OPTION)
+
+    # - Clean
+    @property
+    def clean_excludes(self) -> list[str]:
+        return self._get_option(self.__pymsdl_section, CLEAN_EXCLUDES_OPTION, default=[]) or []
+
+    # - Docker application image
+    @property
+    def project_name(self) -> str:
+        return self._get_option(self.__project_section, 'name', default='') or ''
+
+    @property
+    def project_version(self) -> str:
+        return self._get_option(self.__project_section, 'version', default='') or ''
+
+    @property
+    def image_base(self) -> str:
+        return self._get_option(self.__pymsdl_section, IMAGE_BASE_OPTION, default=DEFAULT_IMAGE_BASE) \
+            or DEFAULT_IMAGE_BASE
+
+    @property
+    def image_entrypoint(self) -> str | None:
+        return self._get_option(self.__pymsdl_section, IMAGE_ENTRYPOINT_OPTION)
+
+    @property
+    def image_wheelhouse(self) -> str | None:
+        wheelhouse: Final[str | None] = self._get_option(self.__pymsdl_section, IMAGE_WHEELHOUSE_OPTION)
+        return self.project_path.joinpath(wheelhouse).as_posix() if wheelhouse else None
+
+    def get_section(self, section: str) -> Any:
+        """
+        Get a raw pyproject section
+        :param section: the section path (ie: 'tool.poetry')
+        :return: the section content or None if it doesn't exist
+        """
+        with self.__sections_lock:
+            sections: Final[dict[str, Any]] = self._get_sections()
+            if section not in sections:
+                sections[section] = self._parse_section(section)
+                self._store_sections(sections)
+            return sections[section]
+
+    def _get_option(self, section: str, option: str, default: T | None = None) -> T | None:
+        section_dict: Final[Any] = self.get_section(section)
+        if not (section_dict and isinstance(section_dict, dict)):
+            return default
+        return section_dict.get(option, default)
+
+    def _get_sections(self) -> dict[str, Any]:
+        if self.__sections is None:
+            toml_stat: Final[os_stat_result] = os_stat(self.__toml_file_path)
+            self.__sections_stamp = (self.__toml_file_path, toml_stat.st_mtime_ns, toml_stat.st_size)
+            self.__sections = {}
+            try:
+                with open(self._get_sections_file_path(), 'rb') as sections_file:
+                    cached: Any = marshal_load(sections_file)
+                if isinstance(cached, dict) and cached.get('stamp') == self.__sections_stamp:
+                    self.__sections = cached['sections']
+            except (OSError, EOFError, ValueError, TypeError, KeyError):
+                pass  # No (or invalid) cache: sections are parsed again
+        return self.__sections
+
+    def _store_sections(self, sections: dict[str, Any]) -> None:
+        sections_file_path: Final[Path] = self._get_sections_file_path()
+        tmp_file_path: Final[Path] = sections_file_path.with_suffix('.tmp')
+        try:
+            sections_file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file_path, 'wb') as tmp_file:
+                marshal_dump({'stamp': self.__sections_stamp, 'sections': sections}, tmp_file)
+            os_replace(tmp_file_path, sections_file_path)
+        except (OSError, ValueError):
+            tmp_file_path.unlink(missing_ok=True)  # Read only project or not marshallable value (ie: TOML dates)
+
+    def _get_sections_file_path(self) -> Path:
+        return self.project_path.joinpath(self.cache_path, PROPERTIES_CACHE_FILE_NAME)
+
+    def _parse_section(self, section: str) -> Any:
+        # On cache miss only: the whole file is parsed once per process
+        if self.__document is None:
+            # pylint: disable-next=import-outside-toplevel
+            from tomllib import load as tomllib_load  # Imported on cache miss only (startup time)
+            with open(self.__toml_file_path, "rb") as toml_file:
+                self.__document = tomllib_load(toml_file)
+        path_dict: Any = self.__document
+        for path in section.split('.'):
+            if not isinstance(path_dict, dict):
+                return None
+            path_dict = path_dict.get(path)
+        return path_dict
+
 
 # - Project commands abstract class
+class CacheSpec(NamedTuple):
+    """Inputs and outputs of a command which can be skipped when it is up-to-date (see BuildCache)"""
+    sections: list[str]
+    outputs: list[str]
+
+
 class ProjectCommand:
     """The ProjectCommand abstract class used to execute a new project command"""
 
@@ -107,6 +260,71 @@ class ProjectCommand:
         """
         raise RuntimeError(f"abstract method -- subclass {self.__class__} must override")
 
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use,unused-argument
+    def get_command_env(self, properties: ProjectProperties) -> dict[str, str] | None:
+        """
+        Define the command environment variables (by default it is the current process environment)
+        :param properties: the project properties
+        :return: the command environment variables or None in order to inherit the current process ones
+        """
+        return None
+
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use,unused-argument
+    def run_in_process(self, properties: ProjectProperties, args: list[str], stdout: TextIO) -> int | None:
+        """
+        Run the command in the project.py process instead of its command line (ie: for a standard library only
+        command which doesn't need the poetry environment). In process commands are never cached (see get_cache_spec)
+        :param properties: the project properties
+        :param args: the command arguments
+        :param stdout: the command output
+        :return: the command return code or None in order to run the command line (default)
+        """
+        return None
+
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use
+    def is_parallelizable(self) -> bool:
+        """
+        Define if the command is independent of the other parallelizable commands (ie: it doesn't read what they write)
+        and can run concurrently with them (see the --parallel/-j runner options)
+        :return: True if the command can run concurrently with other parallelizable commands
+        """
+        return False
+
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use,unused-argument
+    def get_concurrent_env(self, properties: ProjectProperties, cmd_name: str) -> dict[str, str]:
+        """
+        Define additional environment variables used when the command runs concurrently with other commands (ie: in
+        order to isolate shared working directories)
+        :param properties: the project properties
+        :param cmd_name: the command name
+        :return: the additional environment variables
+        """
+        return {}
+
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use,unused-argument
+    def get_cache_spec(self, properties: ProjectProperties) -> CacheSpec | None:
+        """
+        Define the command inputs (besides its arguments, the project sources/resources, poetry.lock and the poetry
+        section) and outputs so that the command is skipped when its inputs didn't change since its last success
+        :param properties: the project properties
+        :return: the pyproject sections read by the command and the output glob patterns (relative to the project path)
+        which must still exist in order to skip it or None if the command must always be executed
+        """
+        return None
+
+    # noinspection PyMethodMayBeStatic
+    # pylint: disable=no-self-use
+    def prepare(self, properties: ProjectProperties) -> None:
+        """
+        Called before the command line is built in order to prepare specific states (like generated files)
+        :param properties: the project properties
+        """
+
     # noinspection PyMethodMayBeStatic
     # pylint: disable=no-self-use
     def finalize(self, properties: ProjectProperties) -> None:
@@ -124,6 +342,12 @@ class PoetryCommand(ProjectCommand):
         command_line: Final[list[str]] = ['poetry']
         if args:
             command_line.extend(args)
+        if command_line[1:2] == ['run']:
+            if properties.venv_resolved:
+                return command_line[2:]
+            if command_line[2:3] != ['--']:
+                # The "run" arguments must not be parsed by poetry (ie: it fails on "tox -e <env> -- <posargs>")
+                command_line.insert(2, '--')
         return command_line
 
 
@@ -139,37 +363,136 @@ class LoadDepsCommand(PoetryCommand):
 
 
 # -- Clean Command
-class CleanCommand(PoetryCommand):
-    """Remove directories generated by the "build" commands (like 'sdist' or 'wheel')"""
+class CleanCommand(ProjectCommand):
+    """Remove directories generated by the "build" commands (like 'sdist' or 'wheel') [--dry-run]"""
+    DRY_RUN_OPTION: Final[str] = '--dry-run'
+    TARGET_NAMES: Final[frozenset[str]] = frozenset({'.tox', '.pytest_cache'})  # Removed wherever they are
+    # Never walked: the VCS data, the virtual environments (ie: directories with a pyvenv.cfg file) and the
+    # clean-excludes option names of the [tool.pymsdl] section
+    PRUNED_NAMES: Final[frozenset[str]] = frozenset({'.git', '.hg', '.svn'})
+    VENV_MARKER_FILE_NAME: Final[str] = 'pyvenv.cfg'
 
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
-        clean_script: Final[str] = dedent(f"""\
-        from shutil import rmtree
-        from pathlib import Path
-
-        def rm_if_exists(path: Path) -> None:
-            if path.is_dir():
-                print(" |- Remove %s directory" % path)
-                rmtree(path)
-            elif path.is_file():
-                print(" |- Remove %s file" % path)
-                path.unlink()
-
-        path_to_rm: list[Path] = [
-            Path('{properties.dist_path}'),
-            Path('{properties.build_path}'),
-            Path('html/'),
-            Path('.mutmut-cache')
+        # Equivalent command line: the command runs in the project.py process (see run_in_process)
+        return [sys_executable, PROJECT_PATH.joinpath('project.py').as_posix(), 'clean', *(args or [])]
+
+    def run_in_process(self, properties: ProjectProperties, args: list[str], stdout: TextIO) -> int | None:
+        if any(arg != CleanCommand.DRY_RUN_OPTION for arg in args):
+            print(f"Usage: project.py clean [{CleanCommand.DRY_RUN_OPTION}]\n"
+                  f"  {CleanCommand.DRY_RUN_OPTION}\tReport the bytes each target would free without removing it",
+                  file=stdout)
+            return 0 if args in (['--help'], ['-h']) else 2
+        targets: Final[list[Path]] = self.find_targets(properties)
+        if not targets:
+            print(" |- Nothing to clean", file=stdout)
+            return 0
+        return self._remove_all(properties, targets, CleanCommand.DRY_RUN_OPTION in args, stdout)
+
+    def _remove_all(self, properties: ProjectProperties, targets: list[Path], dry_run: bool, stdout: TextIO) -> int:
+        # pylint: disable=import-outside-toplevel,too-many-locals
+        from concurrent.futures import ThreadPoolExecutor  # Imported when there is something to clean (startup time)
+        returncode: int = 0
+        total_size: int = 0
+        # Removals are I/O bound (the GIL is released by the system calls): the targets are removed concurrently
+        with ThreadPoolExecutor(max_workers=min(32, (cpu_count() or 1) * 4), thread_name_prefix='clean') as executor:
+            kinds: Final[list[str]] = ['directory' if self._is_dir(target) else 'file' for target in targets]
+            futures: Final[list] = [executor.submit(self._remove, target, dry_run) for target in targets]
+            for target, kind, future in zip(targets, kinds, futures):
+                relative_target: str = target.relative_to(properties.project_path).as_posix()
+                try:
+                    size: int = future.result()
+                except OSError as e:
+                    print(f" |- Cannot remove {relative_target} {kind}: {e}", file=stdout)
+                    returncode = 1
+                    continue
+                total_size += size
+                print(f" |- {'Would remove' if dry_run else 'Remove'} {relative_target} {kind} "
+                      f"({self._format_size(size)})", file=stdout)
+        print(f" |- {self._format_size(total_size)} {'would be freed' if dry_run else 'freed'}", file=stdout)
+        return returncode
+
+    def find_targets(self, properties: ProjectProperties) -> list[Path]:
+        """
+        Find what must be removed: the dist, build, html and .mutmut-cache paths and the TARGET_NAMES directories of the
+        project tree (the PRUNED_NAMES, clean-excludes and virtual environment directories are not walked)
+        :param properties: the project properties
+        :return: the existing target paths
+        """
+        root: Final[Path] = properties.project_path
+        fixed_targets: Final[list[Path]] = [
+            root.joinpath(properties.dist_path), root.joinpath(properties.build_path), root.joinpath('html'),
+            root.joinpath('.mutmut-cache')
         ]
-        path_to_rm.extend(Path('.').rglob('.tox'))
-        path_to_rm.extend(Path('.').rglob('.pytest_cache'))
-        for path in path_to_rm:
-            rm_if_exists(path)
-        """)
-        extended_args: Final[list[str]] = ['run', 'python', '-c', clean_script]
-        if args:
-            extended_args.extend(args)
-        return super().build_command_line(properties, extended_args)
+        targets: Final[list[Path]] = [target for target in fixed_targets if os.path.lexists(target)]
+        pruned_paths: Final[set[str]] = {target.as_posix() for target in fixed_targets}
+        pruned_names: Final[frozenset[str]] = CleanCommand.PRUNED_NAMES | set(properties.clean_excludes)
+        directories: Final[list[str]] = [root.as_posix()]
+        while directories:
+            try:
+                with os.scandir(directories.pop()) as scanner:
+                    entries: list[os.DirEntry[str]] = list(scanner)
+            except OSError:  # ie: removed or not readable
+                continue
+            if any(entry.name == CleanCommand.VENV_MARKER_FILE_NAME for entry in entries):
+                continue
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False) or entry.path in pruned_paths or entry.name in pruned_names:
+                    continue
+                if entry.name in CleanCommand.TARGET_NAMES:
+                    targets.append(Path(entry.path))
+                else:
+                    directories.append(entry.path)
+        return targets
+
+    @staticmethod
+    def _is_dir(path: Path) -> bool:
+        return path.is_dir() and not path.is_symlink()
+
+    @staticmethod
+    def _remove(path: Path, dry_run: bool) -> int:
+        """
+        Remove a path (unless dry_run) and return the bytes it used: the sizes are summed by the removal walk itself
+        (each entry is scanned and stated once)
+        """
+        # Allocated size (st_blocks) when available, like du
+        def entry_size(stat: os_stat_result) -> int:
+            return stat.st_blocks * 512 if hasattr(stat, 'st_blocks') else stat.st_size
+
+        size: int = entry_size(path.lstat())
+        if not CleanCommand._is_dir(path):
+            if not dry_run:
+                path.unlink(missing_ok=True)
+            return size
+        walked_directories: Final[list[str]] = []  # A directory is always walked after its parent
+        directories: Final[list[str]] = [os.fspath(path)]
+        while directories:
+            directory: str = directories.pop()
+            walked_directories.append(directory)
+            with os.scandir(directory) as scanner:
+                for entry in scanner:
+                    try:
+                        size += entry_size(entry.stat(follow_symlinks=False))
+                    except FileNotFoundError:  # ie: removed meanwhile
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif not dry_run:
+                        os.unlink(entry.path)
+        if not dry_run:
+            for directory in reversed(walked_directories):
+                os.rmdir(directory)
+        return size
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        if size < 1024:
+            return f"{size}B"
+        scaled_size: float = size / 1024
+        for unit in ('KB', 'MB'):
+            if scaled_size < 1024:
+                return f"{scaled_size:.1f}{unit}"
+            scaled_size /= 1024
+        return f"{scaled_size:.1f}GB"
 
 
 # -- Run Command
@@ -199,6 +522,30 @@ class RunCommand(PoetryCommand):
 # -- Tox Command
 class ToxCommand(PoetryCommand):
     """Run tox"""
+    WORK_DIR_ENV_VAR: Final[str] = 'TOX_WORK_DIR'
+    LOCK_FILE_NAME: Final[str] = 'poetry.lock'
+
+    def get_command_env(self, properties: ProjectProperties) -> dict[str, str] | None:
+        return {**os_environ, ToxCommand.WORK_DIR_ENV_VAR: self._get_work_path(properties).as_posix()}
+
+    def get_concurrent_env(self, properties: ProjectProperties, cmd_name: str) -> dict[str, str]:
+        # Concurrent tox runs must not share their work dir (ie: the '.pkg' build env)
+        return {ToxCommand.WORK_DIR_ENV_VAR: self._get_work_path(properties).joinpath(cmd_name).as_posix()}
+
+    def prepare(self, properties: ProjectProperties) -> None:
+        # Envs built from another poetry.lock are outdated
+        work_path: Final[Path] = self._get_work_path(properties)
+        for path in work_path.parent.glob(f"{ToxCommand.LOCK_FILE_NAME}-*"):
+            if path != work_path:
+                print(f" |- Remove outdated tox envs {path}")
+                rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _get_work_path(properties: ProjectProperties) -> Path:
+        # tox envs are reused as long as poetry.lock doesn't change (ie: CI can cache .tox with a poetry.lock hash key)
+        lock_path: Final[Path] = properties.project_path.joinpath(ToxCommand.LOCK_FILE_NAME)
+        lock_hash: Final[str] = sha256(lock_path.read_bytes()).hexdigest()[:16] if lock_path.is_file() else 'none'
+        return properties.project_path.joinpath('.tox', f"{ToxCommand.LOCK_FILE_NAME}-{lock_hash}")
 
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
         extended_args: Final[list[str]] = ['run', 'tox']
@@ -212,18 +559,32 @@ class TestCommand(ToxCommand):
     """Run configured unit tests"""
     SKIP_ENV_VAR: Final[str] = 'TOX_SKIP_ENV'
 
-    def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
-        os_environ[TestCommand.SKIP_ENV_VAR] = 'pylint|mutation|mypy'
-        return super().build_command_line(properties, args)
+    def get_command_env(self, properties: ProjectProperties) -> dict[str, str] | None:
+        return {
+            **(super().get_command_env(properties) or os_environ),
+            TestCommand.SKIP_ENV_VAR: 'pylint|mutation|mypy'
+        }
 
-    def finalize(self, properties: ProjectProperties) -> None:
-        os_environ.pop(TestCommand.SKIP_ENV_VAR, None)
+    def get_cache_spec(self, properties: ProjectProperties) -> CacheSpec | None:
+        return CacheSpec(
+            ['tool.tox', 'tool.pytest', 'tool.coverage'],
+            [f"{properties.build_path}/reports/coverage/xml/coverage.xml"]
+        )
+
+    def is_parallelizable(self) -> bool:
+        return True
 
 
 # -- Lint Command
 class LintCommand(ToxCommand):
     """Run linter"""
 
+    def is_parallelizable(self) -> bool:
+        return True
+
+    def get_cache_spec(self, properties: ProjectProperties) -> CacheSpec | None:
+        return CacheSpec(['tool.tox', 'tool.pylint'], [f"{properties.build_path}/reports/lint/lint.txt"])
+
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
         extended_args: Final[list[str]] = ['-e', 'pylint']
         if args:
@@ -235,6 +596,8 @@ class LintCommand(ToxCommand):
 class MutationCommand(ToxCommand):
     """Run mutation tests"""
 
+    # Not parallelizable: mutmut mutates the sources it tests and its runner already uses every CPU
+
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
         extended_args: Final[list[str]] = ['-e', 'mutation']
         if args:
@@ -246,6 +609,12 @@ class MutationCommand(ToxCommand):
 class TypingCheckCommand(ToxCommand):
     """Run typing checker"""
 
+    def is_parallelizable(self) -> bool:
+        return True
+
+    def get_cache_spec(self, properties: ProjectProperties) -> CacheSpec | None:
+        return CacheSpec(['tool.tox', 'tool.mypy'], [f"{properties.build_path}/reports/typing/text/index.txt"])
+
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
         extended_args: Final[list[str]] = ['-e', 'mypy']
         if args:
@@ -253,23 +622,75 @@ class TypingCheckCommand(ToxCommand):
         return super().build_command_line(properties, extended_args)
 
 
+# -- Bench Command
+class BenchCommand(ToxCommand):
+    """Run benchmarks and compare them to the baseline (arguments are given to the benchmark runner)"""
+
+    # Not parallelizable: concurrent commands would disturb the measures
+
+    def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
+        extended_args: Final[list[str]] = ['-e', 'bench', '--']
+        if properties.bench_baseline:
+            extended_args.extend(['--baseline', properties.bench_baseline])
+        if properties.bench_regression_threshold is not None:
+            extended_args.extend(['--threshold', str(properties.bench_regression_threshold)])
+        if args:
+            extended_args.extend(args)
+        return super().build_command_line(properties, extended_args)
+
+
+# -- Build Command (used as superclass)
+class BuildCommand(PoetryCommand):
+    """Build archives (resource packages are bundled first when a resource-bundler is configured)"""
+
+    def prepare(self, properties: ProjectProperties) -> None:
+        if properties.resource_bundler and properties.resource_paths:
+            bundler_args: Final[list[str]] = ['--compress'] if properties.resource_bundle_compress else []
+            for embedded_resource in properties.embedded_resources:
+                bundler_args.extend(['--embed', embedded_resource])
+            subprocess_run(self._build_bundler_command_line(properties, bundler_args), check=True)
+
+    def finalize(self, properties: ProjectProperties) -> None:
+        # Generated bundles must not stay in the sources
+        if properties.resource_bundler and properties.resource_paths:
+            subprocess_run(self._build_bundler_command_line(properties, ['--clean']), check=False)
+
+    def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
+        extended_args: Final[list[str]] = ['build']
+        if args:
+            extended_args.extend(args)
+        return super().build_command_line(properties, extended_args)
+
+    def _build_bundler_command_line(self, properties: ProjectProperties, args: list[str]) -> list[str]:
+        bundler: Final[str | None] = properties.resource_bundler
+        if not bundler:
+            raise RuntimeError(f"the {RESOURCE_BUNDLER_OPTION} option of the [{PYMSDL_SECTION}] section is required")
+        bundler_args: Final[list[str]] = ['run', 'python', '-m', bundler]
+        bundler_args.extend(args)
+        bundler_args.extend(properties.resource_paths)
+        return PoetryCommand.build_command_line(self, properties, bundler_args)
+
+
 # -- Wheel Command
-class WheelCommand(PoetryCommand):
+class WheelCommand(BuildCommand):
     """Build Wheel archive"""
 
+    def get_cache_spec(self, properties: ProjectProperties) -> CacheSpec | None:
+        return CacheSpec(['tool.pymsdl', 'build-system'], [f"{properties.dist_path}/*.whl"])
+
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
-        extended_args: Final[list[str]] = ['build', '--format', 'wheel']
+        extended_args: Final[list[str]] = ['--format', 'wheel']
         if args:
             extended_args.extend(args)
         return super().build_command_line(properties, extended_args)
 
 
 # -- Sdist Command
-class SdistCommand(PoetryCommand):
+class SdistCommand(BuildCommand):
     """Build sdist archive"""
 
     def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
-        extended_args: Final[list[str]] = ['build', '--format', 'sdist']
+        extended_args: Final[list[str]] = ['--format', 'sdist']
         if args:
             extended_args.extend(args)
         return super().build_command_line(properties, extended_args)
@@ -286,7 +707,680 @@ class UploadCommand(PoetryCommand):
         return super().build_command_line(properties, extended_args)
 
 
-# - Project command executor class
+# -- Image Command
+class ImageCommand(ProjectCommand):
+    """Build the docker application image from the project wheel and measure its cold start (see: image --help)"""
+    DOCKERFILE_PATH: Final[str] = 'docker/app/Dockerfile'
+    CONTEXT_PATH: Final[str] = 'image'  # In the build path
+    REQUIREMENTS_FILE_NAME: Final[str] = 'requirements.txt'
+    WHEELHOUSE_DIRECTORY_NAME: Final[str] = 'wheels'
+    REPORT_PATH: Final[str] = 'reports/image'  # In the build path
+    REPORT_FILE_NAME: Final[str] = 'startup.json'
+    DEFAULT_RUNS: Final[int] = 5
+
+    def build_command_line(self, properties: ProjectProperties, args: list[str] | None = None) -> list[str]:
+        # Equivalent command line: the command runs in the project.py process (see run_in_process)
+        return [sys_executable, PROJECT_PATH.joinpath('project.py').as_posix(), 'image', *(args or [])]
+
+    def run_in_process(self, properties: ProjectProperties, args: list[str], stdout: TextIO) -> int | None:
+        # pylint: disable=import-outside-toplevel
+        from argparse import ArgumentParser  # Imported when the command runs only (startup time)
+        from contextlib import redirect_stderr, redirect_stdout
+        from shlex import join as shlex_join
+        parser: Final[ArgumentParser] = ArgumentParser(
+            prog='project.py image',
+            description=f"Build the {ImageCommand.DOCKERFILE_PATH} image from the project wheel (run './project.py "
+                        f"wheel image'), then time its container starts"
+        )
+        parser.add_argument('--tag', help="the image tag (default: <project name>:<project version>)")
+        parser.add_argument('--entrypoint', default=properties.image_entrypoint,
+                            help=f"the image entrypoint (default: the {IMAGE_ENTRYPOINT_OPTION} option, else python)")
+        parser.add_argument('--cmd', help="the image default arguments")
+        parser.add_argument('--offline', action='store_true',
+                            help=f"build without network: the base image must be local and the dependencies in the "
+                                 f"{IMAGE_WHEELHOUSE_OPTION} directory")
+        parser.add_argument('--runs', type=int, default=ImageCommand.DEFAULT_RUNS,
+                            help="number of timed container starts (0 in order to skip the measure)")
+        parser.add_argument('--prepare-only', action='store_true',
+                            help="only prepare the build context and print the docker build command line")
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stdout):
+                arguments: Final[Any] = parser.parse_args(args)
+        except SystemExit as e:  # --help or usage error
+            return e.code if isinstance(e.code, int) else 2
+
+        wheel_path: Final[Path | None] = self.find_wheel(properties)
+        if wheel_path is None:
+            print(f" |- No {properties.project_name} {properties.project_version} wheel in {properties.dist_path}: "
+                  f"run './project.py wheel image'", file=stdout)
+            return 1
+        tag: Final[str] = arguments.tag or f"{properties.project_name}:{properties.project_version}"
+        command_line: Final[list[str]] = self.build_docker_command_line(
+            properties, self.prepare_context(properties, wheel_path), tag, arguments
+        )
+        if arguments.prepare_only:
+            print(f" |- Build command: {shlex_join(command_line)}", file=stdout)
+            return 0
+        try:
+            returncode: Final[int] = self._run_streamed(properties, command_line, stdout)
+            if returncode or arguments.runs <= 0:
+                return returncode
+            return self.measure_startup(properties, tag, arguments.runs, stdout)
+        except FileNotFoundError:
+            print(" |- The docker command is required (see: https://docs.docker.com/get-docker/)", file=stdout)
+            return 1
+
+    @staticmethod
+    def find_wheel(properties: ProjectProperties) -> Path | None:
+        """
+        :param properties: the project properties
+        :return: the last built wheel of the project version or None if there is none
+        """
+        distribution: Final[str] = re_compile(r"[-_.]+").sub('_', properties.project_name)
+        wheels: Final[list[Path]] = list(properties.project_path.joinpath(properties.dist_path).glob(
+            f"{distribution}-{properties.project_version}-*.whl"
+        ))
+        return max(wheels, key=lambda wheel: wheel.stat().st_mtime_ns) if wheels else None
+
+    def prepare_context(self, properties: ProjectProperties, wheel_path: Path) -> Path:
+        """
+        Prepare the docker build context (in the build path), which only contains what the Dockerfile copies: the
+        REQUIREMENTS_FILE_NAME file exported from poetry.lock, the image-wheelhouse wheels and the project wheel
+        :param properties: the project properties
+        :param wheel_path: the project wheel
+        :return: the build context path
+        """
+        context_path: Final[Path] = properties.project_path.joinpath(properties.build_path, ImageCommand.CONTEXT_PATH)
+        rmtree(context_path, ignore_errors=True)
+        wheelhouse_path: Final[Path] = context_path.joinpath(ImageCommand.WHEELHOUSE_DIRECTORY_NAME)
+        wheelhouse_path.mkdir(parents=True)
+        self._link(wheel_path, context_path.joinpath(wheel_path.name))
+        if properties.image_wheelhouse:
+            for dependency_wheel_path in Path(properties.image_wheelhouse).glob('*.whl'):
+                self._link(dependency_wheel_path, wheelhouse_path.joinpath(dependency_wheel_path.name))
+        context_path.joinpath(ImageCommand.REQUIREMENTS_FILE_NAME).write_text(
+            self.export_requirements(properties), encoding='UTF-8'
+        )
+        return context_path
+
+    def export_requirements(self, properties: ProjectProperties) -> str:
+        """
+        Export the locked runtime dependencies (the [tool.poetry.dependencies] ones and their dependencies, not the dev
+        ones) of poetry.lock as a pip requirements file with hashes
+        :param properties: the project properties
+        :return: the requirements file content (empty without runtime dependency)
+        """
+        # pylint: disable=import-outside-toplevel
+        from tomllib import loads as tomllib_loads  # Imported when the command runs only (startup time)
+        lock_path: Final[Path] = properties.project_path.joinpath('poetry.lock')
+        packages: Final[dict[str, dict[str, Any]]] = {
+            self._normalize(package['name']): package
+            for package in (tomllib_loads(lock_path.read_text(encoding='UTF-8')).get('package', [])
+                            if lock_path.is_file() else [])
+        }
+        dependencies: Final[dict[str, Any]] = dict(properties.get_section('tool.poetry.dependencies') or {})
+        dependencies.pop('python', None)
+        # {package name: its markers or None if it is required whatever the platform}
+        markers: Final[dict[str, set[str] | None]] = {}
+        pending: Final[list[tuple[str, str | None]]] = list(self._get_requirements(dependencies))
+        while pending:
+            name, marker = pending.pop()
+            if name not in packages:
+                continue
+            if name not in markers:
+                markers[name] = None if marker is None else {marker}
+                pending.extend(self._get_requirements(packages[name].get('dependencies', {})))
+            elif markers[name] is not None:
+                package_markers: set[str] | None = markers[name]
+                markers[name] = None if marker is None or package_markers is None else package_markers | {marker}
+        return ''.join(
+            f"{packages[name]['name']}=={packages[name]['version']}"
+            + ('' if markers[name] is None else f" ; {' or '.join(f'({m})' for m in sorted(markers[name] or []))}")
+            + ''.join(f" --hash={file['hash']}" for file in packages[name].get('files', []))
+            + '\n'
+            for name in sorted(markers)
+        )
+
+    @staticmethod
+    def build_docker_command_line(properties: ProjectProperties, context_path: Path, tag: str, arguments: Any) \
+            -> list[str]:
+        command_line: Final[list[str]] = [
+            'docker', 'build', '-f', properties.project_path.joinpath(ImageCommand.DOCKERFILE_PATH).as_posix(),
+            '-t', tag, '--build-arg', f"base_image={properties.image_base}",
+            '--build-arg', f"wheel_name={sorted(context_path.glob('*.whl'))[0].name}"
+        ]
+        if arguments.entrypoint:
+            command_line.extend(['--build-arg', f"entrypoint={arguments.entrypoint}"])
+        if arguments.cmd:
+            command_line.extend(['--build-arg', f"cmd={arguments.cmd}"])
+        if arguments.offline:
+            # No network in the RUN instructions and pip only installs from the wheelhouse
+            command_line.extend(['--network', 'none', '--build-arg', 'pip_options=--no-index'])
+        command_line.append(context_path.as_posix())
+        return command_line
+
+    def measure_startup(self, properties: ProjectProperties, tag: str, runs: int, stdout: TextIO) -> int:
+        """
+        Time the container starts of the image (like 'docker run --rm <tag>') and write them in the REPORT_FILE_NAME
+        report. The container start overhead is timed too (with a 'true' entrypoint) so that the application cold start
+        is reported apart from it
+        :param properties: the project properties
+        :param tag: the image tag
+        :param runs: the number of timed starts
+        :param stdout: the command output
+        :return: the command return code
+        """
+        # pylint: disable=import-outside-toplevel
+        from statistics import median  # Imported when the command runs only (startup time)
+        run_command_line: Final[list[str]] = ['docker', 'run', '--rm', '--network', 'none']
+        try:
+            starts: Final[list[float]] = [self._time([*run_command_line, tag]) for _ in range(runs)]
+            overheads: Final[list[float]] = [
+                self._time([*run_command_line, '--entrypoint', 'true', tag]) for _ in range(runs)
+            ]
+        except CalledProcessError as e:
+            print(f" |- Cannot run the {tag} image: {e}", file=stdout)
+            return e.returncode
+        application_start: Final[float] = max(0.0, min(starts) - min(overheads))
+        print(f" |- Container start ({tag}): first {starts[0] * 1000:.1f}ms, best {min(starts) * 1000:.1f}ms, "
+              f"median {median(starts) * 1000:.1f}ms ({runs} runs)\n"
+              f" |- Container overhead (true entrypoint): best {min(overheads) * 1000:.1f}ms, "
+              f"median {median(overheads) * 1000:.1f}ms\n"
+              f" |- Application cold start: {application_start * 1000:.1f}ms", file=stdout)
+        report_path: Final[Path] = properties.project_path.joinpath(properties.build_path, ImageCommand.REPORT_PATH)
+        report_path.mkdir(parents=True, exist_ok=True)
+        report_path.joinpath(ImageCommand.REPORT_FILE_NAME).write_text(json_dumps({
+            'tag': tag,
+            'timestamp': time(),
+            'container_starts': starts,
+            'container_overheads': overheads,
+            'application_cold_start': application_start
+        }, indent=2), encoding='UTF-8')
+        return 0
+
+    @staticmethod
+    def _get_requirements(dependencies: dict[str, Any]) -> Iterator[tuple[str, str | None]]:
+        # The (normalized name, marker) of the non-optional dependencies of a pyproject or poetry.lock dependency table
+        for name, specs in dependencies.items():
+            for spec in specs if isinstance(specs, list) else [specs]:
+                if not (isinstance(spec, dict) and spec.get('optional')):
+                    yield ImageCommand._normalize(name), spec.get('markers') if isinstance(spec, dict) else None
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return re_compile(r"[-_.]+").sub('-', name).lower()
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> None:
+        try:
+            os.link(source, target)
+        except OSError:  # ie: other file system
+            # pylint: disable=import-outside-toplevel
+            from shutil import copy2
+            copy2(source, target)
+
+    @staticmethod
+    def _run_streamed(properties: ProjectProperties, command_line: list[str], stdout: TextIO) -> int:
+        with Popen(command_line, stdout=PIPE, stderr=STDOUT, text=True,
+                   cwd=properties.project_path.as_posix()) as process:
+            for line in process.stdout or []:
+                stdout.write(line)
+        return process.returncode
+
+    @staticmethod
+    def _time(command_line: list[str]) -> float:
+        start: Final[float] = perf_counter()
+        subprocess_run(command_line, stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL, check=True)
+        return perf_counter() - start
+
+
+# - Build cache class
+class CachedRun(NamedTuple):
+    duration: float
+    output: bytes
+
+
+class BuildCache:
+    """
+    Cache of the successful command runs keyed by a fingerprint of their inputs: the command line, the project sources
+    and resources content, poetry.lock and the pyproject sections listed in the command CacheSpec.
+    File contents are only hashed again when their mtime/size changed (file digests are memoized in the cache dir).
+    """
+    RUNS_FILE_NAME: Final[str] = 'runs.json'
+    FILES_FILE_NAME: Final[str] = 'files.json'
+    INPUT_FILES: Final[tuple[str, ...]] = ('poetry.lock',)
+    INPUT_SECTIONS: Final[tuple[str, ...]] = ('tool.poetry',)
+    EXCLUDED_DIRS: Final[frozenset[str]] = frozenset({'__pycache__', '.pytest_cache', '.mypy_cache'})
+
+    def __init__(self, properties: ProjectProperties):
+        self.__properties: Final[ProjectProperties] = properties
+        self.__cache_path: Final[Path] = properties.project_path.joinpath(properties.cache_path)
+        self.__lock: Final[Lock] = Lock()
+        self.__runs: dict[str, dict[str, Any]] | None = None
+        self.__file_digests: dict[str, list[Any]] | None = None
+
+    def fingerprint(self, call: "CommandCall") -> str | None:
+        """
+        Compute the inputs fingerprint of a command call
+        :param call: the command call
+        :return: the fingerprint or None if the command is not cacheable
+        """
+        spec: Final[CacheSpec | None] = call.command.get_cache_spec(self.__properties)
+        if spec is None:
+            return None
+        digest: Final = sha256(json_dumps([
+            call.name,
+            call.command.__class__.__qualname__,
+            call.command.build_command_line(self.__properties, list(call.args)),
+            [self.__properties.get_section(section) for section in (*BuildCache.INPUT_SECTIONS, *spec.sections)]
+        ], sort_keys=True, default=str).encode())
+        with self.__lock:
+            file_digests: Final[dict[str, list[Any]]] = self._get_file_digests()
+            for file_path in self._iter_input_files():
+                digest.update(file_path.encode())
+                digest.update(self._get_file_digest(file_digests, file_path).encode())
+        return digest.hexdigest()
+
+    def lookup(self, call: "CommandCall", fingerprint: str) -> CachedRun | None:
+        """
+        Get the last successful run of a command
+        :param call: the command call
+        :param fingerprint: the current inputs fingerprint of the command call
+        :return: the cached run or None if the inputs changed or if an output is missing
+        """
+        spec: Final[CacheSpec | None] = call.command.get_cache_spec(self.__properties)
+        with self.__lock:
+            last_run: Final[dict[str, Any] | None] = self._get_runs().get(call.name)
+        log_path: Final[Path] = self.__cache_path.joinpath(f"{call.name}.log")
+        if spec is None or last_run is None or last_run['fingerprint'] != fingerprint or not log_path.is_file() \
+                or not all(any(self.__properties.project_path.glob(output)) for output in spec.outputs):
+            return None
+        return CachedRun(last_run['duration'], log_path.read_bytes())
+
+    def store(self, call: "CommandCall", fingerprint: str, duration: float, output: bytes) -> None:
+        """
+        Record a successful command run
+        :param call: the command call
+        :param fingerprint: the inputs fingerprint computed before the run
+        :param duration: the run duration in seconds
+        :param output: the run console output (replayed when the command is skipped)
+        """
+        with self.__lock:
+            self.__cache_path.mkdir(parents=True, exist_ok=True)
+            self.__cache_path.joinpath(f"{call.name}.log").write_bytes(output)
+            runs: Final[dict[str, dict[str, Any]]] = self._get_runs()
+            runs[call.name] = {'fingerprint': fingerprint, 'duration': duration}
+            self.__cache_path.joinpath(BuildCache.RUNS_FILE_NAME).write_text(json_dumps(runs), encoding='UTF-8')
+            self.__cache_path.joinpath(BuildCache.FILES_FILE_NAME) \
+                .write_text(json_dumps(self._get_file_digests()), encoding='UTF-8')
+
+    def _iter_input_files(self) -> list[str]:
+        project_path: Final[Path] = self.__properties.project_path
+        input_files: Final[list[str]] = [
+            file_name for file_name in BuildCache.INPUT_FILES if project_path.joinpath(file_name).is_file()
+        ]
+        for src_rsrc_path in self.__properties.src_rsrc_paths:
+            for dir_path, dir_names, file_names in os_walk(src_rsrc_path):
+                dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name not in BuildCache.EXCLUDED_DIRS)
+                relative_dir_path: Path = Path(dir_path).relative_to(project_path)
+                input_files.extend(relative_dir_path.joinpath(file_name).as_posix() for file_name in sorted(file_names))
+        return input_files
+
+    def _get_file_digest(self, file_digests: dict[str, list[Any]], file_path: str) -> str:
+        stat_result: Final = os_stat(self.__properties.project_path.joinpath(file_path))
+        memo: Final[list[Any] | None] = file_digests.get(file_path)
+        if memo and memo[0] == stat_result.st_mtime_ns and memo[1] == stat_result.st_size:
+            return memo[2]
+        with open(self.__properties.project_path.joinpath(file_path), 'rb') as file:
+            digest: Final[str] = file_digest(file, 'sha256').hexdigest()
+        file_digests[file_path] = [stat_result.st_mtime_ns, stat_result.st_size, digest]
+        return digest
+
+    def _get_runs(self) -> dict[str, dict[str, Any]]:
+        if self.__runs is None:
+            self.__runs = self._load_json(BuildCache.RUNS_FILE_NAME)
+        return self.__runs
+
+    def _get_file_digests(self) -> dict[str, list[Any]]:
+        if self.__file_digests is None:
+            self.__file_digests = self._load_json(BuildCache.FILES_FILE_NAME)
+        return self.__file_digests
+
+    def _load_json(self, file_name: str) -> dict[str, Any]:
+        try:
+            return json_loads(self.__cache_path.joinpath(file_name).read_text(encoding='UTF-8'))
+        except (OSError, ValueError):
+            return {}
+
+
+# - Command timing report class
+class TimingReport:
+    """
+    Timing report of a project.py run written in REPORT_PATH (in the build path):
+    - SUMMARY_FILE_NAME: wall-clock time, user/system CPU time, peak RSS and exit code of each command
+    - TRACE_FILE_NAME: the same commands as a Chrome trace (chrome://tracing, https://ui.perfetto.dev) where concurrent
+    commands are displayed on separate tracks
+    """
+    REPORT_PATH: Final[str] = 'reports/timing'
+    SUMMARY_FILE_NAME: Final[str] = 'timing.json'
+    TRACE_FILE_NAME: Final[str] = 'trace.json'
+
+    def __init__(self, properties: ProjectProperties):
+        self.__report_path: Final[Path] = properties.project_path.joinpath(
+            properties.build_path, TimingReport.REPORT_PATH
+        )
+
+    def write(self, results: list["CommandResult"], start: float, start_time: float) -> None:
+        """
+        Write the summary and trace files
+        :param results: the command results
+        :param start: the run start (perf_counter value)
+        :param start_time: the run start (epoch time)
+        """
+        commands: Final[list[dict[str, Any]]] = [self._to_dict(result, start) for result in results]
+        self.__report_path.mkdir(parents=True, exist_ok=True)
+        self.__report_path.joinpath(TimingReport.SUMMARY_FILE_NAME).write_text(json_dumps({
+            'start_time': start_time,
+            'duration': perf_counter() - start,
+            'user_time': sum(command['user_time'] or 0.0 for command in commands),
+            'system_time': sum(command['system_time'] or 0.0 for command in commands),
+            'max_rss_kb': max((command['max_rss_kb'] or 0 for command in commands), default=0),
+            'commands': commands
+        }, indent=2), encoding='UTF-8')
+        self.__report_path.joinpath(TimingReport.TRACE_FILE_NAME).write_text(
+            json_dumps(self._get_trace(commands)), encoding='UTF-8'
+        )
+
+    @staticmethod
+    def _to_dict(result: "CommandResult", start: float) -> dict[str, Any]:
+        return {
+            'name': result.call.name,
+            'args': result.call.args,
+            'status': CommandsRunner.get_status_str(result),
+            'returncode': result.returncode,
+            'start': max(result.start - start, 0.0),
+            'duration': result.duration,
+            'user_time': result.usage.user_time if result.usage else None,
+            'system_time': result.usage.system_time if result.usage else None,
+            'max_rss_kb': result.usage.max_rss_kb if result.usage else None
+        }
+
+    @staticmethod
+    def _get_trace(commands: list[dict[str, Any]]) -> dict[str, Any]:
+        events: Final[list[dict[str, Any]]] = [
+            {'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'project.py'}}
+        ]
+        track_ends: Final[list[float]] = []  # End of the last command of each track
+        for command in sorted(commands, key=lambda sorted_command: sorted_command['start']):
+            track: int = next(
+                (index for index, end in enumerate(track_ends) if end <= command['start']), len(track_ends)
+            )
+            if track == len(track_ends):
+                track_ends.append(0.0)
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': track,
+                               'args': {'name': f"commands #{track}"}})
+            track_ends[track] = command['start'] + command['duration']
+            events.append({
+                'name': command['name'],
+                'cat': 'command',
+                'ph': 'X',
+                'pid': 1,
+                'tid': track,
+                'ts': round(command['start'] * 1e6),
+                'dur': round(command['duration'] * 1e6),
+                'args': {key: value for key, value in command.items() if key not in ('name', 'start', 'duration')}
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+# - Command daemon class
+class CommandDaemon:
+    """
+    Warm worker (opt-in with the --daemon option) running the project commands in the project virtual env (so without
+    the 'poetry run' bootstraps) with already loaded project properties.
+    It listens on a Unix socket and runs each request (command line, cwd, environment and the client stdin/stdout/stderr
+    file descriptors) in a forked process. It stops once idle for IDLE_TIMEOUT seconds and is restarted when one of the
+    WATCHED_FILES changed.
+    """
+    RUN: Final[str] = 'run'
+    STOP: Final[str] = 'stop'
+    SERVE: Final[str] = 'serve'
+    # Not in the build path: the clean command would remove the socket of a running worker
+    DAEMON_PATH: Final[str] = '.cache'
+    SOCKET_FILE_NAME: Final[str] = 'project-daemon.sock'
+    LOG_FILE_NAME: Final[str] = 'project-daemon.log'
+    LOCK_FILE_NAME: Final[str] = 'project-daemon.lock'
+    IDLE_TIMEOUT: Final[float] = 1800.0
+    START_TIMEOUT: Final[float] = 60.0
+    WATCHED_FILES: Final[tuple[str, ...]] = ('project.py', 'pyproject.toml', 'poetry.lock')
+    VENV_ENV_VARS: Final[tuple[str, ...]] = ('PATH', 'VIRTUAL_ENV')
+    _LENGTH: Final[Struct] = Struct('!I')
+
+    def __init__(self, properties: ProjectProperties):
+        self.__properties: Final[ProjectProperties] = properties
+        daemon_path: Final[Path] = properties.project_path.joinpath(CommandDaemon.DAEMON_PATH)
+        self.__socket_path: Final[Path] = daemon_path.joinpath(CommandDaemon.SOCKET_FILE_NAME)
+        self.__log_path: Final[Path] = daemon_path.joinpath(CommandDaemon.LOG_FILE_NAME)
+        self.__lock_path: Final[Path] = daemon_path.joinpath(CommandDaemon.LOCK_FILE_NAME)
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(socket, 'send_fds') and hasattr(os, 'fork')
+
+    def request(self, argv: list[str]) -> int:
+        """
+        Run commands in the worker (which is started if needed)
+        :param argv: the project.py arguments
+        :return: the commands exit code
+        """
+        for _ in range(2):  # A stale worker stops itself so it is restarted once
+            message: dict[str, Any] = {'argv': argv, 'cwd': os_getcwd(), 'env': dict(os_environ)}
+            response: dict[str, Any] = self._send(message, [0, 1, 2])
+            if not response.get('stale'):
+                return response['returncode']
+        raise RuntimeError(f"Cannot start an up-to-date project daemon (see {self.__log_path})")
+
+    def stop(self) -> None:
+        try:
+            self._send({'stop': True}, start=False)
+        except OSError:
+            pass
+
+    def serve(self, runner: "CommandsRunner") -> None:
+        """
+        Run the worker loop
+        :param runner: the commands runner used by the forked processes
+        """
+        self.__properties.venv_resolved = True
+        stamps: Final[list[tuple[int, int] | None]] = self._get_stamps()
+        venv_env: Final[dict[str, str]] = {
+            key: os_environ[key] for key in CommandDaemon.VENV_ENV_VARS if key in os_environ
+        }
+        server: Final[socket.socket] = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket_path.unlink(missing_ok=True)
+        server.bind(self.__socket_path.as_posix())
+        server.listen()
+        server.settimeout(CommandDaemon.IDLE_TIMEOUT)
+        signal(SIGCHLD, SIG_IGN)  # Forked processes are reaped automatically
+        try:
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except TimeoutError:
+                    return
+                with connection:
+                    fds: list[int] = []
+                    try:
+                        _, fds, _, _ = socket.recv_fds(connection, 1, 3)
+                        message: dict[str, Any] = self._recv_request(connection)
+                    except (OSError, ValueError) as e:  # ie: client gone or malformed request, the worker goes on
+                        print(f"Invalid project daemon request: {e}", file=sys_stderr, flush=True)
+                        for fd in fds:
+                            os_close(fd)
+                        continue
+                    stale: bool = self._get_stamps() != stamps
+                    if message.get('stop') or stale:
+                        self._send_message(connection, {'stale': stale})
+                        return
+                    if os.fork() == 0:
+                        server.close()
+                        self._run_forked(runner, connection, fds, {**message['env'], **venv_env}, message)
+                    for fd in fds:
+                        os_close(fd)
+        finally:
+            server.close()
+            self.__socket_path.unlink(missing_ok=True)
+
+    def _run_forked(
+            self, runner: "CommandsRunner", connection: socket.socket, fds: list[int], env: dict[str, str],
+            message: dict[str, Any]
+    ) -> None:
+        returncode: int = 1
+        try:
+            signal(SIGCHLD, SIG_DFL)
+            for target_fd, fd in enumerate(fds):
+                os_dup2(fd, target_fd)
+                os_close(fd)
+            if isinstance(sys_stdout, TextIOWrapper):
+                sys_stdout.reconfigure(line_buffering=True)
+            os_chdir(message['cwd'])
+            os_environ.clear()
+            os_environ.update(env)
+            sys_argv[1:] = message['argv']
+            try:
+                runner.run()
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+            except Exception:  # pylint: disable=broad-except
+                print_exc()
+            sys_stdout.flush()
+            sys_stderr.flush()
+            self._send_message(connection, {'returncode': returncode})
+        finally:
+            os._exit(returncode)  # pylint: disable=protected-access
+
+    def _send(self, message: dict[str, Any], fds: list[int] | None = None, start: bool = True) -> dict[str, Any]:
+        with self._connect(start) as connection:
+            socket.send_fds(connection, [b'\0'], fds or [])
+            self._send_message(connection, message)
+            return json_loads(self._recv_message(connection))
+
+    def _connect(self, start: bool) -> socket.socket:
+        connection: Final[socket.socket] = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(self.__socket_path.as_posix())
+            return connection
+        except OSError:
+            if not start:
+                connection.close()
+                raise
+        # pylint: disable-next=import-outside-toplevel
+        from fcntl import flock, LOCK_EX  # POSIX only (see is_supported)
+        self.__lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.__lock_path, 'ab') as lock_file:
+            # One worker start at a time: the clients waiting for this lock connect to the worker started meanwhile
+            flock(lock_file.fileno(), LOCK_EX)
+            try:
+                connection.connect(self.__socket_path.as_posix())
+                return connection
+            except OSError:
+                self._start()
+            deadline: Final[float] = perf_counter() + CommandDaemon.START_TIMEOUT
+            while True:
+                try:
+                    connection.connect(self.__socket_path.as_posix())
+                    return connection
+                except OSError:
+                    if perf_counter() > deadline:
+                        connection.close()
+                        raise
+                    sleep(0.05)
+
+    def _start(self) -> None:
+        with open(self.__log_path, 'ab') as log_file:
+            Popen(  # pylint: disable=consider-using-with
+                PoetryCommand().build_command_line(
+                    self.__properties, ['run', 'python', Path(__file__).absolute().as_posix(), '--daemon-serve']
+                ),
+                stdin=DEVNULL,
+                stdout=log_file,
+                stderr=STDOUT,
+                cwd=self.__properties.project_path,
+                start_new_session=True
+            )
+
+    def _get_stamps(self) -> list[tuple[int, int] | None]:
+        stamps: Final[list[tuple[int, int] | None]] = []
+        for file_name in CommandDaemon.WATCHED_FILES:
+            file_path: Path = self.__properties.project_path.joinpath(file_name)
+            stamps.append((file_path.stat().st_mtime_ns, file_path.stat().st_size) if file_path.is_file() else None)
+        return stamps
+
+    @staticmethod
+    def _recv_request(connection: socket.socket) -> dict[str, Any]:
+        message: Final[Any] = json_loads(CommandDaemon._recv_message(connection))
+        if not isinstance(message, dict):
+            raise ValueError(f"a request must be a JSON object (got: {type(message).__name__})")
+        if not message.get('stop') and not (
+                isinstance(message.get('argv'), list) and isinstance(message.get('cwd'), str)
+                and isinstance(message.get('env'), dict)
+        ):
+            raise ValueError("a run request must have 'argv' (list), 'cwd' (string) and 'env' (object) entries")
+        return message
+
+    @staticmethod
+    def _send_message(connection: socket.socket, message: dict[str, Any]) -> None:
+        payload: Final[bytes] = json_dumps(message).encode()
+        connection.sendall(CommandDaemon._LENGTH.pack(len(payload)) + payload)
+
+    @staticmethod
+    def _recv_message(connection: socket.socket) -> bytes:
+        length: Final[int] = CommandDaemon._LENGTH.unpack(CommandDaemon._recv_exactly(connection, 4))[0]
+        return CommandDaemon._recv_exactly(connection, length)
+
+    @staticmethod
+    def _recv_exactly(connection: socket.socket, size: int) -> bytes:
+        data: Final[bytearray] = bytearray()
+        while len(data) < size:
+            chunk: bytes = connection.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Project daemon connection closed")
+            data.extend(chunk)
+        return bytes(data)
+
+
+# - Project command executor classes
+class RunnerOptions(NamedTuple):
+    jobs: int = 1
+    fail_at_end: bool = False
+    force: bool = False
+    daemon: str | None = None
+
+
+class CommandCall(NamedTuple):
+    name: str
+    command: ProjectCommand
+    args: list[str]
+
+
+class CommandUsage(NamedTuple):
+    """Resource usage of a command process (its waited sub-processes included)"""
+    user_time: float
+    system_time: float
+    max_rss_kb: int
+
+
+class CommandResult(NamedTuple):
+    call: CommandCall
+    returncode: int
+    duration: float
+    aborted: bool = False
+    saved_duration: float | None = None
+    start: float = 0.0
+    usage: CommandUsage | None = None
+
+
 class CommandsRunner:
     def __init__(
             self,
@@ -300,6 +1394,12 @@ class CommandsRunner:
         self.__stdout: Final[TextIOWrapper] = stdout
         self.__stderr: Final[TextIOWrapper] = stderr
         self.__command_dict: Final[dict[str, ProjectCommand]] = {}
+        self.__output_lock: Final[Lock] = Lock()
+        self.__running_processes: Final[set[Popen]] = set()
+        self.__build_cache: Final[BuildCache] = BuildCache(properties)
+        self.__timing_report: Final[TimingReport] = TimingReport(properties)
+        self.__options: RunnerOptions = RunnerOptions()
+        self.__aborted: bool = False
 
     def add_command(self, cmd_name: str, cmd: ProjectCommand) -> Self:
         self.__command_dict[cmd_name] = cmd
@@ -312,44 +1412,344 @@ class CommandsRunner:
                 print(self._get_help_str(), file=self.__stdout)
                 return
 
-            current_cmd: ProjectCommand | None = self.__command_dict.get(argv)
-            if not self.__command_dict.get(argv):
-                print(f"Command unknown: '{argv}'", file=self.__stderr)
+            try:
+                options, command_argv = self._parse_options(sys_argv[1:])
+            except ValueError as e:
+                print(e, file=self.__stderr)
+                return
+            if options.daemon == CommandDaemon.SERVE:
+                CommandDaemon(self.__project_properties).serve(self)
+                return
+            if options.daemon == CommandDaemon.STOP:
+                CommandDaemon(self.__project_properties).stop()
+                return
+            if not command_argv:
+                print("Project command missing use --help or -h for help", file=self.__stderr)
+                return
+            if not self.__command_dict.get(command_argv[0]):
+                print(f"Command unknown: '{command_argv[0]}'", file=self.__stderr)
                 return
 
-            current_args: list[str] = []
-            for argv in sys_argv[2:]:
-                cmd: ProjectCommand | None = self.__command_dict.get(argv)
-                if cmd:
-                    self._run_process(current_cmd, current_args)
-                    current_args.clear()
-                    current_cmd = cmd
-                else:
-                    current_args.append(argv)
-            self._run_process(current_cmd, current_args)
+            with self._project_pythonpath():
+                if options.daemon == CommandDaemon.RUN and CommandDaemon.is_supported():
+                    runner_argv: Final[list[str]] = sys_argv[1:len(sys_argv) - len(command_argv)]
+                    sys_exit(CommandDaemon(self.__project_properties).request(
+                        [option for option in runner_argv if option != '--daemon'] + command_argv
+                    ))
+                self._run_calls(self._parse_calls(command_argv), options)
         else:
             print("Project command missing use --help or -h for help", file=self.__stderr)
 
-    def _run_process(self, command: ProjectCommand, args: list[str]) -> None:
+    @contextmanager
+    def _project_pythonpath(self) -> Iterator[None]:
+        # Run commands with project structure in the PYTHONPATH (only set when commands are run: the pyproject file is
+        # not read for the help)
+        pythonpath_env_var: Final[str] = 'PYTHONPATH'
+        pythonpath: Final[str | None] = os_environ.get(pythonpath_env_var)
+        project_pythonpath: Final[str] = os_pathsep.join(self.__project_properties.src_rsrc_paths)
+        if pythonpath and (pythonpath + os_pathsep).startswith(project_pythonpath + os_pathsep):
+            yield  # Already set by the caller (ie: daemon client)
+            return
+        try:
+            os_environ[pythonpath_env_var] = os_pathsep.join(filter(None, [project_pythonpath, pythonpath]))
+            yield
+        finally:
+            if pythonpath:
+                os_environ[pythonpath_env_var] = pythonpath
+            else:
+                os_environ.pop(pythonpath_env_var, None)
+
+    def _parse_options(self, argv: list[str]) -> tuple[RunnerOptions, list[str]]:
+        jobs: int = 1
+        fail_at_end: bool = False
+        force: bool = False
+        daemon: str | None = None
+        index: int = 0
+        while index < len(argv) and argv[index].startswith('-'):
+            option: str = argv[index]
+            if option == '--parallel':
+                jobs = max(cpu_count() or 1, 2)
+            elif option in ('-j', '--jobs'):
+                index += 1
+                jobs = self._parse_jobs(option, argv[index] if index < len(argv) else '')
+            elif option.startswith('-j'):
+                jobs = self._parse_jobs(option, option[2:])
+            elif option == '--fail-at-end':
+                fail_at_end = True
+            elif option == '--force':
+                force = True
+            elif option in ('--daemon', '--daemon-stop', '--daemon-serve'):
+                daemon = {
+                    '--daemon': CommandDaemon.RUN,
+                    '--daemon-stop': CommandDaemon.STOP,
+                    '--daemon-serve': CommandDaemon.SERVE
+                }[option]
+            else:
+                raise ValueError(f"Option unknown: '{option}'")
+            index += 1
+        return RunnerOptions(jobs, fail_at_end, force, daemon), argv[index:]
+
+    @staticmethod
+    def _parse_jobs(option: str, value: str) -> int:
+        if not value.isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid jobs number for '{option}': '{value}'")
+        return int(value)
+
+    def _parse_calls(self, argv: list[str]) -> list[CommandCall]:
+        calls: Final[list[CommandCall]] = []
+        for arg in argv:
+            cmd: ProjectCommand | None = self.__command_dict.get(arg)
+            if cmd:
+                calls.append(CommandCall(arg, cmd, []))
+            else:
+                calls[-1].args.append(arg)
+        return calls
+
+    def _run_calls(self, calls: list[CommandCall], options: RunnerOptions) -> None:
+        start: Final[float] = perf_counter()
+        start_time: Final[float] = time()
+        self.__options = options
+        results: Final[list[CommandResult]] = []
+        for batch in self._get_batches(calls, options):
+            results.extend(self._run_batch(batch, options) if len(batch) > 1 else [self._run_process(batch[0])])
+            if not options.fail_at_end and any(result.returncode for result in results):
+                break
+
+        if not (results and isinstance(results[-1].call.command, CleanCommand)):
+            # A run ending with a clean must leave a clean tree (the report would recreate the build directory)
+            self.__timing_report.write(results, start, start_time)
+        if options.jobs > 1:
+            self._print_summary(results)
+        self._print_skipped_summary(results)
+        failure: Final[CommandResult | None] = next((result for result in results if result.returncode), None)
+        if failure:
+            sys_exit(failure.returncode if failure.returncode > 0 else 1)
+
+    @staticmethod
+    def _get_batches(calls: list[CommandCall], options: RunnerOptions) -> list[list[CommandCall]]:
+        batches: Final[list[list[CommandCall]]] = []
+        for call in calls:
+            if options.jobs > 1 and call.command.is_parallelizable() \
+                    and batches and batches[-1][-1].command.is_parallelizable():
+                batches[-1].append(call)
+            else:
+                batches.append([call])
+        return batches
+
+    def _run_process(self, call: CommandCall) -> CommandResult:
+        start: Final[float] = perf_counter()
+        fingerprint: Final[str | None] = self.__build_cache.fingerprint(call)
+        skipped: Final[CommandResult | None] = self._skip_if_up_to_date(call, fingerprint)
+        if skipped:
+            return skipped._replace(start=start)
+        returncode: int = 0
+        usage: CommandUsage | None = None
         try:
-            subprocess_run(
-                command.build_command_line(self.__project_properties, args),
-                stdin=self.__stdin,
-                stdout=self.__stdout,
-                stderr=self.__stderr,
-                check=True,
-                cwd=command.get_command_cwd(self.__project_properties)
+            call.command.prepare(self.__project_properties)
+            in_process_returncode: Final[int | None] = call.command.run_in_process(
+                self.__project_properties, call.args, self.__stdout
             )
+            if in_process_returncode is None:
+                command_line: Final[list[str]] = call.command.build_command_line(self.__project_properties, call.args)
+                cwd: Final[str] = call.command.get_command_cwd(self.__project_properties)
+                env: Final[dict[str, str] | None] = call.command.get_command_env(self.__project_properties)
+                if fingerprint is None:
+                    with Popen(command_line, stdin=self.__stdin, stdout=self.__stdout, stderr=self.__stderr, cwd=cwd,
+                               env=env) as process:
+                        usage = self._wait_process(process)
+                    returncode = process.returncode
+                else:
+                    returncode, usage = self._run_teed_process(call, fingerprint, start, command_line, cwd, env)
+            else:
+                returncode = in_process_returncode
+            if returncode:
+                raise CalledProcessError(returncode, call.name)
         except CalledProcessError as e:
-            print(f"Command error: [cmd: '{command.__class__.__name__}' | args: '{args}']", file=self.__stderr)
-            sys_exit(e.returncode)
+            print(self._get_error_str(call), file=self.__stderr)
+            returncode = e.returncode
         finally:
-            command.finalize(self.__project_properties)
+            call.command.finalize(self.__project_properties)
+        return CommandResult(call, returncode, perf_counter() - start, start=start, usage=usage)
+
+    # pylint: disable=too-many-arguments
+    def _run_teed_process(
+            self, call: CommandCall, fingerprint: str, start: float, command_line: list[str], cwd: str,
+            env: dict[str, str] | None
+    ) -> tuple[int, CommandUsage | None]:
+        # Streamed like a regular command but also recorded in order to be replayed once the command is up-to-date
+        output: Final[bytearray] = bytearray()
+        with Popen(command_line, stdin=self.__stdin, stdout=PIPE, stderr=STDOUT, cwd=cwd, env=env) as process:
+            for line in process.stdout or []:
+                output.extend(line)
+                self.__stdout.write(line.decode(errors='replace'))
+                self.__stdout.flush()
+            usage: Final[CommandUsage | None] = self._wait_process(process)
+        if not process.returncode:
+            self.__build_cache.store(call, fingerprint, perf_counter() - start, bytes(output))
+        return process.returncode, usage
+
+    @staticmethod
+    def _wait_process(process: Popen) -> CommandUsage | None:
+        """
+        Wait for the process end (like Popen.wait) and get its resource usage (POSIX only, see os.wait4)
+        :param process: the process to wait
+        :return: the process resource usage or None if not available
+        """
+        if hasattr(os, 'wait4') and process.returncode is None:
+            try:
+                _, status, rusage = os.wait4(process.pid, 0)
+            except ChildProcessError:  # Already reaped (ie: polled while aborting)
+                process.wait()
+                return None
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return CommandUsage(
+                rusage.ru_utime,
+                rusage.ru_stime,
+                # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+                rusage.ru_maxrss // 1024 if sys_platform == 'darwin' else rusage.ru_maxrss
+            )
+        process.wait()
+        return None
+
+    def _skip_if_up_to_date(self, call: CommandCall, fingerprint: str | None) -> CommandResult | None:
+        cached_run: Final[CachedRun | None] = None if fingerprint is None or self.__options.force \
+            else self.__build_cache.lookup(call, fingerprint)
+        if cached_run is None:
+            return None
+        with self.__output_lock:
+            print(f"==> [{call.name}] UP-TO-DATE (inputs unchanged since the last successful run, "
+                  f"use --force to rerun it), replaying its output:", file=self.__stdout)
+            self.__stdout.write(cached_run.output.decode(errors='replace'))
+            self.__stdout.flush()
+        return CommandResult(call, 0, 0.0, saved_duration=cached_run.duration)
+
+    def _run_batch(self, batch: list[CommandCall], options: RunnerOptions) -> list[CommandResult]:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor, as_completed  # Imported in parallel mode only (startup time)
+        self.__aborted = False
+        results: Final[list[CommandResult]] = []
+        with ThreadPoolExecutor(max_workers=options.jobs, thread_name_prefix='project') as executor:
+            futures: Final[list] = [executor.submit(self._run_captured_process, call) for call in batch]
+            for future in as_completed(futures):
+                result: CommandResult = future.result()
+                results.append(result)
+                if result.returncode and not result.aborted and not options.fail_at_end:
+                    self._abort_running_processes()
+        return sorted(results, key=lambda batch_result: batch.index(batch_result.call))
+
+    def _run_captured_process(self, call: CommandCall) -> CommandResult:
+        start: Final[float] = perf_counter()
+        if self.__aborted:
+            return CommandResult(call, -1, 0.0, aborted=True, start=start)
+        fingerprint: Final[str | None] = self.__build_cache.fingerprint(call)
+        skipped: Final[CommandResult | None] = self._skip_if_up_to_date(call, fingerprint)
+        if skipped:
+            return skipped._replace(start=start)
+        output: bytes = b''
+        returncode: int = 0
+        usage: CommandUsage | None = None
+        try:
+            call.command.prepare(self.__project_properties)
+            in_process_output: Final[StringIO] = StringIO()
+            in_process_returncode: Final[int | None] = call.command.run_in_process(
+                self.__project_properties, call.args, in_process_output
+            )
+            if in_process_returncode is not None:
+                output, returncode = in_process_output.getvalue().encode(), in_process_returncode
+            else:
+                output, returncode, usage = self._run_concurrent_process(call)
+        except (CalledProcessError, OSError) as e:
+            output += f"{e}\n".encode()
+            returncode = getattr(e, 'returncode', 1)
+        finally:
+            call.command.finalize(self.__project_properties)
+            with self.__output_lock:
+                self.__running_processes.difference_update(
+                    [process for process in self.__running_processes if process.returncode is not None]
+                )
+        result: Final[CommandResult] = CommandResult(
+            call, returncode, perf_counter() - start, self.__aborted, start=start, usage=usage
+        )
+        if fingerprint is not None and not returncode:
+            self.__build_cache.store(call, fingerprint, result.duration, output)
+        self._print_captured_output(result, output)
+        return result
+
+    def _run_concurrent_process(self, call: CommandCall) -> tuple[bytes, int, CommandUsage | None]:
+        env: Final[dict[str, str]] = dict(call.command.get_command_env(self.__project_properties) or os_environ)
+        env.update(call.command.get_concurrent_env(self.__project_properties, call.name))
+        with Popen(
+                call.command.build_command_line(self.__project_properties, call.args),
+                stdin=DEVNULL,
+                stdout=PIPE,
+                stderr=STDOUT,
+                cwd=call.command.get_command_cwd(self.__project_properties),
+                env=env
+        ) as process:
+            with self.__output_lock:
+                self.__running_processes.add(process)
+                if self.__aborted:
+                    process.terminate()
+            output: Final[bytes] = process.stdout.read() if process.stdout else b''
+            usage: Final[CommandUsage | None] = self._wait_process(process)
+        return output, process.returncode, usage
+
+    def _abort_running_processes(self) -> None:
+        with self.__output_lock:
+            self.__aborted = True
+            for process in self.__running_processes:
+                if process.poll() is None:
+                    process.terminate()
+
+    def _print_captured_output(self, result: CommandResult, output: bytes) -> None:
+        with self.__output_lock:
+            print(f"==> [{result.call.name}] {self.get_status_str(result)} in {result.duration:.2f}s",
+                  file=self.__stdout)
+            self.__stdout.write(output.decode(errors='replace'))
+            if result.returncode and not result.aborted:
+                print(self._get_error_str(result.call), file=self.__stdout)
+            self.__stdout.flush()
+
+    def _print_summary(self, results: list[CommandResult]) -> None:
+        print("\nCOMMANDS SUMMARY (wall-clock time, CPU time, peak RSS):", file=self.__stdout)
+        for result in results:
+            usage_str: str = f"{result.usage.user_time + result.usage.system_time:>8.2f}s" \
+                             f"{result.usage.max_rss_kb / 1024:>9.1f}MB" if result.usage else ''
+            print(f"  {result.call.name:<12}{self.get_status_str(result):<12}{result.duration:>8.2f}s{usage_str}",
+                  file=self.__stdout)
+        print(f"  (details in {self.__project_properties.build_path}/{TimingReport.REPORT_PATH})", file=self.__stdout)
+
+    def _print_skipped_summary(self, results: list[CommandResult]) -> None:
+        skipped: Final[list[CommandResult]] = [result for result in results if result.saved_duration is not None]
+        if skipped:
+            saved_duration: Final[float] = sum(result.saved_duration or 0.0 for result in skipped)
+            print(f"\nUP-TO-DATE COMMANDS (skipped, use --force to rerun them): "
+                  f"{', '.join(result.call.name for result in skipped)} (~{saved_duration:.2f}s saved)",
+                  file=self.__stdout)
+
+    @staticmethod
+    def get_status_str(result: CommandResult) -> str:
+        if result.saved_duration is not None:
+            return 'UP-TO-DATE'
+        return 'ABORTED' if result.aborted else f"FAILED({result.returncode})" if result.returncode else 'OK'
+
+    @staticmethod
+    def _get_error_str(call: CommandCall) -> str:
+        return f"Command error: [cmd: '{call.command.__class__.__name__}' | args: '{call.args}']"
 
     def _get_help_str(self):
         return "PROJECT COMMANDS WRAPPER:\n\n" \
-               "Usage: python project.py <COMMAND_1> <arg1_1 ...> ... <COMMAND_N> <argN_1 ...>\n" \
+               "Usage: python project.py [OPTIONS] <COMMAND_1> <arg1_1 ...> ... <COMMAND_N> <argN_1 ...>\n" \
                "\tNote: In order to get the wrapped command help, you can try python project.py <command> --help\n\n" \
+               "Available options are:\n" \
+               "  --parallel      \tRun consecutive independent commands (lint, test, typing) concurrently\n" \
+               "  -j, --jobs <N>  \tLike --parallel but with at most N concurrent commands\n" \
+               "  --fail-at-end   \tDon't stop at the first failing command, fail once all commands are executed\n" \
+               "  --force         \tRun lint, test, typing and wheel even if their inputs didn't change since their " \
+               "last success\n" \
+               "  --daemon        \tRun the commands in a warm worker (started if needed) instead of bootstrapping " \
+               "poetry for each command\n" \
+               "  --daemon-stop   \tStop the warm worker\n\n" \
                "Available commands are:\n" \
                + ''.join([f"  {cmd}   \t{cls.__doc__}\n" for cmd, cls in self.__command_dict.items()])
 
@@ -367,26 +1767,13 @@ def run(properties: ProjectProperties) -> None:
         .add_command('test', TestCommand()) \
         .add_command('typing', TypingCheckCommand()) \
         .add_command('mut', MutationCommand()) \
+        .add_command('bench', BenchCommand()) \
         .add_command('wheel', WheelCommand()) \
         .add_command('sdist', SdistCommand()) \
-        .add_command('upload', UploadCommand())
-
-    # Prepare PYTHONPATH
-    project_paths: Final[list[str]] = properties.src_rsrc_paths
-    pythonpath_env_var: Final[str] = 'PYTHONPATH'
-    pythonpath: Final[str] = os_environ.get(pythonpath_env_var)
-    if pythonpath:
-        project_paths.append(pythonpath)
-
-    # Run commands with project structure in the PYTHONPATH
-    try:
-        os_environ[pythonpath_env_var] = os_pathsep.join(project_paths)
-        command_runner.run()
-    finally:
-        if pythonpath:
-            os_environ[pythonpath_env_var] = pythonpath
-        else:
-            os_environ.pop(pythonpath_env_var, None)
+        .add_command('upload', UploadCommand()) \
+        .add_command('image', ImageCommand())
+
+    command_runner.run()
 
 
 # SHARED VARIABLES
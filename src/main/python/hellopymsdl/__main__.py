@@ -1,7 +1,22 @@
+import sys
+from typing import Final
+
 from hellopymsdl.service.MessageService import MessageService
 
+SERVE_OPTION: Final[str] = "--serve"
+
 
-def hello() -> None:
+def hello(args: list[str] | None = None) -> None:
+    """
+    Print the hello message, or serve messages with the SERVE_OPTION option (see hellopymsdl.service.MessageServer)
+    :param args: the command line arguments (default: sys.argv)
+    """
+    arguments: Final[list[str]] = sys.argv[1:] if args is None else args
+    if arguments[:1] == [SERVE_OPTION]:
+        # pylint: disable-next=import-outside-toplevel
+        from hellopymsdl.service.MessageServer import main  # Not imported by the hello cold start (asyncio is slow)
+        main(arguments[1:])
+        return
     print("hello python with Maven Standard Directory Layout")
     message_service: MessageService = MessageService()  # pragma: no mutate
     print(message_service.get_message("message.txt"))
@@ -0,0 +1,48 @@
+"""
+Embedded resources: the content of some resource files copied at build time into a generated EMBEDDED_MODULE_NAME
+module of their resource package, so that reading them at runtime is a plain module import (no importlib.resources
+machinery nor resource lookup, see MessageService).
+"""
+from importlib import import_module
+from types import ModuleType
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:  # Not imported at runtime: only needed at build time (see hellopymsdl.__main__)
+    from pathlib import Path
+
+EMBEDDED_MODULE_NAME: Final[str] = "__embedded__"
+EMBEDDED_FILE_NAME: Final[str] = f"{EMBEDDED_MODULE_NAME}.py"
+RESOURCES_ATTRIBUTE: Final[str] = "RESOURCES"
+
+
+def write_embedded_resources(package_path: "Path", names: list[str]) -> "Path | None":
+    """
+    Write the EMBEDDED_FILE_NAME module of a resource package directory
+    :param package_path: the resource package directory
+    :param names: the resource file names (posix paths relative to the package) to embed, missing ones are ignored
+    :return: the module path or None if there is nothing to embed
+    """
+    resources: Final[dict[str, bytes]] = {
+        name: package_path.joinpath(name).read_bytes() for name in names if package_path.joinpath(name).is_file()
+    }
+    if not resources:
+        return None
+    module_path: Final[Path] = package_path.joinpath(EMBEDDED_FILE_NAME)
+    module_path.write_text(
+        f'"""Generated by {__name__} at build time: do not edit"""\n{RESOURCES_ATTRIBUTE} = {resources!r}\n',
+        encoding="UTF-8"
+    )
+    return module_path
+
+
+def load_embedded_resources(resource_package: str | ModuleType) -> dict[str, bytes]:
+    """
+    Load the embedded resources of a resource package
+    :param resource_package: the resource package
+    :return: the {resource file name: raw content} dict (empty if the package has no EMBEDDED_MODULE_NAME module)
+    """
+    package_name: Final[str] = resource_package if isinstance(resource_package, str) else resource_package.__name__
+    try:
+        return getattr(import_module(f"{package_name}.{EMBEDDED_MODULE_NAME}"), RESOURCES_ATTRIBUTE)
+    except (ModuleNotFoundError, TypeError, ValueError):
+        return {}  # Nothing embedded (or invalid package, which is reported by the resource lookup)
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from os import stat
+from sys import getsizeof
+from threading import Lock
+from time import monotonic
+from typing import Final, NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # Not imported at runtime: importlib.resources is slow to import (see hellopymsdl.__main__)
+    from importlib.resources.abc import Traversable
+
+
+class FileStamp(NamedTuple):
+    """Identity of a resource file on a real filesystem (used to detect in place updates)"""
+    path: str
+    mtime_ns: int
+    size: int
+
+    @staticmethod
+    def of(resource: "Traversable") -> "FileStamp | None":
+        """
+        Stat the given resource
+        :param resource: the resource to stat
+        :return: the resource stamp or None if the resource is not on a real filesystem (ie: zip/wheel packed resource)
+        """
+        from pathlib import Path  # pylint: disable=import-outside-toplevel
+        if not isinstance(resource, Path):
+            return None
+        path: Final[str] = str(resource)
+        stat_result = stat(path)
+        return FileStamp(path, stat_result.st_mtime_ns, stat_result.st_size)
+
+    def is_stale(self) -> bool:
+        try:
+            stat_result = stat(self.path)
+        except OSError:
+            return True
+        return stat_result.st_mtime_ns != self.mtime_ns or stat_result.st_size != self.size
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+class _CacheEntry(NamedTuple):
+    value: str
+    size_bytes: int
+    stamp: FileStamp | None
+    expires_at: float | None
+
+
+# pylint: disable=too-many-instance-attributes
+class MessageCache:
+    """
+    Bounded LRU cache for resource messages.
+
+    Entries are evicted in least recently used order once the total size of the cached messages exceeds max_bytes.
+    An entry is invalidated when its ttl (in seconds) is exceeded or, if check_files is enabled, when the mtime/size of
+    its resource file changed. Resources which are not on a real filesystem (zip/wheel packed) are only invalidated by
+    the ttl.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int = 1 << 20,
+            ttl: float | None = None,
+            check_files: bool = True,
+            clock: Callable[[], float] = monotonic
+    ):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive (got: {max_bytes})")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive (got: {ttl})")
+        self.__max_bytes: Final[int] = max_bytes
+        self.__ttl: Final[float | None] = ttl
+        self.__check_files: Final[bool] = check_files
+        self.__clock: Final[Callable[[], float]] = clock
+        self.__entries: Final[OrderedDict[Hashable, _CacheEntry]] = OrderedDict()
+        self.__lock: Final[Lock] = Lock()
+        self.__size_bytes: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__invalidations: int = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self.__max_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            return CacheStats(
+                self.__hits,
+                self.__misses,
+                self.__evictions,
+                self.__invalidations,
+                len(self.__entries),
+                self.__size_bytes
+            )
+
+    def lookup(self, key: Hashable) -> str | None:
+        """
+        Get a cached message
+        :param key: the message key
+        :return: the cached message or None if it is missing, expired or stale
+        """
+        with self.__lock:
+            entry: _CacheEntry | None = self.__entries.get(key)
+            if entry is not None and self._is_valid(entry):
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry.value
+            if entry is not None:
+                self._remove(key)
+                self.__invalidations += 1
+            self.__misses += 1
+            return None
+
+    def store(self, key: Hashable, value: str, stamp: FileStamp | None = None) -> None:
+        """
+        Cache a message
+        :param key: the message key
+        :param value: the message
+        :param stamp: the resource file stamp taken BEFORE reading the message (None if it cannot be checked)
+        """
+        size_bytes: Final[int] = getsizeof(value)
+        expires_at: Final[float | None] = None if self.__ttl is None else self.__clock() + self.__ttl
+        with self.__lock:
+            if key in self.__entries:
+                self._remove(key)
+            if size_bytes > self.__max_bytes:
+                return
+            self.__entries[key] = _CacheEntry(value, size_bytes, stamp, expires_at)
+            self.__size_bytes += size_bytes
+            while self.__size_bytes > self.__max_bytes:
+                self._remove(next(iter(self.__entries)))
+                self.__evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Remove a cached message
+        :param key: the message key to remove (all messages are removed if None)
+        """
+        with self.__lock:
+            keys: Final[list[Hashable]] = \
+                list(self.__entries) if key is None else [key] if key in self.__entries else []
+            for current_key in keys:
+                self._remove(current_key)
+            self.__invalidations += len(keys)
+
+    def _is_valid(self, entry: _CacheEntry) -> bool:
+        if entry.expires_at is not None and self.__clock() >= entry.expires_at:
+            return False
+        return not (self.__check_files and entry.stamp is not None and entry.stamp.is_stale())
+
+    def _remove(self, key: Hashable) -> None:
+        self.__size_bytes -= self.__entries.pop(key).size_bytes
@@ -0,0 +1,114 @@
+from locale import locale_alias
+from re import compile as re_compile, Match, Pattern
+from typing import Any, Final
+
+from hellopymsdl.service.MessageService import MessageService
+
+# ie: "message.fr_CA.txt" is the "fr_CA" variant of "message.txt" (but "data.tar.gz" is not a "tar" variant: the locale
+# language must be a known one, see _LANGUAGES)
+_VARIANT_PATTERN: Final[Pattern[str]] = re_compile(
+    r"^(?P<stem>.+)\.(?P<locale>(?P<language>[a-z]{2,3})(?:_[A-Za-z0-9]{2,8})*)(?P<suffix>\.[^./]+)$"
+)
+# The languages of the locales known by the locale module (ie: "fr" from "fr_ca" or "fr_FR.ISO8859-1")
+_LANGUAGES: Final[frozenset[str]] = frozenset(
+    language for language in (
+        alias.split('.', 1)[0].split('@', 1)[0].split('_', 1)[0] for alias in locale_alias
+    ) if 2 <= len(language) <= 3 and language.isalpha()
+)
+
+
+def normalize_locale(locale: str) -> str:
+    """
+    Normalize a locale identifier (ie: "fr-ca.UTF-8@euro" -> "fr_CA")
+    :param locale: the locale identifier
+    :return: the normalized locale: lower case language, upper case region and title case script
+    """
+    parts: Final[list[str]] = locale.split('.', 1)[0].split('@', 1)[0].replace('-', '_').split('_')
+    return '_'.join([
+        parts[0].lower(),
+        *(part.upper() if len(part) == 2 else part.title() if len(part) == 4 else part for part in parts[1:])
+    ])
+
+
+def fallback_chain(locale: str | None) -> list[str | None]:
+    """
+    Get the locale fallback chain (ie: "fr_CA" -> ["fr_CA", "fr", None] where None is the default message)
+    :param locale: the (normalized) locale
+    :return: the locales to try in order
+    """
+    if not locale:
+        return [None]
+    parts: Final[list[str]] = locale.split('_')
+    return ['_'.join(parts[:size]) for size in range(len(parts), 0, -1)] + [None]
+
+
+class MessageCatalog:
+    """
+    Locale aware messages: "<name>.<locale>.<ext>" resources are the <locale> variants of the "<name>.<ext>" message.
+
+    The resource package is listed once (see refresh) in order to build a {message: {locale: file name}} table, then
+    each (message, locale) resolution through the fallback chain (ie: fr_CA -> fr -> default) is memoized, misses
+    included: no filesystem probing after the startup.
+    """
+
+    def __init__(self, message_service: MessageService | None = None, default_locale: str | None = None):
+        self.__message_service: Final[MessageService] = message_service or MessageService()
+        self.__default_locale: Final[str | None] = normalize_locale(default_locale) if default_locale else None
+        self.__variants: dict[str, dict[str | None, str]] = {}
+        self.__resolved: dict[tuple[str, str | None], str | None] = {}
+        self.refresh()
+
+    @property
+    def message_service(self) -> MessageService:
+        return self.__message_service
+
+    def refresh(self) -> None:
+        """Rebuild the lookup table from the resource package content (ie: after a resource update)"""
+        variants: Final[dict[str, dict[str | None, str]]] = {}
+        for message_file_name in self.__message_service.list_messages():
+            variant_match: Match[str] | None = _VARIANT_PATTERN.match(message_file_name)
+            if variant_match is None or variant_match.group('language') not in _LANGUAGES:
+                variants.setdefault(message_file_name, {})[None] = message_file_name
+            else:
+                variants.setdefault(
+                    variant_match.group('stem') + variant_match.group('suffix'), {}
+                )[normalize_locale(variant_match.group('locale'))] = message_file_name
+        self.__variants = variants
+        self.__resolved = {}
+
+    def locales(self, message_file_name: str) -> list[str]:
+        """Get the available locales of a message (the default message excluded)"""
+        return sorted(locale for locale in self.__variants.get(message_file_name, {}) if locale is not None)
+
+    def resolve(self, message_file_name: str, locale: str | None = None) -> str:
+        """
+        Resolve the file name of a message for the given locale
+        :param message_file_name: the (default) message file name
+        :param locale: the wanted locale (the catalog default locale if None)
+        :return: the file name of the first existing variant in the locale fallback chain
+        :raise FileNotFoundError: when no variant exists
+        """
+        if not isinstance(message_file_name, str):
+            raise TypeError(f"message_file_name must be a str (got: {type(message_file_name).__name__})")
+        key: Final[tuple[str, str | None]] = (message_file_name, locale)
+        try:
+            resolved: str | None = self.__resolved[key]
+        except KeyError:
+            resolved = self.__resolved[key] = self._resolve(message_file_name, locale)
+        if resolved is None:
+            raise FileNotFoundError(f"No '{message_file_name}' message for locale '{locale or self.__default_locale}'")
+        return resolved
+
+    def get_message(self, message_file_name: str, locale: str | None = None) -> str:
+        return self.__message_service.get_message(self.resolve(message_file_name, locale))
+
+    def render_message(self, message_file_name: str, /, locale: str | None = None, **context: Any) -> str:
+        return self.__message_service.render_message(self.resolve(message_file_name, locale), **context)
+
+    def _resolve(self, message_file_name: str, locale: str | None) -> str | None:
+        variants: Final[dict[str | None, str]] = self.__variants.get(message_file_name, {})
+        for candidate in fallback_chain(normalize_locale(locale) if locale else self.__default_locale):
+            file_name: str | None = variants.get(candidate)
+            if file_name is not None:
+                return file_name
+        return None
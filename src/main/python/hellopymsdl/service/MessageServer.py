@@ -0,0 +1,207 @@
+"""
+Long-running message server (hello --serve): one warm MessageService answers a stream of message requests instead of
+one process per message.
+
+Line protocol (UTF-8, one request/response per line):
+- request: a message file name (ie: "message.txt") or a JSON object {"name": "message.txt", "id": <any>}
+- response: a JSON object {"name": ..., "message": ...} or {"name": ..., "error": ...} (with the request "id" if any)
+
+Requests are pipelined: up to max_pending messages are concurrently loaded (see MessageService.aget_message) while the
+responses are written in the request order. When max_pending responses are waiting (ie: slow client), no more request
+is read until the client reads its responses (backpressure).
+"""
+import sys
+from argparse import ArgumentParser
+from asyncio import (
+    AbstractEventLoop, CancelledError, Event, Future, Queue, ensure_future, get_running_loop, run as asyncio_run,
+    start_unix_server, StreamReader, StreamWriter
+)
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import ExitStack
+from json import dumps, loads
+from os import unlink
+from typing import Any, BinaryIO, Final, Protocol
+
+from hellopymsdl.service.MessageCache import MessageCache
+from hellopymsdl.service.MessageService import MessageService
+
+DEFAULT_MAX_PENDING: Final[int] = 256
+READ_SIZE: Final[int] = 64 * 1024
+
+
+class ResponseWriter(Protocol):
+    """The response stream interface (ie: asyncio.StreamWriter)"""
+
+    def write(self, data: bytes) -> None: ...
+
+    async def drain(self) -> None: ...
+
+
+class MessageServer:
+    def __init__(self, message_service: MessageService, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        :param message_service: the (long-lived) message service
+        :param max_pending: the maximum number of requests being processed or waiting for their response to be written
+        """
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive: {max_pending}")
+        self.__message_service: Final[MessageService] = message_service
+        self.__max_pending: Final[int] = max_pending  # pragma: no mutate
+
+    @property
+    def message_service(self) -> MessageService:
+        return self.__message_service
+
+    async def serve(self, requests: AsyncIterable[bytes], writer: ResponseWriter) -> None:
+        """
+        Answer a request stream until its end
+        :param requests: the request lines (ie: asyncio.StreamReader)
+        :param writer: the response stream
+        """
+        pending: Final[Queue[Future[bytes] | None]] = Queue(self.__max_pending)
+        closed: Final[Event] = Event()
+        responder: Final[Future[None]] = ensure_future(self._respond(pending, writer, closed))
+        try:
+            async for request in requests:
+                if closed.is_set() or responder.done():
+                    break
+                if request.strip():
+                    # Blocks while max_pending responses are waiting (backpressure)
+                    await pending.put(ensure_future(self._answer(request)))
+        finally:
+            if not responder.done():
+                await pending.put(None)
+            await responder
+
+    async def serve_stdio(self) -> None:
+        """Answer the stdin requests on stdout until the end of stdin"""
+        writer: Final[_FileWriter] = _FileWriter(sys.stdout.buffer)
+        await self.serve(_read_lines(sys.stdin.buffer), writer)
+        await writer.drain()
+
+    async def serve_unix(self, socket_path: str) -> None:
+        """
+        Answer the requests of the clients of a Unix socket (until cancelled)
+        :param socket_path: the Unix socket path (removed on exit)
+        """
+        async def handle_connection(reader: StreamReader, writer: StreamWriter) -> None:
+            try:
+                await self.serve(reader, writer)
+            finally:
+                writer.close()
+
+        server: Final = await start_unix_server(handle_connection, path=socket_path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            unlink(socket_path)
+
+    async def _answer(self, request: bytes) -> bytes:
+        response: Final[dict[str, Any]] = {}
+        try:
+            request_text: str = request.decode('UTF-8').strip()
+            if request_text.startswith('{'):
+                request_object: dict[str, Any] = loads(request_text)
+                if 'id' in request_object:
+                    response['id'] = request_object['id']
+                request_text = request_object['name']
+            response['name'] = request_text
+            response['message'] = await self.__message_service.aget_message(request_text)
+            return dumps(response, ensure_ascii=False).encode('UTF-8') + b'\n'
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Any failure is the request error (never the responder one). The error response is ASCII encoded, so that
+            # it cannot fail like the message one (ie: lone surrogate in a JSON request name)
+            response.pop('message', None)
+            response['error'] = f"{type(error).__name__}: {error}"
+            return dumps(response).encode('UTF-8') + b'\n'
+
+    @staticmethod
+    async def _respond(pending: "Queue[Future[bytes] | None]", writer: ResponseWriter, closed: Event) -> None:
+        # Writes the responses in the request order, then discards them once the client is gone or the writer failed
+        # (serve stops reading the requests when closed is set). The writer is drained when no other response is pending
+        # or every READ_SIZE bytes (ie: batched writes under load)
+        undrained_size: int = 0
+        while (response := await pending.get()) is not None:
+            try:
+                data: bytes = await response
+                if closed.is_set():
+                    continue
+                writer.write(data)
+                undrained_size += len(data)
+                if pending.empty() or undrained_size >= READ_SIZE:
+                    undrained_size = 0
+                    await writer.drain()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                if not isinstance(error, ConnectionError):
+                    print(f"Message server response error: {type(error).__name__}: {error}", file=sys.stderr)
+                closed.set()
+
+
+class _FileWriter:
+    """ResponseWriter of a blocking binary file: the writes are buffered and flushed by drain in a worker thread"""
+
+    def __init__(self, file: BinaryIO):
+        self.__file: Final[BinaryIO] = file
+        self.__buffer: Final[bytearray] = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.__buffer.extend(data)
+
+    async def drain(self) -> None:
+        if self.__buffer:
+            data: Final[bytes] = bytes(self.__buffer)
+            self.__buffer.clear()
+            await get_running_loop().run_in_executor(None, self._write, data)
+
+    def _write(self, data: bytes) -> None:
+        self.__file.write(data)
+        self.__file.flush()
+
+
+async def _read_lines(file: BinaryIO) -> AsyncIterator[bytes]:
+    # Reads what is available (read1) in a worker thread, so that this works with pipes, terminals and regular files
+    loop: Final[AbstractEventLoop] = get_running_loop()
+    read: Final = getattr(file, 'read1', file.read)
+    remainder: bytes = b''
+    while chunk := await loop.run_in_executor(None, read, READ_SIZE):
+        lines: list[bytes] = (remainder + chunk).split(b'\n')
+        remainder = lines.pop()
+        for line in lines:
+            yield line
+    if remainder:
+        yield remainder
+
+
+def main(args: list[str] | None = None) -> None:
+    """
+    hello --serve entry point
+    :param args: the command line arguments (--serve excluded)
+    """
+    parser: Final[ArgumentParser] = ArgumentParser(
+        prog="hello --serve", description="Serve messages (one request per line) on stdin/stdout or on a Unix socket"
+    )
+    parser.add_argument('--socket', help="serve on this Unix socket path instead of stdin/stdout")
+    parser.add_argument('--resource-package', action='append', dest='resource_packages',
+                        help="the message resource package (repeat it for layered packages, first ones first)")
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING,
+                        help="maximum number of requests being processed or waiting for their response")
+    parser.add_argument('--max-workers', type=int, help="maximum number of threads loading the messages")
+    parser.add_argument('--watch', action='store_true',
+                        help="reload the changed message files (see ResourceWatcher) instead of checking them per call")
+    arguments: Final[Any] = parser.parse_args(args)
+
+    with MessageService(
+            arguments.resource_packages or "hellopymsdl_rsrc",
+            MessageCache(check_files=not arguments.watch),
+            max_workers=arguments.max_workers
+    ) as service, ExitStack() as watcher_stack:
+        if arguments.watch:
+            # pylint: disable-next=import-outside-toplevel
+            from hellopymsdl.service.ResourceWatcher import ResourceWatcher
+            watcher_stack.enter_context(ResourceWatcher(service))
+        server: MessageServer = MessageServer(service, arguments.max_pending)
+        try:
+            asyncio_run(server.serve_unix(arguments.socket) if arguments.socket else server.serve_stdio())
+        except (KeyboardInterrupt, CancelledError):
+            pass
@@ -1,11 +1,436 @@
+# pylint: disable=import-outside-toplevel
 import types
-from importlib.resources import files
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from errno import ENOENT
+from io import BytesIO, TextIOWrapper
+from threading import Lock
+from typing import Any, Final, Literal, NamedTuple, overload, TYPE_CHECKING
 
+from hellopymsdl.service.EmbeddedResources import EMBEDDED_FILE_NAME, load_embedded_resources
+from hellopymsdl.service.MessageCache import FileStamp, MessageCache
 
+# Fast cold start (ie: hello script): the following modules are slow to import (asyncio, importlib.resources, pathlib,
+# zipfile, ...) so they are imported by the methods which need them (never when the message is embedded)
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from importlib.resources.abc import Traversable
+    from hellopymsdl.service.MessageTemplate import MessageTemplate
+
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+class _MessageIndex(NamedTuple):
+    """The messages of layered resource packages, resolved once (see MessageService.refresh)"""
+    roots: tuple["Traversable", ...]  # The resolved package roots in lookup order
+    resources: dict[str, "Traversable"]  # {message file name: resource of the first package which contains it}
+    embedded: dict[str, bytes]  # {message file name: embedded content}, for the embedded resources of the index only
+
+
+class _CompiledTemplate(NamedTuple):
+    template: "MessageTemplate"
+    stamp: FileStamp | None  # The resource file stamp when it was read (None if it cannot be checked)
+    generation: int  # The MessageService invalidation generation when it was read
+
+
+# pylint: disable=too-many-instance-attributes
 class MessageService:
-    def __init__(self, resource_package: str | types.ModuleType = "hellopymsdl_rsrc"):
-        self.__resource_package: str | types.ModuleType = resource_package  # pragma: no mutate
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            resource_package: str | types.ModuleType | Sequence[str | types.ModuleType] = "hellopymsdl_rsrc",
+            cache: MessageCache | None = None,
+            max_workers: int | None = None,
+            use_bundle: bool = True,
+            template_escape: str | Callable[[str], str] = 'none',
+            use_embedded: bool = True
+    ):
+        """
+        :param resource_package: the resource package, or an ordered list of layered resource packages where a message
+        is served from the first package which contains it (ie: [overrides, defaults]). The messages of layered packages
+        are indexed once (see refresh), so that each lookup (or miss) is a dict lookup
+        :param cache: the optional message cache
+        :param max_workers: the maximum number of threads used by the async methods (see ThreadPoolExecutor)
+        :param use_bundle: if True and the resource package contains a resource bundle (see ResourceBundle), messages
+        are served from this bundle
+        :param template_escape: the escape mode (or function) used to render message templates (see MessageTemplate)
+        :param use_embedded: if True, the messages embedded at build time in the resource package (see
+        EmbeddedResources) are served without resource lookup (get_message, get_messages and the templates only)
+        """
+        self.__resource_packages: Final[tuple[str | types.ModuleType, ...]] = (
+            tuple(resource_package) if isinstance(resource_package, Sequence) and not isinstance(resource_package, str)
+            else (resource_package,)
+        )
+        self.__cache_key: Final[Any] = \
+            self.__resource_packages if self._is_layered() else self.__resource_packages[0]  # pragma: no mutate
+        self.__cache: MessageCache | None = cache  # pragma: no mutate
+        self.__max_workers: Final[int | None] = max_workers  # pragma: no mutate
+        self.__use_bundle: Final[bool] = use_bundle  # pragma: no mutate
+        self.__use_embedded: Final[bool] = use_embedded  # pragma: no mutate
+        self.__embedded: dict[str, bytes] | None = None
+        self.__root: "Traversable | None" = None
+        self.__index: _MessageIndex | None = None
+        self.__template_escape: Final[str | Callable[[str], str]] = template_escape  # pragma: no mutate
+        self.__templates: Final[dict[str, _CompiledTemplate]] = {}
+        self.__executor: "ThreadPoolExecutor | None" = None
+        self.__executor_lock: Final[Lock] = Lock()
+        self.__generation: int = 0  # Incremented by each invalidation
+        self.__invalidation_lock: Final[Lock] = Lock()
+
+    def __enter__(self) -> "MessageService":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def cache(self) -> MessageCache | None:
+        return self.__cache
+
+    def close(self) -> None:
+        """Shutdown the thread pool used by the async methods (a new one is created if they are called again)"""
+        with self.__executor_lock:
+            executor: "ThreadPoolExecutor | None" = self.__executor
+            self.__executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def refresh(self) -> None:
+        """
+        Resolve the resource packages again (root, bundle, embedded messages and the index of layered packages): ie,
+        after a message file has been added or removed. The cached messages of layered packages are invalidated.
+        """
+        previous_index: Final[_MessageIndex | None] = self.__index
+        self.__root = None
+        self.__embedded = None
+        self.__index = None
+        if self._is_layered():
+            self._get_index()
+        if self.__cache is not None and previous_index is not None:
+            for message_file_name in previous_index.resources:
+                self.__cache.invalidate((self.__cache_key, message_file_name))
+
+    def invalidate(self, message_file_names: Iterable[str] | None = None) -> None:
+        """
+        Forget what is known about some messages after their files changed (ie: see ResourceWatcher): their cached
+        content, their compiled template and, for layered packages, the package which serves them
+        :param message_file_names: the changed message file names (everything is forgotten if None, see refresh)
+        """
+        with self.__invalidation_lock:
+            self.__generation += 1  # The messages being loaded meanwhile are not cached (see _load)
+            if message_file_names is None:
+                self.refresh()
+                self.__templates.clear()
+                if self.__cache is not None:
+                    self.__cache.invalidate()
+                return
+            index: Final[_MessageIndex | None] = self.__index
+            for message_file_name in message_file_names:
+                if self.__cache is not None:
+                    self.__cache.invalidate((self.__cache_key, message_file_name))
+                self.__templates.pop(message_file_name, None)
+                if index is not None:
+                    resource: "Traversable | None" = next((
+                        resource for resource in (root.joinpath(message_file_name) for root in index.roots)
+                        if resource.is_file()
+                    ), None)
+                    if resource is None:
+                        index.resources.pop(message_file_name, None)
+                    else:
+                        index.resources[message_file_name] = resource
+
+    def get_resource_roots(self) -> list["Traversable"]:
+        """
+        :return: the resolved roots of the resource packages in lookup order (a root is a resource bundle if the
+        package messages are served from its bundle)
+        """
+        return list(self._get_index().roots) if self._is_layered() else [self._root()]
 
     def get_message(self, message_file_name: str) -> str:
-        with files(self.__resource_package).joinpath(message_file_name).open() as file:
+        return self._load(message_file_name)
+
+    @overload
+    def get_messages(
+            self, message_file_names: Iterable[str], return_exceptions: Literal[False] = False
+    ) -> dict[str, str]: ...
+
+    @overload
+    def get_messages(
+            self, message_file_names: Iterable[str], return_exceptions: Literal[True]
+    ) -> dict[str, str | Exception]: ...
+
+    def get_messages(
+            self, message_file_names: Iterable[str], return_exceptions: bool = False
+    ) -> dict[str, str] | dict[str, str | Exception]:
+        """
+        Get several messages at once (the resource package is resolved once for the whole batch)
+        :param message_file_names: the message file names
+        :param return_exceptions: if True, errors are reported per message file name instead of being raised
+        :return: a {message file name: message (or error)} dict in the given order
+        """
+        messages: Final[dict[str, str | Exception]] = {}
+        root: "Traversable | None" = None
+        try:
+            if self._is_layered():
+                self._get_index()
+            else:
+                root = self._root()
+        except (ModuleNotFoundError, AttributeError, TypeError) as e:
+            if not return_exceptions:
+                raise
+            messages.update(dict.fromkeys(message_file_names, e))
+            return messages
+
+        for message_file_name in message_file_names:
+            if message_file_name in messages:
+                continue
+            try:
+                messages[message_file_name] = self._load(message_file_name, root)
+            except (OSError, TypeError) as e:
+                if not return_exceptions:
+                    raise
+                messages[message_file_name] = e
+        return messages
+
+    def list_messages(self) -> list[str]:
+        """
+        List the message file names of the resource package(s) (sub-directories included, python caches and resource
+        bundle excluded)
+        :return: the message file names (posix paths relative to the resource package)
+        """
+        if self._is_layered():
+            return sorted(self._get_index().resources)
+        return sorted(message_file_name for message_file_name, _ in self._walk(self._root()))
+
+    def render_message(self, message_file_name: str, /, **context: Any) -> str:
+        """
+        Render a message template (see MessageTemplate) with the given context
+        :param message_file_name: the message (template) file name
+        :param context: the template placeholder values
+        :return: the rendered message
+        """
+        return self.get_template(message_file_name).render(context)
+
+    def get_template(self, message_file_name: str) -> "MessageTemplate":
+        """
+        Get a compiled message template: a message is read and compiled once, then compiled again only if its resource
+        file changed (mtime/size, see FileStamp) or if it is invalidated (see invalidate)
+        :param message_file_name: the message (template) file name
+        :return: the compiled message template
+        """
+        from hellopymsdl.service.MessageTemplate import MessageTemplate
+        generation: Final[int] = self.__generation
+        compiled: Final[_CompiledTemplate | None] = self.__templates.get(message_file_name)
+        if compiled is not None and compiled.generation == generation \
+                and (compiled.stamp is None or not compiled.stamp.is_stale()):
+            return compiled.template
+        # The stamp is taken BEFORE reading the message (see MessageCache.store)
+        stamp: Final[FileStamp | None] = None if message_file_name in self._get_embedded() \
+            else FileStamp.of(self._resource(message_file_name))
+        template: Final[MessageTemplate] = MessageTemplate(self.get_message(message_file_name), self.__template_escape)
+        with self.__invalidation_lock:
+            if generation == self.__generation:  # Else the message may have been read before an invalidation
+                self.__templates[message_file_name] = _CompiledTemplate(template, stamp, generation)
+        return template
+
+    def iter_message(
+            self,
+            message_file_name: str,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            lines: bool = False,
+            encoding: str | None = None
+    ) -> Iterator[str]:
+        """
+        Stream a message without loading the whole resource in memory (the resource is never cached)
+        :param message_file_name: the message file name
+        :param chunk_size: the maximum number of characters per chunk (multibyte characters are never split)
+        :param lines: if True, yield the message line by line (line endings included) instead of by chunks
+        :param encoding: the resource encoding (same default as get_message: the locale encoding)
+        :return: an iterator of decoded chunks or lines (a missing resource is raised when this method is called, the
+        resource is opened on the first iteration and closed once the iterator is exhausted or closed)
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive (got: {chunk_size})")
+        resource: Final["Traversable"] = self._resource(message_file_name)
+        if not resource.is_file():
+            raise FileNotFoundError(ENOENT, "No such message", message_file_name)
+        return self._iter_lines(resource, encoding) if lines else self._iter_chunks(resource, encoding, chunk_size)
+
+    def get_message_bytes(self, message_file_name: str) -> bytes:
+        """
+        Get the raw (not decoded) message (the resource is never cached). The message is copied into the returned bytes:
+        use get_message_view for a zero-copy (memory mapped) access
+        """
+        return self._resource(message_file_name).read_bytes()
+
+    def get_message_view(self, message_file_name: str) -> memoryview:
+        """
+        Get a read only view on the raw message.
+        The resource is memory mapped when it lives on a real filesystem (so its pages are loaded lazily and shared
+        with the OS page cache), otherwise (zip/wheel packed resource) it is read in memory.
+        :param message_file_name: the message file name
+        :return: the message view (the mapping is closed once the view and its slices are garbage collected)
+        """
+        from mmap import mmap, ACCESS_READ
+        from pathlib import Path
+        from hellopymsdl.service.ResourceBundle import BundleTraversable
+        resource: Final["Traversable"] = self._resource(message_file_name)
+        if isinstance(resource, BundleTraversable):
+            return resource.bundle.view(resource.path)
+        if not isinstance(resource, Path):
+            return memoryview(resource.read_bytes())
+        with open(resource, 'rb') as file:
+            try:
+                return memoryview(mmap(file.fileno(), 0, access=ACCESS_READ))
+            except ValueError:  # Empty file cannot be mapped
+                return memoryview(b'')
+
+    async def aget_message(self, message_file_name: str) -> str:
+        """Asyncio version of get_message: the resource is read in the service thread pool"""
+        from asyncio import get_running_loop
+        return await get_running_loop().run_in_executor(self._get_executor(), self.get_message, message_file_name)
+
+    @overload
+    async def aget_messages(
+            self, message_file_names: Iterable[str], return_exceptions: Literal[False] = False
+    ) -> dict[str, str]: ...
+
+    @overload
+    async def aget_messages(
+            self, message_file_names: Iterable[str], return_exceptions: Literal[True]
+    ) -> dict[str, str | Exception]: ...
+
+    async def aget_messages(
+            self, message_file_names: Iterable[str], return_exceptions: bool = False
+    ) -> dict[str, str] | dict[str, str | Exception]:
+        """Asyncio version of get_messages: the resources are concurrently read in the service thread pool"""
+        from asyncio import gather
+        unique_names: Final[list[str]] = list(dict.fromkeys(message_file_names))
+        results: Final[list[str | BaseException]] = await gather(
+            *(self.aget_message(message_file_name) for message_file_name in unique_names),
+            return_exceptions=return_exceptions
+        )
+        messages: Final[dict[str, str | Exception]] = {}
+        for message_file_name, result in zip(unique_names, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            messages[message_file_name] = result
+        return messages
+
+    def _get_executor(self) -> "ThreadPoolExecutor":
+        from concurrent.futures import ThreadPoolExecutor
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__max_workers, thread_name_prefix="MessageService"  # pragma: no mutate
+                )
+            return self.__executor
+
+    def _load(self, message_file_name: str, root: "Traversable | None" = None) -> str:
+        embedded: Final[bytes | None] = self._get_embedded().get(message_file_name)
+        if embedded is not None:
+            return self._decode(embedded)
+        if self.__cache is None:
+            return self._read(self._resource(message_file_name, root))
+
+        key: tuple[Any, str] = (self.__cache_key, message_file_name)
+        message: str | None = self.__cache.lookup(key)
+        if message is None:
+            generation: int = self.__generation
+            resource: "Traversable" = self._resource(message_file_name, root)
+            stamp: FileStamp | None = FileStamp.of(resource)
+            message = self._read(resource)
+            with self.__invalidation_lock:
+                if generation == self.__generation:  # Else the message may have been read before an invalidation
+                    self.__cache.store(key, message, stamp)
+        return message
+
+    def _get_embedded(self) -> dict[str, bytes]:
+        if self._is_layered():
+            return self._get_index().embedded
+        if self.__embedded is None:
+            self.__embedded = load_embedded_resources(self.__resource_packages[0]) if self.__use_embedded else {}
+        return self.__embedded
+
+    def _resource(self, message_file_name: str, root: "Traversable | None" = None) -> "Traversable":
+        self._check_message_file_name(message_file_name)
+        if root is None and self._is_layered():
+            resource: Final["Traversable | None"] = self._get_index().resources.get(message_file_name)
+            if resource is None:
+                raise FileNotFoundError(ENOENT, "No such message in the resource packages", message_file_name)
+            return resource
+        return (self._root() if root is None else root).joinpath(message_file_name)
+
+    @staticmethod
+    def _check_message_file_name(message_file_name: str) -> None:
+        # The message file name is given by the clients (ie: the message server): it must stay in the resource package
+        if not isinstance(message_file_name, str):
+            raise TypeError(f"message_file_name must be a str (got: {type(message_file_name).__name__})")
+        if message_file_name.startswith(('/', '\\')) or '..' in message_file_name.replace('\\', '/').split('/'):
+            raise ValueError(f"Invalid message file name (outside of the resource packages): '{message_file_name}'")
+
+    def _root(self) -> "Traversable":
+        if self.__root is None:
+            self.__root = self._package_root(self.__resource_packages[0])
+        return self.__root
+
+    def _is_layered(self) -> bool:
+        return len(self.__resource_packages) > 1
+
+    def _get_index(self) -> _MessageIndex:
+        if self.__index is None:
+            index: Final[_MessageIndex] = _MessageIndex(
+                tuple(self._package_root(package) for package in self.__resource_packages), {}, {}
+            )
+            for package, root in reversed(list(zip(self.__resource_packages, index.roots))):
+                # Reversed order: the messages of a package override the ones of the next packages
+                embedded: dict[str, bytes] = load_embedded_resources(package) if self.__use_embedded else {}
+                for message_file_name, resource in self._walk(root):
+                    index.resources[message_file_name] = resource
+                    if message_file_name in embedded:
+                        index.embedded[message_file_name] = embedded[message_file_name]
+                    else:
+                        index.embedded.pop(message_file_name, None)
+            self.__index = index
+        return self.__index
+
+    def _package_root(self, package: str | types.ModuleType) -> "Traversable":
+        from importlib.resources import files
+        from hellopymsdl.service.ResourceBundle import BUNDLE_FILE_NAME, ResourceBundle
+        root: Final[Traversable] = files(package)
+        bundle: Final[Traversable] = root.joinpath(BUNDLE_FILE_NAME)
+        return ResourceBundle.open(bundle).root if self.__use_bundle and bundle.is_file() else root
+
+    @staticmethod
+    def _walk(root: "Traversable") -> Iterator[tuple[str, "Traversable"]]:
+        # The (posix relative path, resource) of the message files (python caches, bundle and embedded module excluded)
+        from hellopymsdl.service.ResourceBundle import BUNDLE_FILE_NAME
+        directories: Final[list[tuple[str, "Traversable"]]] = [("", root)]
+        while directories:
+            prefix, directory = directories.pop()
+            for child in directory.iterdir():
+                if child.is_dir():
+                    if child.name != "__pycache__":
+                        directories.append((f"{prefix}{child.name}/", child))
+                elif child.name not in (BUNDLE_FILE_NAME, EMBEDDED_FILE_NAME):
+                    yield prefix + child.name, child
+
+    @staticmethod
+    def _read(resource: "Traversable") -> str:
+        with resource.open() as file:
+            return file.read()
+
+    @staticmethod
+    def _decode(content: bytes) -> str:
+        # Same decoding as a resource opened in text mode (locale encoding and universal newlines)
+        with TextIOWrapper(BytesIO(content)) as file:
             return file.read()
+
+    @staticmethod
+    def _iter_chunks(resource: "Traversable", encoding: str | None, chunk_size: int) -> Iterator[str]:
+        with resource.open(encoding=encoding) as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    @staticmethod
+    def _iter_lines(resource: "Traversable", encoding: str | None) -> Iterator[str]:
+        with resource.open(encoding=encoding) as file:
+            yield from file
@@ -0,0 +1,89 @@
+from collections.abc import Callable, Mapping
+from html import escape as html_escape
+from operator import itemgetter
+from re import compile as re_compile, Match, Pattern
+from shlex import quote as shell_quote
+from string import Formatter
+from typing import Any, Final
+from urllib.parse import quote as url_quote
+
+ESCAPES: Final[dict[str, Callable[[str], str]]] = {
+    'none': str,
+    'html': html_escape,
+    'url': url_quote,
+    'shell': shell_quote
+}
+
+_FORMATTER: Final[Formatter] = Formatter()
+_FIELD_KEY_PATTERN: Final[Pattern[str]] = re_compile(r"[^.\[]+")
+
+_Renderer = Callable[[Mapping[str, Any]], str]
+
+
+class MessageTemplate:
+    """
+    Message compiled once into a list of literal segments and placeholder renderers (str.format syntax with keyword
+    fields only, ie: "Hello {user.name!s:>10}, {{escaped braces}}") and rendered through a single join.
+    Placeholder values are escaped (after conversion and formatting) with the given escape mode (see ESCAPES) or
+    function, literal segments are never escaped.
+    """
+
+    def __init__(self, text: str, escape: str | Callable[[str], str] = 'none'):
+        if not callable(escape) and escape not in ESCAPES:
+            raise ValueError(f"Unknown escape mode: '{escape}' (available modes: {', '.join(ESCAPES)})")
+        self.__fields: Final[set[str]] = set()
+        self.__segments: Final[tuple[str | _Renderer, ...]] = self._compile(
+            text, None if escape == 'none' else escape if callable(escape) else ESCAPES[escape]
+        )
+
+    @property
+    def fields(self) -> frozenset[str]:
+        """The context keys used by this template"""
+        return frozenset(self.__fields)
+
+    def render(self, context: Mapping[str, Any] | None = None, /, **kwargs: Any) -> str:
+        """
+        Render the template
+        :param context: the context values (kwargs are merged into it)
+        :return: the rendered message
+        :raise KeyError: when a placeholder is missing from the context
+        """
+        values: Final[Mapping[str, Any]] = kwargs if context is None else {**context, **kwargs} if kwargs else context
+        return ''.join([segment if isinstance(segment, str) else segment(values) for segment in self.__segments])
+
+    def _compile(self, text: str, escape: Callable[[str], str] | None) -> tuple[str | _Renderer, ...]:
+        segments: Final[list[str | _Renderer]] = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(text):
+            if literal:
+                if segments and isinstance(segments[-1], str):
+                    segments[-1] += literal
+                else:
+                    segments.append(literal)
+            if field_name is not None:
+                renderer: _Renderer = self._compile_field(text, field_name, format_spec or '', conversion)
+                segments.append(renderer if escape is None else self._escaped(renderer, escape))
+        return tuple(segments)
+
+    def _compile_field(self, text: str, field_name: str, format_spec: str, conversion: str | None) -> _Renderer:
+        key_match: Final[Match[str] | None] = _FIELD_KEY_PATTERN.match(field_name)
+        if key_match is None or key_match.group().isdigit():
+            raise ValueError(f"Positional placeholders are not supported (only keyword ones): '{text}'")
+        self.__fields.add(key_match.group())
+        getter: Final[Callable[[Mapping[str, Any]], Any]] = itemgetter(field_name) \
+            if key_match.end() == len(field_name) else lambda values: _FORMATTER.get_field(field_name, (), values)[0]
+
+        if '{' in format_spec:  # Nested placeholders in the format spec (ie: "{value:>{width}}")
+            spec_template: Final[MessageTemplate] = MessageTemplate(format_spec)
+            self.__fields.update(spec_template.fields)
+            return lambda values: format(self._convert(getter(values), conversion), spec_template.render(values))
+        if conversion is not None:
+            return lambda values: format(_FORMATTER.convert_field(getter(values), conversion), format_spec)
+        return lambda values: format(getter(values), format_spec)
+
+    @staticmethod
+    def _escaped(renderer: _Renderer, escape: Callable[[str], str]) -> _Renderer:
+        return lambda values: escape(renderer(values))
+
+    @staticmethod
+    def _convert(value: Any, conversion: str | None) -> Any:
+        return value if conversion is None else _FORMATTER.convert_field(value, conversion)
@@ -0,0 +1,239 @@
+"""
+Indexed resource bundle: all the files of a resource package packed in a single file.
+
+Bundle format (integers are little endian):
+    header: MAGIC (4 bytes) | version (u8) | entry count (u32) | index size in bytes (u32)
+    index:  for each entry: name size (u16) | name (UTF-8 posix path) | flags (u8) | offset (u64) | stored size (u64)
+            | size (u64)
+    data:   entries content (offsets are relative to the data start), zlib compressed if flags & FLAG_COMPRESSED
+
+The bundle is opened once (memory mapped when it lives on a real filesystem, read in memory otherwise) and each lookup
+is a dict access followed by a slice: no path resolution nor open per lookup.
+"""
+from collections.abc import Iterator
+from importlib.resources.abc import Traversable
+from io import BytesIO, TextIOWrapper
+from mmap import mmap, ACCESS_READ
+from os import walk
+from pathlib import Path, PurePosixPath
+from struct import Struct
+from sys import argv as sys_argv
+from typing import Any, BinaryIO, Final, IO, NamedTuple
+from zlib import compress, decompress
+
+from hellopymsdl.service.EmbeddedResources import EMBEDDED_FILE_NAME, write_embedded_resources
+
+BUNDLE_FILE_NAME: Final[str] = "__resources__.bundle"
+MAGIC: Final[bytes] = b"PMSB"
+VERSION: Final[int] = 1
+FLAG_COMPRESSED: Final[int] = 1
+COMPRESS_MIN_SIZE: Final[int] = 512
+
+_HEADER: Final[Struct] = Struct("<4sBII")
+_NAME_SIZE: Final[Struct] = Struct("<H")
+_ENTRY: Final[Struct] = Struct("<BQQQ")
+_EXCLUDED_DIRS: Final[frozenset[str]] = frozenset({"__pycache__"})
+
+
+class BundleEntry(NamedTuple):
+    flags: int
+    offset: int
+    stored_size: int
+    size: int
+
+
+def write_bundle(package_path: Path, compress_entries: bool = False) -> Path:
+    """
+    Pack all the files of a resource package directory into its BUNDLE_FILE_NAME file
+    :param package_path: the resource package directory
+    :param compress_entries: if True, entries bigger than COMPRESS_MIN_SIZE are zlib compressed (when it saves space)
+    :return: the bundle path
+    """
+    bundle_path: Final[Path] = package_path.joinpath(BUNDLE_FILE_NAME)
+    index: Final[list[bytes]] = []
+    data: Final[list[bytes]] = []
+    offset: int = 0
+    for name, file_path in _iter_package_files(package_path):
+        content: bytes = file_path.read_bytes()
+        stored: bytes = content
+        flags: int = 0
+        if compress_entries and len(content) >= COMPRESS_MIN_SIZE:
+            compressed: bytes = compress(content, 9)
+            if len(compressed) < len(content):
+                stored, flags = compressed, FLAG_COMPRESSED
+        encoded_name: bytes = name.encode("UTF-8")
+        index.append(
+            _NAME_SIZE.pack(len(encoded_name)) + encoded_name + _ENTRY.pack(flags, offset, len(stored), len(content))
+        )
+        data.append(stored)
+        offset += len(stored)
+
+    index_bytes: Final[bytes] = b"".join(index)
+    with open(bundle_path, "wb") as bundle_file:
+        bundle_file.write(_HEADER.pack(MAGIC, VERSION, len(index), len(index_bytes)))
+        bundle_file.write(index_bytes)
+        bundle_file.writelines(data)
+    return bundle_path
+
+
+def _iter_package_files(package_path: Path) -> Iterator[tuple[str, Path]]:
+    for dir_path, dir_names, file_names in walk(package_path):
+        dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name not in _EXCLUDED_DIRS)
+        for file_name in sorted(file_names):
+            file_path: Path = Path(dir_path, file_name)
+            name: str = file_path.relative_to(package_path).as_posix()
+            if name not in (BUNDLE_FILE_NAME, EMBEDDED_FILE_NAME):
+                yield name, file_path
+
+
+class ResourceBundle:
+    def __init__(self, content: bytes | mmap):
+        self.__content: Final[bytes | mmap] = content
+        self.__entries: Final[dict[str, BundleEntry]] = {}
+        magic, version, entry_count, index_size = _HEADER.unpack_from(content, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} resource bundle")
+        position: int = _HEADER.size
+        for _ in range(entry_count):
+            (name_size,) = _NAME_SIZE.unpack_from(content, position)
+            position += _NAME_SIZE.size
+            name: str = bytes(content[position:position + name_size]).decode("UTF-8")
+            position += name_size
+            self.__entries[name] = BundleEntry(*_ENTRY.unpack_from(content, position))
+            position += _ENTRY.size
+        self.__data_offset: Final[int] = _HEADER.size + index_size
+        self.__dirs: Final[frozenset[str]] = frozenset(
+            str(parent) for name in self.__entries for parent in PurePosixPath(name).parents
+        ) | {"."}
+
+    @staticmethod
+    def open(bundle: Traversable) -> "ResourceBundle":
+        """
+        Open a bundle: memory map it if it is on a real filesystem, otherwise read it in memory (ie: zip/wheel)
+        :param bundle: the bundle file
+        :return: the opened bundle
+        """
+        if not isinstance(bundle, Path):
+            return ResourceBundle(bundle.read_bytes())
+        with open(bundle, "rb") as bundle_file:
+            return ResourceBundle(mmap(bundle_file.fileno(), 0, access=ACCESS_READ))
+
+    @property
+    def root(self) -> "BundleTraversable":
+        return BundleTraversable(self, "")
+
+    def names(self) -> list[str]:
+        return list(self.__entries)
+
+    def is_file(self, name: str) -> bool:
+        return name in self.__entries
+
+    def is_dir(self, name: str) -> bool:
+        return name in self.__dirs
+
+    def view(self, name: str) -> memoryview:
+        """
+        Get a read only view on an entry content (zero copy for uncompressed entries of memory mapped bundles)
+        :param name: the entry name
+        :return: the entry content view
+        """
+        entry: Final[BundleEntry | None] = self.__entries.get(name)
+        if entry is None:
+            raise FileNotFoundError(f"No such resource in bundle: '{name}'")
+        start: Final[int] = self.__data_offset + entry.offset
+        stored: Final[memoryview] = memoryview(self.__content)[start:start + entry.stored_size].toreadonly()
+        return memoryview(decompress(stored)) if entry.flags & FLAG_COMPRESSED else stored
+
+
+class BundleTraversable(Traversable):
+    """Traversable on a bundle entry (or directory) so that bundled resources are used like importlib resources"""
+
+    def __init__(self, bundle: ResourceBundle, path: str):
+        self.__bundle: Final[ResourceBundle] = bundle
+        self.__path: Final[str] = path
+
+    @property
+    def bundle(self) -> ResourceBundle:
+        return self.__bundle
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self.__path).name
+
+    def iterdir(self) -> Iterator["BundleTraversable"]:
+        if not self.is_dir():
+            raise NotADirectoryError(self.__path)
+        prefix: Final[str] = f"{self.__path}/" if self.__path else ""
+        children: Final[dict[str, None]] = {}
+        for name in self.__bundle.names():
+            if name.startswith(prefix):
+                children.setdefault(prefix + name[len(prefix):].split("/", 1)[0])
+        return (BundleTraversable(self.__bundle, child) for child in children)
+
+    def is_dir(self) -> bool:
+        return self.__bundle.is_dir(self.__path or ".")
+
+    def is_file(self) -> bool:
+        return self.__bundle.is_file(self.__path)
+
+    def joinpath(self, *descendants: Any) -> "BundleTraversable":
+        path: Final[str] = PurePosixPath(self.__path, *descendants).as_posix()
+        return BundleTraversable(self.__bundle, "" if path == "." else path)
+
+    def __truediv__(self, child: Any) -> "BundleTraversable":
+        return self.joinpath(child)
+
+    def read_bytes(self) -> bytes:
+        return self.__bundle.view(self.__path).tobytes()
+
+    def read_text(self, encoding: str | None = None) -> str:
+        with self.open(encoding=encoding) as file:
+            return file.read()
+
+    # pylint: disable=keyword-arg-before-vararg
+    def open(self, mode: str = "r", *args: Any, **kwargs: Any) -> IO[Any]:
+        binary_file: Final[BinaryIO] = BytesIO(self.__bundle.view(self.__path))
+        if mode == "rb":
+            return binary_file
+        if mode == "r":
+            return TextIOWrapper(binary_file, *args, **kwargs)
+        raise ValueError(f"Invalid mode: '{mode}' (bundled resources are read only)")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__path!r})"
+
+
+def main(args: list[str] | None = None) -> None:
+    from argparse import ArgumentParser  # pylint: disable=import-outside-toplevel  # Build time only (startup time)
+    parser: Final[ArgumentParser] = ArgumentParser(
+        description="Pack (or remove with --clean) the resource bundle (and the embedded resources module) of each "
+                    "package of the given resource paths"
+    )
+    parser.add_argument("resource_paths", nargs="+", type=Path, help="resource directories (ie: src/main/resources)")
+    parser.add_argument("--compress", action="store_true", help="zlib compress the entries when it saves space")
+    parser.add_argument("--clean", action="store_true", help="remove the generated bundles and modules")
+    parser.add_argument(
+        "--embed", action="append", default=[], metavar="NAME",
+        help="also embed this resource file in the package embedded resources module (see EmbeddedResources)"
+    )
+    arguments: Final[Any] = parser.parse_args(args)
+    for resource_path in arguments.resource_paths:
+        for package_path in sorted(resource_path.iterdir()):
+            if not package_path.joinpath("__init__.py").is_file():
+                continue
+            if arguments.clean:
+                package_path.joinpath(BUNDLE_FILE_NAME).unlink(missing_ok=True)
+                package_path.joinpath(EMBEDDED_FILE_NAME).unlink(missing_ok=True)
+                continue
+            print(f" |- Bundle {package_path} into {write_bundle(package_path, arguments.compress)}")
+            embedded_path: Path | None = write_embedded_resources(package_path, arguments.embed)
+            if embedded_path:
+                print(f" |- Embed {', '.join(arguments.embed)} of {package_path} into {embedded_path}")
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    main(sys_argv[1:])
@@ -0,0 +1,268 @@
+"""
+Resource hot reload for long-running processes: a background thread watches the resource package directories of a
+MessageService and pushes the changed message file names to it (see MessageService.invalidate), so that only the
+changed messages are read again.
+
+- Linux: the directories are watched with inotify (through ctypes, no dependency), so a change costs nothing until it
+  happens.
+- Elsewhere (or if inotify cannot be used): the directories are polled every poll_interval seconds with os.scandir
+  (stat comparison).
+
+Since changes are pushed, use a MessageCache(check_files=False) with a watched service: cached messages are not
+checked against their file on each call anymore. Nothing is watched (nor imported) if no watcher is started.
+"""
+import ctypes
+import os
+from errno import ENOENT, ENOTDIR
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from select import select
+from struct import calcsize, unpack_from
+from sys import platform
+from threading import Event, Lock, Thread
+from typing import Final
+
+from hellopymsdl.service.MessageService import MessageService
+
+INOTIFY_BACKEND: Final[str] = "inotify"
+POLLING_BACKEND: Final[str] = "polling"
+DEFAULT_POLL_INTERVAL: Final[float] = 1.0
+IGNORED_DIRECTORY_NAMES: Final[frozenset[str]] = frozenset({"__pycache__"})
+
+# inotify (see: man 7 inotify)
+_IN_MODIFY: Final[int] = 0x00000002
+_IN_ATTRIB: Final[int] = 0x00000004
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_CREATE: Final[int] = 0x00000100
+_IN_DELETE: Final[int] = 0x00000200
+_IN_DELETE_SELF: Final[int] = 0x00000400
+_IN_MOVE_SELF: Final[int] = 0x00000800
+_IN_Q_OVERFLOW: Final[int] = 0x00004000
+_IN_IGNORED: Final[int] = 0x00008000
+_IN_ONLYDIR: Final[int] = 0x01000000
+_IN_ISDIR: Final[int] = 0x40000000
+_IN_CLOEXEC: Final[int] = os.O_CLOEXEC
+_IN_WATCH_MASK: Final[int] = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE \
+    | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+_EVENT_HEADER: Final[str] = "iIII"  # wd, mask, cookie, name length
+_EVENT_HEADER_SIZE: Final[int] = calcsize(_EVENT_HEADER)
+_READ_SIZE: Final[int] = 64 * 1024
+
+Snapshot = dict[str, tuple[int, int]]  # {message file name: (mtime_ns, size)}
+
+
+class ResourceWatcher:
+    def __init__(
+            self,
+            message_service: MessageService,
+            poll_interval: float = DEFAULT_POLL_INTERVAL,
+            use_inotify: bool = True
+    ):
+        """
+        :param message_service: the watched message service (only its filesystem resource packages are watched)
+        :param poll_interval: the polling backend period in seconds
+        :param use_inotify: if False, always use the polling backend
+        """
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive (got: {poll_interval})")
+        self.__message_service: Final[MessageService] = message_service
+        self.__poll_interval: Final[float] = poll_interval  # pragma: no mutate
+        self.__use_inotify: Final[bool] = use_inotify  # pragma: no mutate
+        self.__backend: str | None = None
+        self.__thread: Thread | None = None
+        self.__stopped: Final[Event] = Event()
+        self.__lock: Final[Lock] = Lock()
+
+    def __enter__(self) -> "ResourceWatcher":
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    @property
+    def backend(self) -> str | None:
+        """The used backend (INOTIFY_BACKEND or POLLING_BACKEND), None if the watcher is not started"""
+        return self.__backend
+
+    def start(self) -> "ResourceWatcher":
+        """
+        Start watching (the resource packages are resolved now, so a missing package is raised here)
+        :return: self
+        """
+        with self.__lock:
+            if self.__thread is not None:
+                return self
+            roots: Final[list[Path]] = [
+                root for root in self.__message_service.get_resource_roots() if isinstance(root, Path)
+            ]
+            self.__stopped.clear()
+            inotify: Final[_Inotify | None] = _Inotify.open(roots) if self.__use_inotify else None
+            self.__backend = POLLING_BACKEND if inotify is None else INOTIFY_BACKEND
+            self.__thread = Thread(
+                target=self._poll if inotify is None else self._listen,
+                # The initial state is taken now: no change is missed once started
+                args=(roots, _snapshot(roots)) if inotify is None else (inotify,),
+                name="ResourceWatcher", daemon=True  # pragma: no mutate
+            )
+            self.__thread.start()
+            return self
+
+    def stop(self) -> None:
+        """Stop watching and wait for the watcher thread"""
+        with self.__lock:
+            thread: Final[Thread | None] = self.__thread
+            self.__thread = None
+            self.__backend = None
+            self.__stopped.set()
+        if thread is not None:
+            thread.join()
+
+    def _notify(self, message_file_names: Iterable[str] | None) -> None:
+        self.__message_service.invalidate(message_file_names)
+
+    def _listen(self, inotify: "_Inotify") -> None:
+        with inotify:
+            while not self.__stopped.is_set():
+                # Wakes up on events or every poll_interval seconds to check if the watcher is stopped
+                if not select([inotify.fd], [], [], self.__poll_interval)[0]:
+                    continue
+                changes: set[str] | None = inotify.read_changes()
+                if changes is None or changes:
+                    self._notify(changes)
+
+    def _poll(self, roots: list[Path], snapshot: Snapshot) -> None:
+        while not self.__stopped.wait(self.__poll_interval):
+            current: Snapshot = _snapshot(roots)
+            changes: set[str] = {
+                name for name in snapshot.keys() | current.keys() if snapshot.get(name) != current.get(name)
+            }
+            snapshot = current
+            if changes:
+                self._notify(changes)
+
+
+def _snapshot(roots: list[Path]) -> Snapshot:
+    snapshot: Final[Snapshot] = {}
+    for root in roots:
+        for name, entry in _scan(root.as_posix(), ""):
+            try:
+                stat: os.stat_result = entry.stat()
+            except FileNotFoundError:
+                continue  # Removed since the scan
+            snapshot.setdefault(name, (stat.st_mtime_ns, stat.st_size))
+    return snapshot
+
+
+def _scan(directory: str, prefix: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    try:
+        entries: list[os.DirEntry[str]] = list(os.scandir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in IGNORED_DIRECTORY_NAMES:
+                yield from _scan(entry.path, f"{prefix}{entry.name}/")
+        else:
+            yield prefix + entry.name, entry
+
+
+class _Inotify:
+    """Recursive inotify watch of directories, which reports the changed files relatively to their watched root"""
+
+    def __init__(self, libc: ctypes.CDLL, fd: int):
+        self.__libc: Final[ctypes.CDLL] = libc
+        self.__fd: Final[int] = fd
+        self.__directories: Final[dict[int, str]] = {}  # {watch descriptor: directory message file name prefix}
+        self.__paths: Final[dict[int, str]] = {}  # {watch descriptor: directory path}
+
+    @staticmethod
+    def open(roots: list[Path]) -> "_Inotify | None":
+        """
+        :param roots: the root directories to watch
+        :return: the inotify watch or None if inotify is not available
+        """
+        if not platform.startswith("linux"):
+            return None
+        libc: Final[ctypes.CDLL] = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            return None
+        fd: Final[int] = libc.inotify_init1(_IN_CLOEXEC)
+        if fd < 0:
+            return None
+        inotify: Final[_Inotify] = _Inotify(libc, fd)
+        try:
+            for root in roots:
+                inotify.add_watches(root.as_posix(), "")
+        except OSError:  # ie: ENOSPC, the maximum number of watches is reached
+            inotify.close()
+            return None
+        return inotify
+
+    @property
+    def fd(self) -> int:
+        return self.__fd
+
+    def __enter__(self) -> "_Inotify":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        os.close(self.__fd)
+
+    def read_changes(self) -> set[str] | None:
+        """
+        Read the pending events
+        :return: the changed message file names, None if everything may have changed (ie: events were lost)
+        """
+        buffer: Final[bytes] = os.read(self.__fd, _READ_SIZE)
+        changes: Final[set[str]] = set()
+        offset: int = 0
+        while offset < len(buffer):
+            wd, mask, _, length = unpack_from(_EVENT_HEADER, buffer, offset)
+            name_start: int = offset + _EVENT_HEADER_SIZE
+            name: str = os.fsdecode(buffer[name_start:name_start + length].rstrip(b"\0"))
+            offset = name_start + length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if mask & _IN_IGNORED:  # The directory is removed (or is not watched anymore)
+                self.__directories.pop(wd, None)
+                self.__paths.pop(wd, None)
+            elif wd in self.__directories and name:
+                event_changes: set[str] | None = self._on_event(wd, mask, name)
+                if event_changes is None:
+                    return None
+                changes.update(event_changes)
+        return changes
+
+    def _on_event(self, wd: int, mask: int, name: str) -> set[str] | None:
+        prefix: Final[str] = self.__directories[wd] + name
+        if not mask & _IN_ISDIR:
+            return {prefix}
+        if name in IGNORED_DIRECTORY_NAMES:
+            return set()
+        if mask & (_IN_CREATE | _IN_MOVED_TO):
+            # New directory: watched, and its files (ie: moved in) are changes
+            path: Final[str] = os.path.join(self.__paths[wd], name)
+            self.add_watches(path, f"{prefix}/")
+            return {message_file_name for message_file_name, _ in _scan(path, f"{prefix}/")}
+        # Moved out directory: its files are not known here (a removed directory files have their own events)
+        return None if mask & _IN_MOVED_FROM else set()
+
+    def add_watches(self, path: str, prefix: str) -> None:
+        """Watch a directory and its sub-directories (prefix: the message file name prefix of the directory files)"""
+        wd: Final[int] = self.__libc.inotify_add_watch(self.__fd, os.fsencode(path), _IN_WATCH_MASK)
+        if wd < 0:
+            error: Final[int] = ctypes.get_errno()
+            if error in (ENOENT, ENOTDIR):  # Removed since the scan
+                return
+            raise OSError(error, os.strerror(error), path)
+        self.__directories[wd] = prefix
+        self.__paths[wd] = path
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and entry.name not in IGNORED_DIRECTORY_NAMES:
+                    self.add_watches(entry.path, f"{prefix}{entry.name}/")
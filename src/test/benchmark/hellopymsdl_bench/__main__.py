@@ -0,0 +1,158 @@
+"""
+Benchmark runner (python -m hellopymsdl_bench): runs the bench_* functions of the hellopymsdl_bench.*bench_* modules,
+writes the results in the report directory and compares them to a saved baseline.
+
+- Timing: the loop count of each benchmark is calibrated (like timeit) so that a run lasts at least --min-time
+  seconds, then the benchmark is repeated --repeat times and its fastest time per operation is kept (the least noisy
+  value).
+- Regression gate: the command fails when a benchmark is more than --threshold (ie: 0.25 for 25%) slower than its
+  baseline (saved with --save-baseline). Benchmarks without baseline are never failing.
+"""
+from argparse import ArgumentParser
+from importlib import import_module
+from inspect import getmembers, isfunction
+from json import dumps, loads
+from pathlib import Path
+from pkgutil import walk_packages
+from platform import machine, python_implementation, python_version
+from re import search
+from statistics import median
+from sys import exit as sys_exit
+from time import time
+from types import ModuleType
+from typing import Any, Callable, Final, NamedTuple
+
+BENCH_PREFIX: Final[str] = 'bench_'
+RESULT_FILE_NAME: Final[str] = 'bench.json'
+MAX_LOOPS: Final[int] = 10_000_000
+
+Benchmark = Callable[[int], float]
+
+
+class BenchResult(NamedTuple):
+    name: str
+    loops: int
+    times: list[float]  # Seconds per operation of each repetition
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'loops': self.loops, 'best': self.best, 'median': median(self.times), 'times': self.times}
+
+
+def discover(package: ModuleType, name_filter: str | None = None) -> dict[str, Benchmark]:
+    """
+    Discover the benchmarks of a package
+    :param package: the benchmark package
+    :param name_filter: an optional regular expression searched in the benchmark full names
+    :return: the {full name (module.function): benchmark} dict in name order
+    """
+    benchmarks: Final[dict[str, Benchmark]] = {}
+    for module_info in walk_packages(package.__path__, f"{package.__name__}."):
+        if module_info.ispkg or not module_info.name.rsplit('.', 1)[-1].startswith(BENCH_PREFIX):
+            continue
+        module: ModuleType = import_module(module_info.name)
+        for function_name, function in getmembers(module, isfunction):
+            name: str = f"{module_info.name}.{function_name}"
+            if function_name.startswith(BENCH_PREFIX) and function.__module__ == module.__name__ \
+                    and (name_filter is None or search(name_filter, name)):
+                benchmarks[name] = function
+    return dict(sorted(benchmarks.items()))
+
+
+def calibrate(benchmark: Benchmark, min_time: float) -> int:
+    """
+    Find the loop count for which a benchmark run lasts at least min_time seconds (1, 2, 5, 10, 20, 50, ... loops)
+    """
+    loops: int = 1
+    while loops < MAX_LOOPS:
+        for multiplier in (1, 2, 5):
+            if benchmark(loops * multiplier) >= min_time:
+                return loops * multiplier
+        loops *= 10
+    return MAX_LOOPS
+
+
+def run_benchmark(name: str, benchmark: Benchmark, repeat: int, min_time: float) -> BenchResult:
+    loops: Final[int] = calibrate(benchmark, min_time)
+    return BenchResult(name, loops, [benchmark(loops) / loops for _ in range(repeat)])
+
+
+def compare(results: dict[str, BenchResult], baseline: dict[str, Any]) -> dict[str, float | None]:
+    """
+    Compare results to a baseline
+    :param results: the benchmark results
+    :param baseline: the baseline report (see write_report)
+    :return: the {benchmark name: slowdown ratio (or None without baseline)} dict
+    """
+    baseline_benchmarks: Final[dict[str, Any]] = baseline.get('benchmarks', {})
+    return {
+        name: result.best / baseline_benchmarks[name]['best'] - 1 if name in baseline_benchmarks else None
+        for name, result in results.items()
+    }
+
+
+def write_report(report_file_path: Path, results: dict[str, BenchResult]) -> dict[str, Any]:
+    report: Final[dict[str, Any]] = {
+        'timestamp': time(),
+        'python': f"{python_implementation()} {python_version()}",
+        'machine': machine(),
+        'benchmarks': {name: result.to_dict() for name, result in results.items()}
+    }
+    report_file_path.parent.mkdir(parents=True, exist_ok=True)
+    report_file_path.write_text(dumps(report, indent=2), encoding='UTF-8')
+    return report
+
+
+def main(args: list[str] | None = None) -> int:
+    parser: Final[ArgumentParser] = ArgumentParser(description="hellopymsdl benchmarks")
+    parser.add_argument('-k', '--filter', help="only run the benchmarks matching this regular expression")
+    parser.add_argument('--repeat', type=int, default=5, help="number of timed runs per benchmark")
+    parser.add_argument('--min-time', type=float, default=0.2, help="minimum duration of a timed run (seconds)")
+    parser.add_argument('--report-path', type=Path, default=Path('build/reports/bench'))
+    parser.add_argument('--baseline', type=Path, default=Path('src/test/benchmark/baseline.json'))
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown ratio (ie: 0.25 for 25%%)")
+    parser.add_argument('--save-baseline', action='store_true', help="save the results as the new baseline")
+    arguments: Final[Any] = parser.parse_args(args)
+
+    results: Final[dict[str, BenchResult]] = {}
+    for name, benchmark in discover(import_module(__package__ or 'hellopymsdl_bench'), arguments.filter).items():
+        results[name] = run_benchmark(name, benchmark, arguments.repeat, arguments.min_time)
+        print(f" |- {name}: {_format_time(results[name].best)}/op "
+              f"(median: {_format_time(median(results[name].times))}, {results[name].loops} loops)", flush=True)
+    report: Final[dict[str, Any]] = write_report(arguments.report_path.joinpath(RESULT_FILE_NAME), results)
+
+    if arguments.save_baseline:
+        arguments.baseline.parent.mkdir(parents=True, exist_ok=True)
+        arguments.baseline.write_text(dumps(report, indent=2), encoding='UTF-8')
+        print(f"Baseline saved: {arguments.baseline}")
+        return 0
+    if not arguments.baseline.is_file():
+        print(f"No baseline to compare with ({arguments.baseline}), use --save-baseline to save one")
+        return 0
+
+    slowdowns: Final[dict[str, float | None]] = compare(
+        results, loads(arguments.baseline.read_text(encoding='UTF-8'))
+    )
+    print(f"\nBASELINE COMPARISON ({arguments.baseline}, threshold: +{arguments.threshold:.0%}):")
+    for name, slowdown in slowdowns.items():
+        status: str = 'NEW' if slowdown is None else 'REGRESSION' if slowdown > arguments.threshold else 'OK'
+        print(f"  {status:<12}{'' if slowdown is None else f'{slowdown:+.1%}':>9}  {name}")
+    regressions: Final[int] = sum(1 for slowdown in slowdowns.values() if slowdown and slowdown > arguments.threshold)
+    if regressions:
+        print(f"{regressions} benchmark(s) slower than the baseline by more than {arguments.threshold:.0%}")
+        return 1
+    return 0
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.3f}{unit}"
+    return f"{seconds / 1e-9:.1f}ns"
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    sys_exit(main())
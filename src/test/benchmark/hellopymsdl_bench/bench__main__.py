@@ -0,0 +1,30 @@
+"""
+hello entry point benchmarks: end-to-end startup in a new interpreter
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+import sys
+from shutil import which
+from subprocess import run, DEVNULL
+from time import perf_counter
+from typing import Final
+
+
+def get_hello_command_line() -> list[str]:
+    """The installed hello script (ie: in a tox env) or the hellopymsdl module run from the PYTHONPATH"""
+    hello_path: Final[str | None] = which('hello')
+    return [hello_path] if hello_path else [sys.executable, '-m', 'hellopymsdl']
+
+
+def bench_hello_startup(loops: int) -> float:
+    """hello (interpreter startup + imports + message read + print)"""
+    command_line: Final[list[str]] = get_hello_command_line()
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        run(command_line, stdout=DEVNULL, check=True)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    LOOPS: Final[int] = 20
+    print(f"{bench_hello_startup.__name__}: {bench_hello_startup(LOOPS) / LOOPS * 1e3:.3f} ms/op")
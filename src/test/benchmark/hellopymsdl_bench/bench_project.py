@@ -0,0 +1,53 @@
+"""
+project.py startup benchmarks
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+import sys
+from pathlib import Path
+from subprocess import run, PIPE, DEVNULL
+from time import perf_counter
+from typing import Final
+
+PROJECT_PATH: Final[Path] = Path(__file__).parents[4]
+
+
+def get_import_times(module: str = 'project') -> dict[str, int]:
+    """
+    Import a module in a new interpreter with "-X importtime"
+    :param module: the module to import (from the project path)
+    :return: the {module: cumulative import time in microseconds} dict of all imported modules
+    """
+    stderr: Final[str] = run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=PROJECT_PATH, stdout=DEVNULL, stderr=PIPE, text=True, check=True
+    ).stderr
+    import_times: Final[dict[str, int]] = {}
+    for line in stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields: list[str] = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+    return import_times
+
+
+def bench_project_import(loops: int) -> float:
+    """project.py import (ie: -X importtime cumulative time of the project module, interpreter startup excluded)"""
+    return sum(get_import_times()['project'] for _ in range(loops)) / 1e6
+
+
+def bench_project_help(loops: int) -> float:
+    """project.py --help in a new interpreter (ie: interpreter startup + import + help)"""
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        run([sys.executable, 'project.py', '--help'], cwd=PROJECT_PATH, stdout=DEVNULL, check=True)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    LOOPS: Final[int] = 20
+    for bench in (bench_project_import, bench_project_help):
+        print(f"{bench.__name__}: {bench(LOOPS) / LOOPS * 1e3:.3f} ms/op")
+    print("Slowest project.py imports (cumulative):")
+    for name, duration in sorted(get_import_times().items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {name}: {duration / 1e3:.3f} ms")
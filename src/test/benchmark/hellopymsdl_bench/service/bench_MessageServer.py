@@ -0,0 +1,37 @@
+"""
+MessageServer benchmarks
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+from asyncio import run as asyncio_run
+from collections.abc import AsyncIterator
+from time import perf_counter
+from typing import Final
+
+from hellopymsdl.service.MessageCache import MessageCache
+from hellopymsdl.service.MessageServer import MessageServer
+from hellopymsdl.service.MessageService import MessageService
+
+REQUEST: Final[bytes] = b"message.txt\n"
+
+
+class _NullWriter:
+    def write(self, data: bytes) -> None:
+        pass
+
+    async def drain(self) -> None:
+        pass
+
+
+async def _requests(count: int) -> AsyncIterator[bytes]:
+    for _ in range(count):
+        yield REQUEST
+
+
+def bench_serve_requests(loops: int) -> float:
+    """One warm server answering a stream of cached message requests (ie: the cost per request of hello --serve)"""
+    with MessageService(cache=MessageCache()) as message_service:
+        server: Final[MessageServer] = MessageServer(message_service)
+        start: Final[float] = perf_counter()
+        asyncio_run(server.serve(_requests(loops), _NullWriter()))
+        return perf_counter() - start
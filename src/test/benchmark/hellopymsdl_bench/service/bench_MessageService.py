@@ -0,0 +1,126 @@
+"""
+MessageService benchmarks
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+from functools import cache
+from importlib import invalidate_caches
+from pathlib import Path
+from sys import path as sys_path
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Final
+
+from hellopymsdl.service.MessageCache import MessageCache
+from hellopymsdl.service.MessageService import MessageService
+
+MESSAGE_FILE_NAME: Final[str] = "message.txt"
+MANY_PACKAGE: Final[str] = "bench_many_messages_rsrc"
+MANY_MESSAGE_COUNT: Final[int] = 1_000
+LARGE_PACKAGE: Final[str] = "bench_large_message_rsrc"
+LARGE_MESSAGE_SIZE: Final[int] = 4 * 1024 * 1024
+
+
+@cache
+def _resource_packages() -> list[str]:
+    """Create (once) on the sys.path a package with many small messages and a package with a large message"""
+    tmp_path: Final[Path] = Path(mkdtemp(prefix="bench_message_service_"))
+    for package_name in (MANY_PACKAGE, LARGE_PACKAGE):
+        tmp_path.joinpath(package_name).mkdir()
+        tmp_path.joinpath(package_name, "__init__.py").touch()
+    names: Final[list[str]] = [f"message_{index}.txt" for index in range(MANY_MESSAGE_COUNT)]
+    for name in names:
+        tmp_path.joinpath(MANY_PACKAGE, name).write_text(f"Message {name}\n", encoding="UTF-8")
+    line: Final[str] = "hello python with Maven Standard Directory Layout\n"
+    tmp_path.joinpath(LARGE_PACKAGE, MESSAGE_FILE_NAME).write_text(
+        line * (LARGE_MESSAGE_SIZE // len(line)), encoding="UTF-8"
+    )
+    sys_path.insert(0, tmp_path.as_posix())
+    invalidate_caches()
+    return names
+
+
+def bench_get_message_cold(loops: int) -> float:
+    """get_message without cache (ie: path resolution + open + read + decode on each call)"""
+    message_service: Final[MessageService] = MessageService()
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(MESSAGE_FILE_NAME)
+    return perf_counter() - start
+
+
+def bench_get_message_warm(loops: int) -> float:
+    """get_message with a warmed cache (ie: lookup + mtime/size check on each call)"""
+    message_service: Final[MessageService] = MessageService(cache=MessageCache())
+    message_service.get_message(MESSAGE_FILE_NAME)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(MESSAGE_FILE_NAME)
+    return perf_counter() - start
+
+
+def bench_get_message_warm_unchecked(loops: int) -> float:
+    """get_message with a warmed cache which doesn't check resource files (ie: lookup only)"""
+    message_service: Final[MessageService] = MessageService(cache=MessageCache(check_files=False))
+    message_service.get_message(MESSAGE_FILE_NAME)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(MESSAGE_FILE_NAME)
+    return perf_counter() - start
+
+
+def bench_get_messages_many_files(loops: int) -> float:
+    """get_messages of MANY_MESSAGE_COUNT small messages without cache (one op = the whole batch)"""
+    names: Final[list[str]] = _resource_packages()
+    message_service: Final[MessageService] = MessageService(MANY_PACKAGE)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_messages(names)
+    return perf_counter() - start
+
+
+def bench_get_message_large_file(loops: int) -> float:
+    """get_message of a LARGE_MESSAGE_SIZE message without cache (ie: read + decode of the whole file on each call)"""
+    _resource_packages()
+    message_service: Final[MessageService] = MessageService(LARGE_PACKAGE)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(MESSAGE_FILE_NAME)
+    return perf_counter() - start
+
+
+def bench_get_message_layered_miss(loops: int) -> float:
+    """get_message of a message missing from 3 layered packages (ie: index lookup)"""
+    _resource_packages()
+    message_service: Final[MessageService] = MessageService((MANY_PACKAGE, LARGE_PACKAGE, "hellopymsdl_rsrc"))
+    message_service.list_messages()
+    return _bench_misses(loops, [message_service])
+
+
+def bench_get_message_fallback_miss(loops: int) -> float:
+    """get_message of a message missing from 3 packages by trying one service per package (without layered packages)"""
+    _resource_packages()
+    packages: Final[tuple[str, ...]] = (MANY_PACKAGE, LARGE_PACKAGE, "hellopymsdl_rsrc")
+    return _bench_misses(loops, [MessageService(package) for package in packages])
+
+
+def _bench_misses(loops: int, message_services: list[MessageService]) -> float:
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        for message_service in message_services:
+            try:
+                message_service.get_message("unknown.txt")
+            except FileNotFoundError:
+                pass
+    return perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    LOOPS: Final[int] = 100_000
+    for bench in (
+            bench_get_message_cold, bench_get_message_warm, bench_get_message_warm_unchecked,
+            bench_get_message_layered_miss, bench_get_message_fallback_miss
+    ):
+        print(f"{bench.__name__}: {bench(LOOPS) / LOOPS * 1e6:.3f} us/op")
+    for bench in (bench_get_messages_many_files, bench_get_message_large_file):
+        print(f"{bench.__name__}: {bench(LOOPS // 1000) / (LOOPS // 1000) * 1e3:.3f} ms/op")
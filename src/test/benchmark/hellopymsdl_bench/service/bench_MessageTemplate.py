@@ -0,0 +1,64 @@
+"""
+MessageTemplate benchmarks: compiled template rendering against naive str.format on the raw message
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+from html import escape as html_escape
+from time import perf_counter
+from typing import Any, Final
+
+from hellopymsdl.service.MessageCache import MessageCache
+from hellopymsdl.service.MessageService import MessageService
+
+TEMPLATE_FILE_NAME: Final[str] = "test_template.txt"
+CONTEXT: Final[dict[str, Any]] = {"name": "<Bob>", "count": 3}
+
+
+def bench_naive_str_format(loops: int) -> float:
+    """str.format on the (cached) raw message"""
+    message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+    message_service.get_message(TEMPLATE_FILE_NAME)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(TEMPLATE_FILE_NAME).format(**CONTEXT)
+    return perf_counter() - start
+
+
+def bench_render_message(loops: int) -> float:
+    """render_message with the compiled template cache"""
+    message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+    message_service.render_message(TEMPLATE_FILE_NAME, **CONTEXT)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.render_message(TEMPLATE_FILE_NAME, **CONTEXT)
+    return perf_counter() - start
+
+
+def bench_naive_str_format_html(loops: int) -> float:
+    """str.format on the (cached) raw message with html escaped values"""
+    message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+    message_service.get_message(TEMPLATE_FILE_NAME)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.get_message(TEMPLATE_FILE_NAME).format(
+            **{key: html_escape(str(value)) for key, value in CONTEXT.items()}
+        )
+    return perf_counter() - start
+
+
+def bench_render_message_html(loops: int) -> float:
+    """render_message with the compiled template cache and the html escape mode"""
+    message_service: Final[MessageService] = MessageService(
+        "hellopymsdl_test_rsrc", MessageCache(), template_escape="html"
+    )
+    message_service.render_message(TEMPLATE_FILE_NAME, **CONTEXT)
+    start: Final[float] = perf_counter()
+    for _ in range(loops):
+        message_service.render_message(TEMPLATE_FILE_NAME, **CONTEXT)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    LOOPS: Final[int] = 100_000
+    for bench in (bench_naive_str_format, bench_render_message, bench_naive_str_format_html, bench_render_message_html):
+        print(f"{bench.__name__}: {bench(LOOPS) / LOOPS * 1e6:.3f} us/op")
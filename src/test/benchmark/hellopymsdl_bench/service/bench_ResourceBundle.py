@@ -0,0 +1,69 @@
+"""
+ResourceBundle benchmarks: lookups in a zipped (ie: wheel/zipapp installed) resource package with and without bundle
+
+Each bench_* function runs its scenario "loops" times and returns the elapsed time in seconds (setup excluded)
+"""
+from functools import cache
+from importlib import invalidate_caches
+from pathlib import Path
+from sys import path as sys_path
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import Final
+from zipfile import ZipFile
+
+from hellopymsdl.service.MessageService import MessageService
+from hellopymsdl.service.ResourceBundle import BUNDLE_FILE_NAME, write_bundle
+
+MESSAGE_COUNT: Final[int] = 100
+PLAIN_PACKAGE: Final[str] = "bench_zipped_plain_rsrc"
+BUNDLED_PACKAGE: Final[str] = "bench_zipped_bundled_rsrc"
+
+
+@cache
+def _zipped_packages() -> list[str]:
+    """Create (once) a zip on the sys.path containing the same resource package with and without bundle"""
+    tmp_path: Final[Path] = Path(mkdtemp(prefix="bench_bundle_"))
+    package_path: Final[Path] = tmp_path.joinpath("package")
+    package_path.mkdir()
+    package_path.joinpath("__init__.py").touch()
+    for index in range(MESSAGE_COUNT):
+        package_path.joinpath(f"message_{index}.txt").write_text(f"Message {index}\n" * 10, encoding="UTF-8")
+    bundle_path: Final[Path] = write_bundle(package_path)
+    zip_path: Final[Path] = tmp_path.joinpath("resources.zip")
+    with ZipFile(zip_path, 'w') as zip_file:
+        for package_name in (PLAIN_PACKAGE, BUNDLED_PACKAGE):
+            for file_path in package_path.iterdir():
+                if file_path.name != BUNDLE_FILE_NAME:
+                    zip_file.write(file_path, f"{package_name}/{file_path.name}")
+        zip_file.write(bundle_path, f"{BUNDLED_PACKAGE}/{BUNDLE_FILE_NAME}")
+    sys_path.insert(0, zip_path.as_posix())
+    invalidate_caches()
+    return [f"message_{index}.txt" for index in range(MESSAGE_COUNT)]
+
+
+def _bench_lookups(loops: int, message_service: MessageService) -> float:
+    names: Final[list[str]] = _zipped_packages()
+    message_service.get_message(names[0])
+    start: Final[float] = perf_counter()
+    for index in range(loops):
+        message_service.get_message(names[index % MESSAGE_COUNT])
+    return perf_counter() - start
+
+
+def bench_zipped_importlib_resources(loops: int) -> float:
+    """get_message on a zipped package through importlib.resources (zip traversal + open on each call)"""
+    _zipped_packages()
+    return _bench_lookups(loops, MessageService(PLAIN_PACKAGE))
+
+
+def bench_zipped_resource_bundle(loops: int) -> float:
+    """get_message on a zipped package through its resource bundle (dict lookup + slice on each call)"""
+    _zipped_packages()
+    return _bench_lookups(loops, MessageService(BUNDLED_PACKAGE))
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    LOOPS: Final[int] = 20_000
+    for bench in (bench_zipped_importlib_resources, bench_zipped_resource_bundle):
+        print(f"{bench.__name__}: {bench(LOOPS) / LOOPS * 1e6:.3f} us/op")
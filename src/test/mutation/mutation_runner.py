@@ -0,0 +1,268 @@
+"""
+Incremental and parallel mutation testing on top of mutmut (2.x).
+
+- Incremental: each source file has its own mutmut cache (stored in the report directory) and is skipped when neither
+  its content nor the tests changed since its last run. With --since <REF>, only the files changed since this git
+  reference (committed or not) are mutated.
+- Parallel: mutmut mutates the sources in place, so each worker runs mutmut (one source file at a time) in its own
+  copy of the project sources.
+- Coverage: mutants are only generated on covered lines and only the tests covering the mutated line are run (see
+  mutmut_config).
+- Timing: the duration of each mutant test run and its slowest tests are reported (see mutation_timing).
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from html import escape
+from json import dumps, loads
+from os import cpu_count, environ, pathsep, walk
+from pathlib import Path
+from queue import Queue
+from shutil import copy2, copytree, ignore_patterns, rmtree
+from sqlite3 import connect
+from subprocess import run, DEVNULL, PIPE, STDOUT
+from sys import argv as sys_argv, executable, exit as sys_exit
+from time import perf_counter
+from typing import Any, Final, NamedTuple
+
+from mutation_timing import TIMING_FILE_ENV_VAR
+
+PYTHONPATH_DIRS: Final[tuple[str, ...]] = (
+    'src/main/python', 'src/main/resources', 'src/test/python', 'src/test/resources', 'src/test/mutation'
+)
+TEST_RUNNER: Final[str] = f"{executable} -m pytest -x --assert=plain -p no:cacheprovider -p mutation_timing"
+COVERAGE_RC: Final[str] = "[run]\ndynamic_context = test_function\n"
+MUTMUT_CACHE_FILE_NAME: Final[str] = '.mutmut-cache'
+FATAL_RETURN_CODE: Final[int] = 1
+SLOWEST_COUNT: Final[int] = 10
+
+
+class FileResult(NamedTuple):
+    filename: str
+    returncode: int
+    statuses: dict[str, int]
+    timings: list[dict[str, Any]]
+    duration: float
+    cached: bool = False
+
+
+class Worker:
+    """A copy of the project sources in which mutmut can mutate files without disturbing the other workers"""
+
+    def __init__(self, project_path: Path, worker_path: Path, source_path: str, tests_path: str):
+        self.__project_path: Final[Path] = project_path
+        self.__worker_path: Final[Path] = worker_path
+        self.__source_path: Final[str] = source_path
+        self.__tests_path: Final[str] = tests_path
+        self.__env: Final[dict[str, str]] = {**environ, 'PYTHONPATH': pathsep.join(PYTHONPATH_DIRS)}
+        self.__ready: bool = False
+
+    def run(self, filename: str, cache_path: Path, log_path: Path, html_path: Path) -> tuple[int, dict[str, int], list]:
+        """
+        Run mutmut on a source file
+        :param filename: the source file path (relative to the project path)
+        :param cache_path: the mutmut cache of the source file (restored before the run, saved after)
+        :param log_path: the mutmut output file
+        :param html_path: the html report directory
+        :return: the mutmut return code, the mutant count by status and the mutant timings
+        """
+        if not self.__ready:
+            self._prepare()
+        worker_cache_path: Final[Path] = self.__worker_path.joinpath(MUTMUT_CACHE_FILE_NAME)
+        timing_path: Final[Path] = self.__worker_path.joinpath('timing.jsonl')
+        worker_cache_path.unlink(missing_ok=True)
+        timing_path.unlink(missing_ok=True)
+        if cache_path.is_file():
+            copy2(cache_path, worker_cache_path)
+
+        result: Final = self._run([
+            executable, '-m', 'mutmut', 'run', '--paths-to-mutate', filename, '--tests-dir', self.__tests_path,
+            '--runner', TEST_RUNNER, '--use-coverage', '--simple-output', '--no-progress'
+        ], {TIMING_FILE_ENV_VAR: timing_path.as_posix()})
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_bytes(result.stdout)
+
+        if worker_cache_path.is_file():
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            copy2(worker_cache_path, cache_path)
+            self._run([executable, '-m', 'mutmut', 'html', '--directory', 'html'])
+            copytree(self.__worker_path.joinpath('html'), html_path, dirs_exist_ok=True,
+                     ignore=ignore_patterns('index.html'))
+        timings: Final[list[dict[str, Any]]] = [
+            loads(line) for line in timing_path.read_text(encoding='UTF-8').splitlines()
+        ] if timing_path.is_file() else []
+        return result.returncode, self._get_statuses(worker_cache_path), timings
+
+    def _prepare(self) -> None:
+        # Copy the sources then collect the coverage data (with the covering test of each line) used by mutmut
+        rmtree(self.__worker_path, ignore_errors=True)
+        copytree(self.__project_path.joinpath('src'), self.__worker_path.joinpath('src'),
+                 ignore=ignore_patterns('__pycache__', MUTMUT_CACHE_FILE_NAME))
+        copy2(self.__project_path.joinpath('pyproject.toml'), self.__worker_path)
+        coverage_rc_path: Final[Path] = self.__worker_path.joinpath('.mutation-coveragerc')
+        coverage_rc_path.write_text(COVERAGE_RC, encoding='UTF-8')
+        result: Final = self._run([
+            executable, '-m', 'coverage', 'run', f"--rcfile={coverage_rc_path.name}", '--data-file=.coverage',
+            f"--source={self.__source_path}", '-m', 'pytest', '-q', '-p', 'no:cacheprovider', self.__tests_path
+        ])
+        if result.returncode:
+            raise RuntimeError(f"Tests must pass before mutation testing:\n{result.stdout.decode(errors='replace')}")
+        self.__ready = True
+
+    def _run(self, command_line: list[str], env: dict[str, str] | None = None) -> Any:
+        return run(command_line, cwd=self.__worker_path, env={**self.__env, **(env or {})}, stdin=DEVNULL,
+                   stdout=PIPE, stderr=STDOUT, check=False)
+
+    @staticmethod
+    def _get_statuses(cache_path: Path) -> dict[str, int]:
+        if not cache_path.is_file():
+            return {}
+        with connect(cache_path) as connection:
+            return dict(connection.execute("SELECT status, COUNT(*) FROM Mutant GROUP BY status").fetchall())
+
+
+def get_files_to_mutate(source_path: str, since: str | None = None) -> list[str]:
+    """
+    List the source files to mutate
+    :param source_path: the sources directory (relative to the current directory)
+    :param since: if not None, only the files changed (committed or not) since this git reference are listed
+    :return: the python source file paths
+    """
+    if since is None:
+        return sorted(
+            Path(dir_path, file_name).as_posix()
+            for dir_path, _, file_names in walk(source_path) for file_name in file_names if file_name.endswith('.py')
+        )
+    changed_files: Final[set[str]] = set()
+    git_commands: Final[list[list[str]]] = [
+        ['git', 'diff', '--name-only', since, '--', source_path],
+        ['git', 'ls-files', '--others', '--exclude-standard', source_path]
+    ]
+    for git_command in git_commands:
+        changed_files.update(run(git_command, stdout=PIPE, check=True, text=True).stdout.split())
+    return sorted(filename for filename in changed_files if filename.endswith('.py') and Path(filename).is_file())
+
+
+def get_fingerprint(filename: str, tests_digest: str) -> str:
+    return sha256(tests_digest.encode() + Path(filename).read_bytes()).hexdigest()
+
+
+def get_tests_digest(tests_paths: list[str]) -> str:
+    digest: Final = sha256()
+    for tests_path in tests_paths:
+        if Path(tests_path).is_file():
+            digest.update(Path(tests_path).read_bytes())
+        for dir_path, dir_names, file_names in walk(tests_path):
+            dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name != '__pycache__')
+            for file_name in sorted(file_names):
+                file_path: Path = Path(dir_path, file_name)
+                digest.update(file_path.as_posix().encode())
+                digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+# pylint: disable=too-many-locals
+def main(args: list[str] | None = None) -> int:
+    parser: Final[ArgumentParser] = ArgumentParser(description="Incremental and parallel mutation testing (mutmut)")
+    parser.add_argument('--since', help="only mutate the files changed since this git reference (ie: origin/main)")
+    parser.add_argument('-j', '--jobs', type=int, default=cpu_count() or 1, help="number of workers")
+    parser.add_argument('--source-path', default='src/main/python')
+    parser.add_argument('--tests-path', default='src/test/python')
+    parser.add_argument('--report-path', type=Path, default=Path('build/reports/mutation'))
+    parser.add_argument('--work-path', type=Path, default=Path('build/mutation'))
+    arguments: Final[Any] = parser.parse_args(args)
+
+    report_path: Final[Path] = arguments.report_path
+    tests_digest: Final[str] = get_tests_digest(['src/main/resources', 'src/test', 'pyproject.toml'])
+    files_to_mutate: Final[list[str]] = get_files_to_mutate(arguments.source_path, arguments.since)
+    print(f" |- {len(files_to_mutate)} file(s) to mutate with {arguments.jobs} worker(s)")
+
+    workers: Final[Queue[Worker]] = Queue()
+    for index in range(max(1, min(arguments.jobs, len(files_to_mutate)))):
+        workers.put(Worker(Path.cwd(), arguments.work_path.joinpath(f"worker-{index}").absolute(),
+                           arguments.source_path, arguments.tests_path))
+
+    def mutate(filename: str) -> FileResult:
+        state_path: Path = report_path.joinpath('cache', f"{filename}.json")
+        fingerprint: str = get_fingerprint(filename, tests_digest)
+        state: dict[str, Any] = loads(state_path.read_text(encoding='UTF-8')) if state_path.is_file() else {}
+        if state.get('fingerprint') == fingerprint:
+            return FileResult(filename, state['returncode'], state['statuses'], state['timings'], 0.0, cached=True)
+
+        start: float = perf_counter()
+        worker: Worker = workers.get()
+        try:
+            returncode, statuses, timings = worker.run(
+                filename, report_path.joinpath('cache', f"{filename}{MUTMUT_CACHE_FILE_NAME}"),
+                report_path.joinpath('logs', f"{filename}.log"), report_path.joinpath('html')
+            )
+        finally:
+            workers.put(worker)
+        if not returncode & FATAL_RETURN_CODE:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(dumps({'fingerprint': fingerprint, 'returncode': returncode, 'statuses': statuses,
+                                         'timings': timings}), encoding='UTF-8')
+        return FileResult(filename, returncode, statuses, timings, perf_counter() - start)
+
+    results: Final[list[FileResult]] = []
+    with ThreadPoolExecutor(max_workers=workers.qsize()) as executor:
+        for result in executor.map(mutate, files_to_mutate):
+            print(f" |- {result.filename}: {_get_statuses_str(result) or 'no mutant'} "
+                  f"({'unchanged, cached' if result.cached else f'{result.duration:.2f}s'})")
+            results.append(result)
+    rmtree(arguments.work_path, ignore_errors=True)
+
+    write_reports(report_path, results)
+    returncode: int = 0
+    for result in results:
+        returncode |= result.returncode
+    return returncode
+
+
+def write_reports(report_path: Path, results: list[FileResult]) -> None:
+    """
+    Write the summary.json, timing.json and html/index.html reports then print the slowest mutants and tests
+    :param report_path: the report directory
+    :param results: the mutation results of each file
+    """
+    report_path.mkdir(parents=True, exist_ok=True)
+    report_path.joinpath('summary.json').write_text(dumps({
+        result.filename: {'returncode': result.returncode, 'statuses': result.statuses, 'cached': result.cached}
+        for result in results
+    }, indent=2), encoding='UTF-8')
+
+    timings: Final[list[dict[str, Any]]] = sorted(
+        (timing for result in results for timing in result.timings), key=lambda timing: timing['duration'], reverse=True
+    )
+    report_path.joinpath('timing.json').write_text(dumps(timings, indent=2), encoding='UTF-8')
+
+    html_path: Final[Path] = report_path.joinpath('html')
+    html_path.mkdir(parents=True, exist_ok=True)
+    html_path.joinpath('index.html').write_text(
+        "<html><body><h1>Mutation testing report</h1><table><tr><th>File</th><th>Mutants</th></tr>" + ''.join(
+            f"<tr><td><a href=\"{escape(result.filename)}.html\">{escape(result.filename)}</a></td>"
+            f"<td>{escape(_get_statuses_str(result))}</td></tr>" for result in results
+        ) + "</table></body></html>", encoding='UTF-8'
+    )
+
+    if timings:
+        print(f"\nSLOWEST MUTANTS (see {report_path.joinpath('timing.json')}):")
+        for timing in timings[:SLOWEST_COUNT]:
+            print(f"  {timing['duration']:8.3f}s  {timing['filename']}:{timing['line_number']} "
+                  f"(mutant {timing['index']}, {timing['tests']} test(s))")
+        test_durations: Final[dict[str, list[float]]] = {}
+        for timing in timings:
+            for test in timing['slowest_tests']:
+                test_durations.setdefault(test['node_id'], []).append(test['duration'])
+        print("SLOWEST TESTS (total duration over the mutant runs):")
+        slowest_tests: Final = sorted(test_durations.items(), key=lambda item: sum(item[1]), reverse=True)
+        for node_id, durations in slowest_tests[:SLOWEST_COUNT]:
+            print(f"  {sum(durations):8.3f}s  {node_id} ({len(durations)} run(s))")
+
+
+def _get_statuses_str(result: FileResult) -> str:
+    return ', '.join(f"{status}={count}" for status, count in sorted(result.statuses.items()))
+
+
+if __name__ == '__main__':  # pragma: no mutate
+    sys_exit(main(sys_argv[1:]))
@@ -0,0 +1,45 @@
+"""
+pytest plugin (-p mutation_timing) appending the duration of each mutant test run (and of its slowest tests) as a json
+line to the MUTATION_TIMING_FILE file. Runs which are not testing a mutant (ie: the mutmut baseline) are ignored.
+"""
+from json import dumps
+from os import environ
+from time import perf_counter
+from typing import Any, Final
+
+from mutmut_config import MUTANT_ENV_VAR
+
+TIMING_FILE_ENV_VAR: Final[str] = 'MUTATION_TIMING_FILE'
+SLOWEST_TESTS_COUNT: Final[int] = 5
+
+_test_durations: Final[dict[str, float]] = {}
+_start: list[float] = []
+
+
+def pytest_sessionstart(session: Any) -> None:  # pylint: disable=unused-argument
+    _start.append(perf_counter())
+
+
+def pytest_runtest_logreport(report: Any) -> None:
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session: Any, exitstatus: int) -> None:  # pylint: disable=unused-argument
+    mutant: Final[str | None] = environ.get(MUTANT_ENV_VAR)
+    timing_file: Final[str | None] = environ.get(TIMING_FILE_ENV_VAR)
+    if not (mutant and timing_file and _start):
+        return
+    filename, line_number, index = mutant.rsplit(':', 2)
+    slowest_tests: Final[list[tuple[str, float]]] = sorted(
+        _test_durations.items(), key=lambda item: item[1], reverse=True
+    )[:SLOWEST_TESTS_COUNT]
+    with open(timing_file, 'a', encoding='UTF-8') as file:
+        file.write(dumps({
+            'filename': filename,
+            'line_number': int(line_number),
+            'index': int(index),
+            'duration': perf_counter() - _start[0],
+            'tests': len(_test_durations),
+            'killed': int(exitstatus) != 0,
+            'slowest_tests': [{'node_id': node_id, 'duration': duration} for node_id, duration in slowest_tests]
+        }) + '\n')
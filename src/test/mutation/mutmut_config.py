@@ -0,0 +1,48 @@
+"""
+mutmut (2.x) hooks loaded from the PYTHONPATH by each mutmut run of the mutation_runner module:
+- only the tests which cover the mutated line are run (from the coverage data collected with test function contexts)
+- the mutant under test is exported so that the mutation_timing pytest plugin can time it
+"""
+from os import environ, path as os_path
+from shlex import quote
+from typing import Any, Final
+
+MUTANT_ENV_VAR: Final[str] = 'MUTATION_MUTANT'
+TESTS_PATH: Final[str] = 'src/test/python'
+MAX_SELECTED_TESTS: Final[int] = 200
+
+
+def pre_mutation(context: Any) -> None:
+    line_number: Final[int] = context.mutation_id.line_number + 1
+    environ[MUTANT_ENV_VAR] = f"{context.filename}:{line_number}:{context.mutation_id.index}"
+    node_ids: Final[list[str] | None] = _get_covering_tests(context.config.coverage_data, context.filename, line_number)
+    if node_ids:
+        context.config.test_command = f"{context.config.test_command} {' '.join(map(quote, node_ids))}"
+
+
+def _get_covering_tests(
+        coverage_data: dict[str, dict[int, list[str]]] | None, filename: str, line_number: int
+) -> list[str] | None:
+    # None means that the whole test suite must be run
+    if not coverage_data:
+        return None
+    contexts: Final[list[str]] = coverage_data.get(os_path.abspath(filename), {}).get(line_number, [])
+    if not contexts or '' in contexts or len(contexts) > MAX_SELECTED_TESTS:
+        return None  # Not covered by a test function (ie: executed at import time)
+    node_ids: Final[list[str]] = []
+    for test_context in sorted(contexts):
+        node_id: str | None = _to_node_id(test_context)
+        if node_id is None:
+            return None
+        node_ids.append(node_id)
+    return node_ids
+
+
+def _to_node_id(test_context: str) -> str | None:
+    # "pkg.test_module.TestClass.TestNested.test_function" -> "<TESTS_PATH>/pkg/test_module.py::TestClass::..."
+    parts: Final[list[str]] = test_context.split('.')
+    for index in range(len(parts) - 1, 0, -1):
+        module_path: str = os_path.join(TESTS_PATH, *parts[:index]) + '.py'
+        if os_path.isfile(module_path):
+            return '::'.join([module_path, *parts[index:]])
+    return None
@@ -0,0 +1,31 @@
+"""Shared test fixtures"""
+from collections.abc import Callable
+from pathlib import Path
+from uuid import uuid4
+
+from pytest import fixture, MonkeyPatch
+
+
+@fixture
+def tmp_resource_package(tmp_path: Path, monkeypatch: MonkeyPatch) -> Callable[[dict[str, str | bytes]], str]:
+    """
+    Factory creating an importable resource package (in a temporary directory) from a {file name: content} dict
+    :return: the factory which returns the created package name
+    """
+
+    def create(resources: dict[str, str | bytes]) -> str:
+        package_name: str = f"tmp_rsrc_{uuid4().hex}"
+        package_path: Path = tmp_path.joinpath(package_name)
+        package_path.mkdir()
+        package_path.joinpath('__init__.py').touch()
+        for file_name, content in resources.items():
+            file_path: Path = package_path.joinpath(file_name)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                file_path.write_bytes(content)
+            else:
+                file_path.write_text(content, encoding='UTF-8')
+        monkeypatch.syspath_prepend(tmp_path.as_posix())
+        return package_name
+
+    return create
@@ -0,0 +1,70 @@
+"""EmbeddedResources tests"""
+from collections.abc import Callable
+from importlib.resources import files
+from pathlib import Path
+from types import ModuleType
+from typing import Final
+
+from hellopymsdl.service.EmbeddedResources import EMBEDDED_FILE_NAME, load_embedded_resources, \
+    write_embedded_resources
+
+
+def _package_path(package_name: str) -> Path:
+    return Path(str(files(package_name)))
+
+
+class TestEmbeddedResources:
+    """EmbeddedResources Tests"""
+
+    class TestNominalCase:
+
+        def test_written_resources__should__be_loaded_as_raw_contents(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When resources are embedded, loading them should return their raw content (missing ones ignored)"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"message.txt": "Hello\r\n", "sub/bin": b"\x00\xff"})
+
+            # WHEN
+            module_path: Final[Path | None] = write_embedded_resources(
+                _package_path(package_name), ["message.txt", "sub/bin", "missing.txt"]
+            )
+
+            # THEN
+            assert module_path == _package_path(package_name).joinpath(EMBEDDED_FILE_NAME)
+            assert {"message.txt": b"Hello\r\n", "sub/bin": b"\x00\xff"} == load_embedded_resources(package_name)
+
+        def test_package_module__should__be_loaded_like_its_name(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the resource package is given as a module, should load the same resources as with its name"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"message.txt": "Hello"})
+            write_embedded_resources(_package_path(package_name), ["message.txt"])
+            package: Final[ModuleType] = __import__(package_name)
+
+            # WHEN / THEN
+            assert {"message.txt": b"Hello"} == load_embedded_resources(package)
+
+        def test_nothing_to_embed__should__not_write_module(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When no given resource exists, should not write the module and load nothing"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"message.txt": "Hello"})
+
+            # WHEN
+            module_path: Final[Path | None] = write_embedded_resources(_package_path(package_name), ["missing.txt"])
+
+            # THEN
+            assert module_path is None
+            assert not _package_path(package_name).joinpath(EMBEDDED_FILE_NAME).exists()
+            assert {} == load_embedded_resources(package_name)
+
+    class TestErrorCase:
+
+        def test_unknown_package__should__load_nothing(self) -> None:
+            """When the resource package doesn't exist, should load nothing (the error comes from the resource lookup)"""
+            # WHEN / THEN
+            assert {} == load_embedded_resources("unknown_rsrc_package")
+            assert {} == load_embedded_resources("")
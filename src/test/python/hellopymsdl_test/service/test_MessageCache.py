@@ -0,0 +1,182 @@
+"""MessageCache tests"""
+from pathlib import Path
+from sys import getsizeof
+from typing import Final
+
+from pytest import raises
+
+from hellopymsdl.service.MessageCache import MessageCache, FileStamp, CacheStats
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMessageCache:
+    """MessageCache Tests"""
+
+    class TestLookup:
+        """lookup / store methods tests"""
+
+        class TestNominalCase:
+
+            def test_stored_message__should__be_returned_and_counted_as_hit(self) -> None:
+                """When a message is stored, lookup should return it and count a hit"""
+                # GIVEN
+                cache: Final[MessageCache] = MessageCache()
+                cache.store("key", "message")
+
+                # WHEN
+                message: str | None = cache.lookup("key")
+
+                # THEN
+                assert "message" == message
+                assert 1 == cache.stats.hits
+                assert 0 == cache.stats.misses
+
+            def test_missing_message__should__return_none_and_count_a_miss(self) -> None:
+                """When a message is not stored, lookup should return None and count a miss"""
+                # GIVEN
+                cache: Final[MessageCache] = MessageCache()
+
+                # WHEN
+                message: str | None = cache.lookup("key")
+
+                # THEN
+                assert message is None
+                assert CacheStats(0, 1, 0, 0, 0, 0) == cache.stats
+
+            def test_exceeded_max_bytes__should__evict_least_recently_used(self) -> None:
+                """When the byte budget is exceeded, the least recently used messages should be evicted"""
+                # GIVEN
+                cache: Final[MessageCache] = MessageCache(max_bytes=2 * getsizeof("1" * 10))
+                cache.store("first", "1" * 10)
+                cache.store("second", "2" * 10)
+                cache.lookup("first")
+
+                # WHEN
+                cache.store("third", "3" * 10)
+
+                # THEN
+                assert cache.lookup("second") is None
+                assert "1" * 10 == cache.lookup("first")
+                assert "3" * 10 == cache.lookup("third")
+                assert 1 == cache.stats.evictions
+                assert cache.stats.size_bytes <= cache.max_bytes
+
+            def test_message_bigger_than_max_bytes__should__not_be_cached(self) -> None:
+                """When a message is bigger than the byte budget, it should not be cached"""
+                # GIVEN
+                cache: Final[MessageCache] = MessageCache(max_bytes=100)
+
+                # WHEN
+                cache.store("key", "x" * 1000)
+
+                # THEN
+                assert cache.lookup("key") is None
+                assert 0 == cache.stats.size_bytes
+
+            def test_expired_ttl__should__invalidate_message(self) -> None:
+                """When the ttl is exceeded, the message should be invalidated"""
+                # GIVEN
+                clock: Final[FakeClock] = FakeClock()
+                cache: Final[MessageCache] = MessageCache(ttl=10, clock=clock)
+                cache.store("key", "message")
+                clock.now = 9.9
+                assert "message" == cache.lookup("key")
+
+                # WHEN
+                clock.now = 10.0
+                message: str | None = cache.lookup("key")
+
+                # THEN
+                assert message is None
+                assert 1 == cache.stats.invalidations
+                assert 0 == cache.stats.entries
+
+            def test_modified_file__should__invalidate_message(self, tmp_path: Path) -> None:
+                """When the resource file mtime/size changed, the message should be invalidated"""
+                # GIVEN
+                resource: Final[Path] = tmp_path.joinpath("message.txt")
+                resource.write_text("message")
+                cache: Final[MessageCache] = MessageCache()
+                cache.store("key", "message", FileStamp.of(resource))
+                assert "message" == cache.lookup("key")
+
+                # WHEN
+                resource.write_text("updated message")
+                message: str | None = cache.lookup("key")
+
+                # THEN
+                assert message is None
+                assert 1 == cache.stats.invalidations
+
+            def test_modified_file_without_check_files__should__keep_message(self, tmp_path: Path) -> None:
+                """When check_files is disabled, a modified resource file should not invalidate the message"""
+                # GIVEN
+                resource: Final[Path] = tmp_path.joinpath("message.txt")
+                resource.write_text("message")
+                cache: Final[MessageCache] = MessageCache(check_files=False)
+                cache.store("key", "message", FileStamp.of(resource))
+
+                # WHEN
+                resource.write_text("updated message")
+
+                # THEN
+                assert "message" == cache.lookup("key")
+
+            def test_invalidate__should__remove_messages(self) -> None:
+                """When invalidate is called, the given message (or all messages if None) should be removed"""
+                # GIVEN
+                cache: Final[MessageCache] = MessageCache()
+                cache.store("first", "1")
+                cache.store("second", "2")
+                cache.store("third", "3")
+
+                # WHEN
+                cache.invalidate("first")
+                cache.invalidate("unknown")
+
+                # THEN
+                assert 2 == cache.stats.entries
+                cache.invalidate()
+                assert CacheStats(0, 0, 0, 3, 0, 0) == cache.stats
+
+        class TestErrorCase:
+            def test_non_positive_max_bytes__should__raise_valueerror(self) -> None:
+                """When max_bytes is not positive, should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    MessageCache(max_bytes=0)
+
+            def test_non_positive_ttl__should__raise_valueerror(self) -> None:
+                """When ttl is not positive, should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    MessageCache(ttl=0)
+
+    class TestFileStamp:
+        """FileStamp tests"""
+
+        def test_non_path_resource__should__return_none(self) -> None:
+            """When the resource is not on a real filesystem, should return None"""
+            # GIVEN / WHEN / THEN
+            # noinspection PyTypeChecker
+            assert FileStamp.of("message.txt") is None
+
+        def test_deleted_file__should__be_stale(self, tmp_path: Path) -> None:
+            """When the resource file is deleted, the stamp should be stale"""
+            # GIVEN
+            resource: Final[Path] = tmp_path.joinpath("message.txt")
+            resource.write_text("message")
+            stamp: Final[FileStamp | None] = FileStamp.of(resource)
+
+            # WHEN
+            resource.unlink()
+
+            # THEN
+            assert stamp is not None and stamp.is_stale()
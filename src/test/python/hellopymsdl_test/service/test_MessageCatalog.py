@@ -0,0 +1,146 @@
+"""MessageCatalog tests"""
+from collections.abc import Callable
+from importlib.resources import files
+from typing import Final
+from unittest.mock import patch
+
+from pytest import raises
+
+from hellopymsdl.service.MessageCatalog import MessageCatalog, normalize_locale, fallback_chain
+from hellopymsdl.service.MessageService import MessageService
+
+
+class TestMessageCatalog:
+    """MessageCatalog Tests"""
+    _CATALOG: Final[MessageCatalog] = MessageCatalog(MessageService("hellopymsdl_test_rsrc"))
+
+    class TestGetMessage:
+        """get_message method tests"""
+
+        class TestNominalCase:
+
+            def test_existing_locale__should__return_localized_message(self) -> None:
+                """When the locale variant exists, should return the localized message"""
+                # GIVEN / WHEN / THEN
+                assert "Un message de test du Quebec" == \
+                       TestMessageCatalog._CATALOG.get_message("test_message.txt", locale="fr_CA")
+                assert "Un message de test du Quebec" == \
+                       TestMessageCatalog._CATALOG.get_message("test_message.txt", locale="fr-ca.UTF-8")
+
+            def test_missing_region__should__fallback_to_language(self) -> None:
+                """When the locale variant doesn't exist, should fallback to the language variant"""
+                # GIVEN / WHEN / THEN
+                assert "Un message de test" == TestMessageCatalog._CATALOG.get_message("test_message.txt", "fr_BE")
+
+            def test_missing_language__should__fallback_to_default_message(self) -> None:
+                """When no locale variant exists, should fallback to the default message"""
+                # GIVEN / WHEN / THEN
+                assert "A test message" == TestMessageCatalog._CATALOG.get_message("test_message.txt", "de_DE")
+                assert "A test message" == TestMessageCatalog._CATALOG.get_message("test_message.txt")
+
+            def test_default_locale__should__be_used_when_no_locale(self) -> None:
+                """When no locale is given, should use the catalog default locale"""
+                # GIVEN
+                catalog: Final[MessageCatalog] = MessageCatalog(MessageService("hellopymsdl_test_rsrc"), "fr")
+
+                # WHEN / THEN
+                assert "Un message de test" == catalog.get_message("test_message.txt")
+                assert "A test message" == catalog.get_message("test_message.txt", "en")
+
+            def test_resolutions__should__not_probe_resources(self) -> None:
+                """When messages are resolved (misses included), the resource package should not be listed again"""
+                # GIVEN
+                catalog: Final[MessageCatalog] = MessageCatalog(MessageService("hellopymsdl_test_rsrc"))
+
+                # WHEN
+                with patch.object(MessageService, 'list_messages') as list_messages_mock:
+                    for _ in range(2):
+                        assert "test_message.fr_CA.txt" == catalog.resolve("test_message.txt", "fr_CA")
+                        with raises(FileNotFoundError):
+                            catalog.resolve("unknown_message.txt", "fr_CA")
+
+                # THEN
+                list_messages_mock.assert_not_called()
+                assert ["fr", "fr_CA"] == catalog.locales("test_message.txt")
+
+            def test_refresh__should__discover_new_variants(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When refresh is called, new locale variants should be discovered"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package(
+                    {"sub/message.txt": "Hello", "sub/message.fr.txt": "Salut"}
+                )
+                catalog: Final[MessageCatalog] = MessageCatalog(MessageService(package_name))
+                assert "Hello" == catalog.get_message("sub/message.txt", "es")
+                files(package_name).joinpath("sub/message.es.txt").write_text("Hola")  # type: ignore
+
+                # WHEN
+                catalog.refresh()
+
+                # THEN
+                assert "Hola" == catalog.get_message("sub/message.txt", "es")
+
+            def test_multi_dot_names__should__not_be_locale_variants(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a multi-dot file name middle suffix is not a known locale, it should be a message of its own"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package(
+                    {"data.tar.gz": b"archive", "notes.old.txt": "Old notes", "notes.de.txt": "Notizen"}
+                )
+
+                # WHEN
+                catalog: Final[MessageCatalog] = MessageCatalog(MessageService(package_name))
+
+                # THEN
+                assert "Old notes" == catalog.get_message("notes.old.txt")
+                assert "data.tar.gz" == catalog.resolve("data.tar.gz", "fr")
+                assert [] == catalog.locales("data.gz")
+                assert ["de"] == catalog.locales("notes.txt")
+
+            def test_render_message__should__render_localized_template(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message is rendered, should render the localized template"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"hi.txt": "Hi {name}", "hi.fr.txt": "Salut {name}"})
+
+                # WHEN / THEN
+                assert "Salut Bob" == \
+                       MessageCatalog(MessageService(package_name)).render_message("hi.txt", "fr", name="Bob")
+
+        class TestErrorCase:
+            def test_unknown_message__should__raise_filenotfounderror(self) -> None:
+                """When the message doesn't exist, should raise a FileNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(FileNotFoundError):
+                    TestMessageCatalog._CATALOG.get_message("unknown_message.txt", "fr")
+
+            def test_none_message__should__raise_typeerror(self) -> None:
+                """When the message is None, should raise a TypeError"""
+                # GIVEN / WHEN / THEN
+                with raises(TypeError):
+                    # noinspection PyTypeChecker
+                    TestMessageCatalog._CATALOG.get_message(None)  # type: ignore
+
+            def test_unknown_package__should__raise_modulenotfounderror(self) -> None:
+                """When the resource package doesn't exist, should raise a ModuleNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(ModuleNotFoundError):
+                    MessageCatalog(MessageService("unknown_test_rsrc"))
+
+    class TestLocales:
+        """normalize_locale and fallback_chain functions tests"""
+
+        def test_normalize_locale__should__normalize_case_and_separators(self) -> None:
+            """When a locale is normalized, should return a lower language, an upper region and a title script"""
+            # GIVEN / WHEN / THEN
+            assert "fr_CA" == normalize_locale("FR-ca.UTF-8")
+            assert "zh_Hant_TW" == normalize_locale("zh_hant_tw@variant")
+
+        def test_fallback_chain__should__end_with_default_message(self) -> None:
+            """When a fallback chain is computed, should go from the most to the least specific locale"""
+            # GIVEN / WHEN / THEN
+            assert ["zh_Hant_TW", "zh_Hant", "zh", None] == fallback_chain("zh_Hant_TW")
+            assert [None] == fallback_chain(None)
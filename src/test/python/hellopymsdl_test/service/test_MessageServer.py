@@ -0,0 +1,230 @@
+"""MessageServer tests"""
+from asyncio import (
+    CancelledError, Event, create_task, open_unix_connection, run as asyncio_run, sleep as asyncio_sleep, wait_for
+)
+from collections.abc import AsyncIterator, Callable
+from json import loads
+from pathlib import Path
+from typing import Any, Final
+from unittest.mock import patch
+
+from pytest import raises
+
+from hellopymsdl.service.MessageServer import MessageServer
+from hellopymsdl.service.MessageService import MessageService
+
+
+class _ListWriter:
+    """ResponseWriter collecting the responses"""
+
+    def __init__(self) -> None:
+        self.responses: list[dict[str, Any]] = []
+
+    def write(self, data: bytes) -> None:
+        self.responses.extend(loads(line) for line in data.splitlines())
+
+    async def drain(self) -> None:
+        pass
+
+
+async def _lines(*lines: bytes) -> AsyncIterator[bytes]:
+    for line in lines:
+        yield line
+
+
+class TestMessageServer:
+    """MessageServer Tests"""
+
+    class TestNominalCase:
+
+        def test_serve__should__answer_requests_in_order(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When serve requests, should write one response per (non blank) request in the request order"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A", "b.txt": "B"})
+            writer: Final[_ListWriter] = _ListWriter()
+
+            with MessageService(package_name) as message_service:
+                # WHEN
+                asyncio_run(MessageServer(message_service, max_pending=2).serve(
+                    _lines(b"b.txt\n", b"\n", b'{"id": 1, "name": "a.txt"}\n', b"unknown.txt\n", b"a.txt"), writer
+                ))
+
+            # THEN
+            assert writer.responses[:3] == [
+                {"name": "b.txt", "message": "B"},
+                {"id": 1, "name": "a.txt", "message": "A"},
+                {"name": "unknown.txt", "error": writer.responses[2]["error"]}
+            ]
+            assert writer.responses[2]["error"].startswith("FileNotFoundError")
+            assert writer.responses[3:] == [{"name": "a.txt", "message": "A"}]
+
+        def test_serve__should__bound_pending_requests(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the responses are not written, should not process more than max_pending requests"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+            started: Final[list[str]] = []
+
+            async def blocked_writer_scenario(message_service: MessageService) -> None:
+                unblocked: Event = Event()
+
+                class BlockedWriter(_ListWriter):
+                    async def drain(self) -> None:
+                        await unblocked.wait()
+
+                async def aget_message(message_file_name: str) -> str:
+                    started.append(message_file_name)
+                    return "A"
+
+                writer: BlockedWriter = BlockedWriter()
+                with patch.object(message_service, 'aget_message', side_effect=aget_message):
+                    serving = create_task(MessageServer(message_service, max_pending=3).serve(
+                        _lines(*(b"a.txt\n" for _ in range(10))), writer
+                    ))
+                    await asyncio_sleep(0.1)
+                    unwritten_while_blocked: int = len(started) - len(writer.responses)
+                    started_while_blocked: int = len(started)
+                    unblocked.set()
+                    await wait_for(serving, 5)
+                # max_pending queued requests + the one waiting for a queue slot, and the next requests are not read
+                assert unwritten_while_blocked == 4
+                assert started_while_blocked < 10
+                assert len(writer.responses) == 10
+
+            with MessageService(package_name) as message_service:
+                # WHEN / THEN
+                asyncio_run(blocked_writer_scenario(message_service))
+
+        def test_serve_unix__should__answer_socket_clients(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str], tmp_path: Path
+        ) -> None:
+            """When serve on a Unix socket, should answer each client and remove the socket once stopped"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+            socket_path: Final[str] = tmp_path.joinpath("hello.sock").as_posix()
+
+            async def client_scenario(server: MessageServer) -> list[bytes]:
+                serving = create_task(server.serve_unix(socket_path))
+                while not Path(socket_path).exists():
+                    await asyncio_sleep(0.01)
+                reader, writer = await open_unix_connection(socket_path)
+                writer.write(b"a.txt\nunknown.txt\n")
+                writer.write_eof()
+                responses: list[bytes] = [line async for line in reader]
+                writer.close()
+                serving.cancel()
+                with raises(CancelledError):
+                    await serving
+                return responses
+
+            with MessageService(package_name) as message_service:
+                # WHEN
+                responses: list[bytes] = asyncio_run(client_scenario(MessageServer(message_service)))
+
+            # THEN
+            assert loads(responses[0]) == {"name": "a.txt", "message": "A"}
+            assert loads(responses[1])["error"].startswith("FileNotFoundError")
+            assert not Path(socket_path).exists()
+
+    class TestErrorCase:
+
+        def test_invalid_max_pending__should__raise_valueerror(self) -> None:
+            """When max_pending is not positive, should raise a ValueError"""
+            # GIVEN / WHEN / THEN
+            with raises(ValueError):
+                MessageServer(MessageService(), max_pending=0)
+
+        def test_invalid_request__should__answer_error(self) -> None:
+            """When a request is not a valid JSON object request, should answer an error and go on"""
+            # GIVEN
+            writer: Final[_ListWriter] = _ListWriter()
+
+            with MessageService("hellopymsdl_test_rsrc") as message_service:
+                # WHEN
+                asyncio_run(MessageServer(message_service).serve(
+                    _lines(b"{invalid\n", b'{"id": 2}\n', b"test_message.txt\n"), writer
+                ))
+
+            # THEN
+            assert writer.responses[0]["error"].startswith("JSONDecodeError")
+            assert writer.responses[1]["id"] == 2 and writer.responses[1]["error"].startswith("KeyError")
+            assert writer.responses[2] == {"name": "test_message.txt", "message": "A test message"}
+
+        def test_path_traversal_request__should__answer_error(
+                self, tmp_path: Path, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When a request names a file outside of the resource package, should answer an error without reading it"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+            secret_path: Final[Path] = tmp_path / "secret.txt"
+            secret_path.write_text("secret")
+            writer: Final[_ListWriter] = _ListWriter()
+
+            with MessageService(package_name) as message_service:
+                # WHEN
+                asyncio_run(MessageServer(message_service).serve(
+                    _lines(
+                        f"{'../' * len(Path(str(message_service.get_resource_roots()[0])).parts)}{secret_path}\n".encode(),
+                        f"{secret_path}\n".encode(),
+                        b'{"name": "sub/../../a.txt"}\n',
+                        b"a.txt\n"
+                    ),
+                    writer
+                ))
+
+            # THEN
+            assert all(response["error"].startswith("ValueError") for response in writer.responses[:3])
+            assert all("secret" not in response.get("message", "") for response in writer.responses)
+            assert writer.responses[3] == {"name": "a.txt", "message": "A"}
+
+        def test_unexpected_message_error__should__answer_error(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When loading a message raises an unexpected error, should answer an error and go on"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+            writer: Final[_ListWriter] = _ListWriter()
+
+            async def aget_message(message_file_name: str) -> str:
+                if message_file_name == "broken.txt":
+                    raise RuntimeError("broken")
+                return "\udc80" if message_file_name == "surrogate.txt" else "A"
+
+            with MessageService(package_name) as message_service:
+                with patch.object(message_service, 'aget_message', side_effect=aget_message):
+                    # WHEN
+                    asyncio_run(MessageServer(message_service, max_pending=1).serve(
+                        _lines(b"broken.txt\n", b"surrogate.txt\n", b"a.txt\n"), writer
+                    ))
+
+            # THEN
+            assert writer.responses[0] == {"name": "broken.txt", "error": "RuntimeError: broken"}
+            assert writer.responses[1]["error"].startswith("UnicodeEncodeError")
+            assert writer.responses[2] == {"name": "a.txt", "message": "A"}
+
+        def test_failing_writer__should__stop_reading_requests(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the response writer fails, should stop reading the requests instead of blocking on max_pending"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+            read_requests: Final[list[bytes]] = []
+
+            class FailingWriter(_ListWriter):
+                def write(self, data: bytes) -> None:
+                    raise RuntimeError("broken writer")
+
+            async def requests() -> AsyncIterator[bytes]:
+                for _ in range(100):
+                    read_requests.append(b"a.txt\n")
+                    yield b"a.txt\n"
+
+            with MessageService(package_name) as message_service:
+                # WHEN
+                asyncio_run(wait_for(MessageServer(message_service, max_pending=2).serve(requests(), FailingWriter()), 5))
+
+            # THEN
+            assert len(read_requests) < 100
@@ -1,9 +1,21 @@
 """MessageService tests"""
-from typing import Final
+from asyncio import run as asyncio_run
+from collections.abc import Callable, Iterator
+from importlib.resources import files
+from mmap import mmap
+from pathlib import Path
+from tracemalloc import start as tracemalloc_start, stop as tracemalloc_stop, \
+    get_traced_memory as tracemalloc_get_traced_memory
+from typing import Final, IO
+from unittest.mock import patch
+from zipfile import ZipFile
 
-from pytest import raises
+from pytest import raises, MonkeyPatch
 
+from hellopymsdl.service.EmbeddedResources import write_embedded_resources
+from hellopymsdl.service.MessageCache import MessageCache
 from hellopymsdl.service.MessageService import MessageService
+from hellopymsdl.service.MessageTemplate import MessageTemplate
 
 
 class TestMessageService:
@@ -64,3 +76,603 @@ class TestMessageService:
                 with raises(TypeError):
                     # noinspection PyTypeChecker
                     TestMessageService._MESSAGE_SERVICE.get_message(None)
+
+    class TestCachedGetMessage:
+        """get_message method with cache tests"""
+
+        class TestNominalCase:
+
+            def test_cached_resource__should__not_be_read_again(self) -> None:
+                """When a cached resource is requested again, should return the cached message"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+                first_message: Final[str] = message_service.get_message("test_message.txt")
+
+                # WHEN
+                with patch.object(MessageService, '_read') as read_mock:
+                    message: str = message_service.get_message("test_message.txt")
+
+                # THEN
+                assert "A test message" == first_message
+                assert first_message is message
+                read_mock.assert_not_called()
+                assert message_service.cache is not None
+                assert 1 == message_service.cache.stats.hits
+                assert 1 == message_service.cache.stats.misses
+
+            def test_updated_resource__should__return_new_message(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a cached resource file is updated, should return the new message"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"message.txt": "message"})
+                message_service: Final[MessageService] = MessageService(package_name, MessageCache())
+                assert "message" == message_service.get_message("message.txt")
+
+                # WHEN
+                files(package_name).joinpath("message.txt").write_text("updated message")  # type: ignore
+                message: str = message_service.get_message("message.txt")
+
+                # THEN
+                assert "updated message" == message
+
+        class TestErrorCase:
+            def test_resource_not_exists__should__raise_filenotfounderror(self) -> None:
+                """When resource is doesn't exist, should raise a FileNotFoundError"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+
+                # WHEN / THEN
+                with raises(FileNotFoundError):
+                    message_service.get_message("unknown_message.txt")
+
+            def test_none_resource__should__raise_typeerror(self) -> None:
+                """When resource is None, should raise an TypeError"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+
+                # WHEN / THEN
+                with raises(TypeError):
+                    # noinspection PyTypeChecker
+                    message_service.get_message(None)
+
+    class TestGetMessages:
+        """get_messages method tests"""
+
+        class TestNominalCase:
+
+            def test_resources_exist__should__return_messages_in_order(self) -> None:
+                """When resources exist, should return a {file name: message} dict in the given order"""
+                # GIVEN / WHEN
+                messages: Final[dict[str, str]] = TestMessageService._MESSAGE_SERVICE.get_messages(
+                    ["test_message.txt", "__init__.py", "test_message.txt"]
+                )
+
+                # THEN
+                assert ["test_message.txt", "__init__.py"] == list(messages)
+                assert "A test message" == messages["test_message.txt"]
+
+            def test_return_exceptions__should__report_errors_per_file_name(self) -> None:
+                """When return_exceptions is True, errors should be reported per file name"""
+                # GIVEN / WHEN
+                # noinspection PyTypeChecker
+                messages: Final[dict[str, str | Exception]] = TestMessageService._MESSAGE_SERVICE.get_messages(
+                    ["test_message.txt", "unknown_message.txt", None], return_exceptions=True  # type: ignore
+                )
+
+                # THEN
+                assert "A test message" == messages["test_message.txt"]
+                assert isinstance(messages["unknown_message.txt"], FileNotFoundError)
+                assert isinstance(messages[None], TypeError)  # type: ignore
+
+            def test_unknown_package_with_return_exceptions__should__report_errors_per_file_name(self) -> None:
+                """When resource package doesn't exist and return_exceptions is True, should report it per file name"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("unknown_test_rsrc")
+
+                # WHEN
+                messages: Final[dict[str, str | Exception]] = message_service.get_messages(
+                    ["test_message.txt", "other_message.txt"], return_exceptions=True
+                )
+
+                # THEN
+                assert ["test_message.txt", "other_message.txt"] == list(messages)
+                assert all(isinstance(error, ModuleNotFoundError) for error in messages.values())
+
+        class TestErrorCase:
+            def test_resource_package_not_exists__should__raise_modulenotfounderror(self) -> None:
+                """When resource package doesn't exist, should raise a ModuleNotFoundError"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("unknown_test_rsrc")
+
+                # WHEN / THEN
+                with raises(ModuleNotFoundError):
+                    message_service.get_messages(["test_message.txt"])
+
+            def test_resource_not_exists__should__raise_filenotfounderror(self) -> None:
+                """When a resource doesn't exist, should raise a FileNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(FileNotFoundError):
+                    TestMessageService._MESSAGE_SERVICE.get_messages(["test_message.txt", "unknown_message.txt"])
+
+            def test_none_resource__should__raise_typeerror(self) -> None:
+                """When a resource is None, should raise an TypeError"""
+                # GIVEN / WHEN / THEN
+                with raises(TypeError):
+                    # noinspection PyTypeChecker
+                    TestMessageService._MESSAGE_SERVICE.get_messages([None])  # type: ignore
+
+    class TestAsyncGetMessages:
+        """aget_message and aget_messages methods tests"""
+
+        class TestNominalCase:
+
+            def test_aget_message__should__return_message(self) -> None:
+                """When resource exists, aget_message should return the resource message"""
+                # GIVEN
+                with MessageService("hellopymsdl_test_rsrc", max_workers=2) as message_service:
+                    # WHEN
+                    message: str = asyncio_run(message_service.aget_message("test_message.txt"))
+
+                # THEN
+                assert "A test message" == message
+
+            def test_aget_messages__should__return_messages(self) -> None:
+                """When resources exist, aget_messages should return a {file name: message} dict in the given order"""
+                # GIVEN
+                with MessageService("hellopymsdl_test_rsrc", max_workers=2) as message_service:
+                    # WHEN
+                    messages: dict[str, str] = asyncio_run(
+                        message_service.aget_messages(["__init__.py", "test_message.txt", "__init__.py"])
+                    )
+
+                # THEN
+                assert ["__init__.py", "test_message.txt"] == list(messages)
+                assert "A test message" == messages["test_message.txt"]
+
+            def test_aget_messages_with_return_exceptions__should__report_errors_per_file_name(self) -> None:
+                """When return_exceptions is True, aget_messages should report errors per file name"""
+                # GIVEN
+                with MessageService("hellopymsdl_test_rsrc") as message_service:
+                    # WHEN
+                    messages: dict[str, str | Exception] = asyncio_run(
+                        message_service.aget_messages(["test_message.txt", "unknown.txt"], return_exceptions=True)
+                    )
+
+                # THEN
+                assert "A test message" == messages["test_message.txt"]
+                assert isinstance(messages["unknown.txt"], FileNotFoundError)
+
+        class TestErrorCase:
+            def test_resource_package_not_exists__should__raise_modulenotfounderror(self) -> None:
+                """When resource package doesn't exist, aget_message should raise a ModuleNotFoundError"""
+                # GIVEN
+                with MessageService("unknown_test_rsrc") as message_service:
+                    # WHEN / THEN
+                    with raises(ModuleNotFoundError):
+                        asyncio_run(message_service.aget_message("test_message.txt"))
+
+            def test_resource_not_exists__should__raise_filenotfounderror(self) -> None:
+                """When a resource doesn't exist, aget_messages should raise a FileNotFoundError"""
+                # GIVEN
+                with MessageService("hellopymsdl_test_rsrc") as message_service:
+                    # WHEN / THEN
+                    with raises(FileNotFoundError):
+                        asyncio_run(message_service.aget_messages(["test_message.txt", "unknown_message.txt"]))
+
+    class TestStreamingAndRawMessages:
+        """iter_message, get_message_bytes and get_message_view methods tests"""
+
+        class TestNominalCase:
+
+            def test_iter_message__should__not_split_multibyte_characters(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message is streamed by chunks, chunks should contain whole decoded characters"""
+                # GIVEN
+                text: Final[str] = "héllo wörld ✓ " * 100
+                package_name: Final[str] = tmp_resource_package({"message.txt": text.encode("UTF-8")})
+                message_service: Final[MessageService] = MessageService(package_name)
+
+                # WHEN
+                chunks: Final[list[str]] = list(
+                    message_service.iter_message("message.txt", chunk_size=7, encoding="UTF-8")
+                )
+
+                # THEN
+                assert text == ''.join(chunks)
+                assert all(len(chunk) <= 7 for chunk in chunks)
+
+            def test_iter_message_by_lines__should__yield_lines(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message is streamed by lines, should yield each line"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"message.txt": "first\nsecond\nthird"})
+
+                # WHEN
+                lines: Final[list[str]] = list(MessageService(package_name).iter_message("message.txt", lines=True))
+
+                # THEN
+                assert ["first\n", "second\n", "third"] == lines
+
+            def test_iter_message__should__keep_memory_flat(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a big message is streamed, the allocated memory should not depend on the message size"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"big.txt": "x" * (16 * 1024 * 1024)})
+                message_service: Final[MessageService] = MessageService(package_name)
+
+                # WHEN
+                tracemalloc_start()
+                try:
+                    size: int = sum(len(chunk) for chunk in message_service.iter_message("big.txt"))
+                    peak: int = tracemalloc_get_traced_memory()[1]
+                finally:
+                    tracemalloc_stop()
+
+                # THEN
+                assert 16 * 1024 * 1024 == size
+                assert peak < 1024 * 1024
+
+            def test_iter_message__should__open_the_resource_lazily_and_close_it_with_the_iterator(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message iterator is created then closed, the resource should be opened on the first iteration
+                and closed with the iterator"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"message.txt": "A streamed message"})
+                opened_files: Final[list[IO[str]]] = []
+                path_open: Final[Callable[..., IO[str]]] = Path.open
+
+                def tracking_open(path: Path, *args, **kwargs) -> IO[str]:
+                    opened_files.append(path_open(path, *args, **kwargs))
+                    return opened_files[-1]
+
+                with patch.object(Path, "open", tracking_open):
+                    # WHEN
+                    chunks: Iterator[str] = MessageService(package_name).iter_message("message.txt", chunk_size=1)
+
+                    # THEN
+                    assert not opened_files
+                    assert "A" == next(chunks)
+                    chunks.close()  # type: ignore
+                    assert 1 == len(opened_files)
+                    assert opened_files[0].closed
+
+            def test_get_message_bytes__should__return_raw_message(self) -> None:
+                """When resource exists, get_message_bytes should return the raw resource content"""
+                # GIVEN / WHEN / THEN
+                assert b"A test message" == TestMessageService._MESSAGE_SERVICE.get_message_bytes("test_message.txt")
+
+            def test_get_message_view_on_filesystem__should__map_the_resource(self) -> None:
+                """When resource is on a real filesystem, get_message_view should return a memory mapped view"""
+                # GIVEN / WHEN
+                view: Final[memoryview] = TestMessageService._MESSAGE_SERVICE.get_message_view("test_message.txt")
+
+                # THEN
+                assert isinstance(view.obj, mmap)
+                assert view.readonly
+                assert b"A test message" == view.tobytes()
+
+            def test_get_message_view_on_empty_file__should__return_empty_view(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When resource is empty, get_message_view should return an empty view"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"empty.txt": b""})
+
+                # WHEN / THEN
+                assert 0 == len(MessageService(package_name).get_message_view("empty.txt"))
+
+            def test_get_message_view_in_zip__should__read_the_resource(
+                    self, tmp_path: Path, monkeypatch: MonkeyPatch
+            ) -> None:
+                """When resource is packed in a zip, get_message_view should return an in memory view"""
+                # GIVEN
+                zip_path: Final[Path] = tmp_path.joinpath("resources.zip")
+                with ZipFile(zip_path, 'w') as zip_file:
+                    zip_file.writestr("zipped_test_rsrc/__init__.py", "")
+                    zip_file.writestr("zipped_test_rsrc/message.txt", "A zipped message")
+                monkeypatch.syspath_prepend(zip_path.as_posix())
+                message_service: Final[MessageService] = MessageService("zipped_test_rsrc")
+
+                # WHEN
+                view: Final[memoryview] = message_service.get_message_view("message.txt")
+
+                # THEN
+                assert not isinstance(view.obj, mmap)
+                assert b"A zipped message" == view.tobytes()
+                assert "A zipped message" == ''.join(message_service.iter_message("message.txt"))
+
+        class TestErrorCase:
+            def test_iter_unknown_resource__should__raise_filenotfounderror_on_call(self) -> None:
+                """When resource doesn't exist, iter_message should raise a FileNotFoundError before iterating"""
+                # GIVEN / WHEN / THEN
+                with raises(FileNotFoundError):
+                    TestMessageService._MESSAGE_SERVICE.iter_message("unknown_message.txt")
+
+            def test_non_positive_chunk_size__should__raise_valueerror(self) -> None:
+                """When chunk_size is not positive, iter_message should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    TestMessageService._MESSAGE_SERVICE.iter_message("test_message.txt", chunk_size=0)
+
+            def test_view_of_unknown_resource__should__raise_filenotfounderror(self) -> None:
+                """When resource doesn't exist, get_message_view should raise a FileNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(FileNotFoundError):
+                    TestMessageService._MESSAGE_SERVICE.get_message_view("unknown_message.txt")
+
+    class TestRenderMessage:
+        """render_message and get_template methods tests"""
+
+        class TestNominalCase:
+
+            def test_template_resource__should__be_rendered(self) -> None:
+                """When a template resource is rendered, should return the rendered message"""
+                # GIVEN / WHEN
+                message: Final[str] = TestMessageService._MESSAGE_SERVICE.render_message(
+                    "test_template.txt", name="Bob", count=3
+                )
+
+                # THEN
+                assert "Hello Bob, you have 3 new messages!" == message
+
+            def test_template_resource__should__be_compiled_once(self) -> None:
+                """When a template resource is rendered several times, it should be compiled once"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc", MessageCache())
+                template: Final[MessageTemplate] = message_service.get_template("test_template.txt")
+
+                # WHEN / THEN
+                assert template is message_service.get_template("test_template.txt")
+
+            def test_template_resource_without_cache__should__not_be_read_again(self) -> None:
+                """When a template resource is rendered again without message cache, its resource should not be read
+                again while it doesn't change"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService("hellopymsdl_test_rsrc")
+                template: Final[MessageTemplate] = message_service.get_template("test_template.txt")
+
+                # WHEN
+                with patch.object(MessageService, '_read') as read_mock:
+                    message: Final[str] = message_service.render_message("test_template.txt", name="Bob", count=3)
+
+                # THEN
+                assert "Hello Bob, you have 3 new messages!" == message
+                assert template is message_service.get_template("test_template.txt")
+                read_mock.assert_not_called()
+
+            def test_updated_template_resource__should__be_compiled_again(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a template resource is updated, it should be compiled again"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"template.html": "<p>{name}</p>"})
+                message_service: Final[MessageService] = MessageService(package_name, template_escape="html")
+                assert "<p>&lt;Bob&gt;</p>" == message_service.render_message("template.html", name="<Bob>")
+
+                # WHEN
+                files(package_name).joinpath("template.html").write_text("<h1>{name}</h1>")  # type: ignore
+                message: Final[str] = message_service.render_message("template.html", name="<Bob>")
+
+                # THEN
+                assert "<h1>&lt;Bob&gt;</h1>" == message
+
+        class TestErrorCase:
+            def test_missing_value__should__raise_keyerror(self) -> None:
+                """When a placeholder value is missing, should raise a KeyError"""
+                # GIVEN / WHEN / THEN
+                with raises(KeyError):
+                    TestMessageService._MESSAGE_SERVICE.render_message("test_template.txt", name="Bob")
+
+            def test_resource_not_exists__should__raise_filenotfounderror(self) -> None:
+                """When the template resource doesn't exist, should raise a FileNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(FileNotFoundError):
+                    TestMessageService._MESSAGE_SERVICE.render_message("unknown_template.txt")
+
+    class TestListMessages:
+        """list_messages method tests"""
+
+        class TestNominalCase:
+
+            def test_list_messages__should__return_nested_file_names(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When messages are listed, should return the sorted file names (sub-directories included)"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package(
+                    {"b.txt": "b", "sub/a.txt": "a", "__pycache__/x.pyc": b""}
+                )
+
+                # WHEN
+                message_file_names: Final[list[str]] = MessageService(package_name).list_messages()
+
+                # THEN
+                assert ["__init__.py", "b.txt", "sub/a.txt"] == message_file_names
+
+        class TestErrorCase:
+            def test_resource_package_not_exists__should__raise_modulenotfounderror(self) -> None:
+                """When resource package doesn't exist, should raise a ModuleNotFoundError"""
+                # GIVEN / WHEN / THEN
+                with raises(ModuleNotFoundError):
+                    MessageService("unknown_test_rsrc").list_messages()
+
+    class TestEmbeddedMessages:
+        """Messages embedded at build time (see EmbeddedResources) tests"""
+
+        class TestNominalCase:
+
+            def test_embedded_message__should__be_returned_without_resource_lookup(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message is embedded, should return it decoded like a resource (even if the file changed)"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"message.txt": "Embedded\r\nmessage"})
+                package_path: Final[Path] = Path(str(files(package_name)))
+                write_embedded_resources(package_path, ["message.txt"])
+                package_path.joinpath("message.txt").write_text("Changed", encoding="UTF-8")
+
+                # WHEN
+                message: Final[str] = MessageService(package_name).get_message("message.txt")
+
+                # THEN
+                assert "Embedded\nmessage" == message
+                assert "Changed" == MessageService(package_name, use_embedded=False).get_message("message.txt")
+                assert ["__init__.py", "message.txt"] == MessageService(package_name).list_messages()
+
+    class TestLayeredPackages:
+        """Ordered list of resource packages tests"""
+
+        class TestNominalCase:
+
+            def test_layered_packages__should__serve_message_from_first_package_containing_it(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When several packages are given, should serve each message from the first package containing it"""
+                # GIVEN
+                overrides: Final[str] = tmp_resource_package({"message.txt": "Override", "sub/custom.txt": "Custom"})
+                defaults: Final[str] = tmp_resource_package({"message.txt": "Default", "other.txt": "Other"})
+                message_service: Final[MessageService] = MessageService([overrides, defaults])
+
+                # WHEN
+                messages: Final[dict[str, str]] = message_service.get_messages(
+                    ["message.txt", "sub/custom.txt", "other.txt"]
+                )
+
+                # THEN
+                assert {"message.txt": "Override", "sub/custom.txt": "Custom", "other.txt": "Other"} == messages
+                assert b"Other" == message_service.get_message_bytes("other.txt")
+                assert ["__init__.py", "message.txt", "other.txt", "sub/custom.txt"] == message_service.list_messages()
+
+            def test_layered_packages_miss__should__not_lookup_resources(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When a message is in no package, should raise a FileNotFoundError from the index only"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService([
+                    tmp_resource_package({"a.txt": "A"}), tmp_resource_package({"b.txt": "B"})
+                ])
+                message_service.list_messages()
+
+                # WHEN / THEN
+                with patch("hellopymsdl.service.MessageService.MessageService._package_root") as package_root_mock:
+                    with raises(FileNotFoundError):
+                        message_service.get_message("unknown.txt")
+                package_root_mock.assert_not_called()
+
+            def test_refresh__should__index_new_messages_and_invalidate_cache(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When refresh after a message is added in a first package, should serve the new message"""
+                # GIVEN
+                overrides: Final[str] = tmp_resource_package({"a.txt": "A"})
+                defaults: Final[str] = tmp_resource_package({"message.txt": "Default"})
+                message_service: Final[MessageService] = MessageService([overrides, defaults], MessageCache())
+                assert "Default" == message_service.get_message("message.txt")
+                Path(str(files(overrides))).joinpath("message.txt").write_text("Override", encoding="UTF-8")
+
+                # WHEN
+                before_refresh: Final[str] = message_service.get_message("message.txt")
+                message_service.refresh()
+
+                # THEN
+                assert "Default" == before_refresh
+                assert "Override" == message_service.get_message("message.txt")
+
+            def test_layered_embedded_messages__should__follow_package_order(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When packages embed messages, should only serve the embedded messages of the package containing them"""
+                # GIVEN
+                overrides: Final[str] = tmp_resource_package({"message.txt": "Override"})
+                defaults: Final[str] = tmp_resource_package({"message.txt": "Default", "other.txt": "Other"})
+                write_embedded_resources(Path(str(files(defaults))), ["message.txt", "other.txt"])
+                Path(str(files(defaults))).joinpath("other.txt").write_text("Changed", encoding="UTF-8")
+
+                # WHEN
+                message_service: Final[MessageService] = MessageService([overrides, defaults])
+
+                # THEN
+                assert "Override" == message_service.get_message("message.txt")
+                assert "Other" == message_service.get_message("other.txt")
+
+        class TestErrorCase:
+
+            def test_unknown_layered_package__should__raise_modulenotfounderror(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When one of the packages doesn't exist, should raise a ModuleNotFoundError"""
+                # GIVEN
+                message_service: Final[MessageService] = MessageService(
+                    [tmp_resource_package({"a.txt": "A"}), "unknown_test_rsrc"]
+                )
+
+                # WHEN / THEN
+                with raises(ModuleNotFoundError):
+                    message_service.get_message("a.txt")
+
+            def test_not_str_message_file_name__should__raise_typeerror(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When the message file name is not a str, should raise a TypeError as a single package does"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"a.txt": "A"})
+                message_service: Final[MessageService] = MessageService([package_name, package_name])
+
+                # WHEN / THEN
+                with raises(TypeError):
+                    message_service.get_message(None)  # type: ignore[arg-type]
+                with raises(TypeError):
+                    MessageService(package_name).get_message(None)  # type: ignore[arg-type]
+
+    class TestInvalidate:
+        """invalidate and get_resource_roots methods tests"""
+
+        class TestNominalCase:
+
+            def test_invalidate__should__reload_only_given_messages(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When invalidate some messages of an unchecked cache, should only reload these messages"""
+                # GIVEN
+                package_name: Final[str] = tmp_resource_package({"a.txt": "A", "b.txt": "B"})
+                message_service: Final[MessageService] = MessageService(
+                    package_name, MessageCache(check_files=False)
+                )
+                message_service.get_messages(["a.txt", "b.txt"])
+                package_path: Final[Path] = Path(str(files(package_name)))
+                package_path.joinpath("a.txt").write_text("A2", encoding="UTF-8")
+                package_path.joinpath("b.txt").write_text("B2", encoding="UTF-8")
+
+                # WHEN
+                message_service.invalidate(["a.txt"])
+
+                # THEN
+                assert {"a.txt": "A2", "b.txt": "B"} == message_service.get_messages(["a.txt", "b.txt"])
+                message_service.invalidate()
+                assert "B2" == message_service.get_message("b.txt")
+
+            def test_invalidate_layered_packages__should__resolve_messages_again(
+                    self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+            ) -> None:
+                """When invalidate messages of layered packages, should serve them from the first package again"""
+                # GIVEN
+                overrides: Final[str] = tmp_resource_package({"message.txt": "Override"})
+                defaults: Final[str] = tmp_resource_package({"message.txt": "Default"})
+                message_service: Final[MessageService] = MessageService([overrides, defaults])
+                assert "Override" == message_service.get_message("message.txt")
+                Path(str(files(overrides))).joinpath("message.txt").unlink()
+                Path(str(files(overrides))).joinpath("new.txt").write_text("New", encoding="UTF-8")
+
+                # WHEN
+                message_service.invalidate(["message.txt", "new.txt"])
+
+                # THEN
+                assert "Default" == message_service.get_message("message.txt")
+                assert "New" == message_service.get_message("new.txt")
+                assert [Path(str(files(overrides))), Path(str(files(defaults)))] == \
+                    message_service.get_resource_roots()
@@ -0,0 +1,90 @@
+"""MessageTemplate tests"""
+from typing import Final
+
+from pytest import raises
+
+from hellopymsdl.service.MessageTemplate import MessageTemplate
+
+
+class User:
+    name: str = "<Bob>"
+
+
+class TestMessageTemplate:
+    """MessageTemplate Tests"""
+
+    class TestRender:
+        """render method tests"""
+
+        class TestNominalCase:
+
+            def test_template__should__render_like_str_format(self) -> None:
+                """When a template is rendered, should return the same result as str.format"""
+                # GIVEN
+                text: Final[str] = "{{Hi}} {user.name}! {items[0]} {count:03d} {ratio:.1%} {name!r} {value:>{width}}."
+                context: Final[dict[str, object]] = {
+                    "user": User(), "items": ["first"], "count": 7, "ratio": 0.25, "name": "bob", "value": 1, "width": 4
+                }
+
+                # WHEN
+                message: Final[str] = MessageTemplate(text).render(context)
+
+                # THEN
+                assert text.format(**context) == message
+
+            def test_context_and_kwargs__should__be_merged(self) -> None:
+                """When both context and kwargs are given, kwargs should override the context values"""
+                # GIVEN
+                template: Final[MessageTemplate] = MessageTemplate("{first} {second}")
+
+                # WHEN / THEN
+                assert "1 3" == template.render({"first": 1, "second": 2}, second=3)
+                assert "1 2" == template.render(first=1, second=2)
+
+            def test_html_escape__should__only_escape_placeholder_values(self) -> None:
+                """When the html escape mode is used, only placeholder values should be escaped"""
+                # GIVEN
+                template: Final[MessageTemplate] = MessageTemplate("<b>{user.name}</b> {name!r}", escape="html")
+
+                # WHEN / THEN
+                assert "<b>&lt;Bob&gt;</b> &#x27;&amp;&#x27;" == template.render(user=User(), name="&")
+
+            def test_url_and_shell_escapes__should__escape_placeholder_values(self) -> None:
+                """When the url or shell escape modes are used, placeholder values should be escaped"""
+                # GIVEN / WHEN / THEN
+                assert "/search?q=a%20b" == MessageTemplate("/search?q={q}", escape="url").render(q="a b")
+                assert "echo 'a b'" == MessageTemplate("echo {arg}", escape="shell").render(arg="a b")
+                assert "A!" == MessageTemplate("{value}!", escape=str.upper).render(value="a")
+
+            def test_fields__should__return_used_context_keys(self) -> None:
+                """When fields is called, should return each context key used by the template"""
+                # GIVEN / WHEN / THEN
+                assert {"user", "items", "value", "width"} == \
+                       MessageTemplate("{user.name} {items[0]} {value:>{width}} {user}").fields
+
+        class TestErrorCase:
+            def test_missing_value__should__raise_keyerror(self) -> None:
+                """When a placeholder value is missing, should raise a KeyError"""
+                # GIVEN / WHEN / THEN
+                with raises(KeyError):
+                    MessageTemplate("Hello {name}").render()
+
+            def test_positional_placeholder__should__raise_valueerror(self) -> None:
+                """When the template contains positional placeholders, should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    MessageTemplate("Hello {}")
+                with raises(ValueError):
+                    MessageTemplate("Hello {0}")
+
+            def test_unknown_escape_mode__should__raise_valueerror(self) -> None:
+                """When the escape mode is unknown, should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    MessageTemplate("Hello {name}", escape="unknown")
+
+            def test_malformed_template__should__raise_valueerror(self) -> None:
+                """When the template is malformed, should raise a ValueError"""
+                # GIVEN / WHEN / THEN
+                with raises(ValueError):
+                    MessageTemplate("Hello {name")
@@ -0,0 +1,198 @@
+"""ResourceBundle tests"""
+from collections.abc import Callable
+from importlib.resources import files
+from mmap import mmap
+from pathlib import Path
+from typing import Final
+from zipfile import ZipFile
+
+from pytest import raises, MonkeyPatch
+
+from hellopymsdl.service.EmbeddedResources import EMBEDDED_FILE_NAME
+from hellopymsdl.service.MessageService import MessageService
+from hellopymsdl.service.ResourceBundle import BUNDLE_FILE_NAME, ResourceBundle, write_bundle, main
+
+_RESOURCES: Final[dict[str, str | bytes]] = {
+    "message.txt": "A bundled message",
+    "big.txt": "x" * 4096,
+    "sub/nested.txt": "A nested message",
+    "empty.bin": b""
+}
+
+
+def _package_path(package_name: str) -> Path:
+    return Path(str(files(package_name)))
+
+
+class TestResourceBundle:
+    """ResourceBundle Tests"""
+
+    class TestNominalCase:
+
+        def test_written_bundle__should__contain_package_files(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When a bundle is written, it should contain each package file except the bundle itself"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+
+            # WHEN
+            bundle: Final[ResourceBundle] = ResourceBundle.open(write_bundle(package_path))
+
+            # THEN
+            assert ["__init__.py", "big.txt", "empty.bin", "message.txt", "sub/nested.txt"] == bundle.names()
+            assert b"A nested message" == bundle.view("sub/nested.txt").tobytes()
+            assert b"" == bundle.view("empty.bin").tobytes()
+            assert bundle.is_dir("sub")
+            assert not bundle.is_file("sub")
+
+        def test_compressed_bundle__should__return_decompressed_content(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When entries are compressed, the bundle should be smaller and return the original content"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+            raw_size: Final[int] = write_bundle(package_path).stat().st_size
+
+            # WHEN
+            bundle_path: Final[Path] = write_bundle(package_path, compress_entries=True)
+
+            # THEN
+            assert bundle_path.stat().st_size < raw_size
+            assert b"x" * 4096 == ResourceBundle.open(bundle_path).view("big.txt").tobytes()
+
+        def test_bundle_traversable__should__behave_like_a_resource_directory(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When a bundle root is used, it should behave like an importlib resource directory"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+            root = ResourceBundle.open(write_bundle(package_path)).root
+
+            # WHEN / THEN
+            assert root.is_dir()
+            assert ["__init__.py", "big.txt", "empty.bin", "message.txt", "sub"] == [t.name for t in root.iterdir()]
+            assert ["nested.txt"] == [t.name for t in root.joinpath("sub").iterdir()]
+            assert "A nested message" == (root / "sub" / "nested.txt").read_text(encoding="UTF-8")
+            assert "A nested message" == root.joinpath("sub/nested.txt").read_text(encoding="UTF-8")
+            with root.joinpath("message.txt").open("rb") as file:
+                assert b"A bundled message" == file.read()
+
+        def test_main__should__write_and_clean_bundles(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When main is called, should write (or remove with --clean) the bundle of each resource package"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+
+            # WHEN / THEN
+            main([package_path.parent.as_posix()])
+            assert package_path.joinpath(BUNDLE_FILE_NAME).is_file()
+            main([package_path.parent.as_posix(), "--clean"])
+            assert not package_path.joinpath(BUNDLE_FILE_NAME).exists()
+
+        def test_main_with_embed__should__write_and_clean_embedded_resources(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When main is called with --embed, should also write (or remove with --clean) the embedded resources"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+
+            # WHEN / THEN
+            main([package_path.parent.as_posix(), "--embed", "message.txt"])
+            assert package_path.joinpath(EMBEDDED_FILE_NAME).is_file()
+            assert EMBEDDED_FILE_NAME not in ResourceBundle.open(package_path.joinpath(BUNDLE_FILE_NAME)).names()
+            main([package_path.parent.as_posix(), "--clean"])
+            assert not package_path.joinpath(EMBEDDED_FILE_NAME).exists()
+
+    class TestErrorCase:
+        def test_unknown_entry__should__raise_filenotfounderror(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the entry doesn't exist, should raise a FileNotFoundError"""
+            # GIVEN
+            bundle: Final[ResourceBundle] = ResourceBundle.open(
+                write_bundle(_package_path(tmp_resource_package(_RESOURCES)))
+            )
+
+            # WHEN / THEN
+            with raises(FileNotFoundError):
+                bundle.root.joinpath("unknown.txt").read_bytes()
+
+        def test_not_a_bundle__should__raise_valueerror(self) -> None:
+            """When the content is not a bundle, should raise a ValueError"""
+            # GIVEN / WHEN / THEN
+            with raises(ValueError):
+                ResourceBundle(b"NOPE" + bytes(16))
+
+        def test_write_mode__should__raise_valueerror(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When a bundled resource is opened in write mode, should raise a ValueError"""
+            # GIVEN
+            bundle: Final[ResourceBundle] = ResourceBundle.open(
+                write_bundle(_package_path(tmp_resource_package(_RESOURCES)))
+            )
+
+            # WHEN / THEN
+            with raises(ValueError):
+                bundle.root.joinpath("message.txt").open("w")
+
+        def test_none_entry__should__raise_typeerror(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the entry is None, should raise a TypeError"""
+            # GIVEN
+            bundle: Final[ResourceBundle] = ResourceBundle.open(
+                write_bundle(_package_path(tmp_resource_package(_RESOURCES)))
+            )
+
+            # WHEN / THEN
+            with raises(TypeError):
+                bundle.root.joinpath(None)
+
+    class TestMessageServiceIntegration:
+        """MessageService with resource bundle tests"""
+
+        def test_bundled_package__should__serve_messages_from_bundle(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When the resource package contains a bundle, messages should be served from this bundle"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package(_RESOURCES)
+            package_path: Final[Path] = _package_path(package_name)
+            write_bundle(package_path)
+            package_path.joinpath("message.txt").unlink()
+            message_service: Final[MessageService] = MessageService(package_name)
+
+            # WHEN
+            message: Final[str] = message_service.get_message("message.txt")
+
+            # THEN
+            assert "A bundled message" == message
+            assert "A nested message" == message_service.get_messages(["sub/nested.txt"])["sub/nested.txt"]
+            assert isinstance(message_service.get_message_view("big.txt").obj, mmap)
+            assert "x" * 4096 == ''.join(message_service.iter_message("big.txt", chunk_size=100))
+            with raises(FileNotFoundError):
+                message_service.get_message("unknown.txt")
+            with raises(FileNotFoundError):
+                MessageService(package_name, use_bundle=False).get_message("message.txt")
+
+        def test_zipped_bundled_package__should__serve_messages_from_bundle(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str], tmp_path: Path,
+                monkeypatch: MonkeyPatch
+        ) -> None:
+            """When a zipped resource package contains a bundle, messages should be served from this bundle"""
+            # GIVEN
+            package_path: Final[Path] = _package_path(tmp_resource_package(_RESOURCES))
+            zip_path: Final[Path] = tmp_path.joinpath("resources.zip")
+            with ZipFile(zip_path, 'w') as zip_file:
+                zip_file.writestr("zipped_bundle_rsrc/__init__.py", "")
+                zip_file.write(write_bundle(package_path), f"zipped_bundle_rsrc/{BUNDLE_FILE_NAME}")
+            monkeypatch.syspath_prepend(zip_path.as_posix())
+
+            # WHEN
+            message: Final[str] = MessageService("zipped_bundle_rsrc").get_message("message.txt")
+
+            # THEN
+            assert "A bundled message" == message
@@ -0,0 +1,110 @@
+"""ResourceWatcher tests"""
+from collections.abc import Callable
+from importlib.resources import files
+from pathlib import Path
+from sys import platform
+from time import monotonic, sleep
+from typing import Final
+from unittest.mock import MagicMock
+
+from pytest import mark, raises
+
+from hellopymsdl.service.MessageCache import MessageCache
+from hellopymsdl.service.MessageService import MessageService
+from hellopymsdl.service.ResourceWatcher import INOTIFY_BACKEND, POLLING_BACKEND, ResourceWatcher
+
+POLL_INTERVAL: Final[float] = 0.02
+TIMEOUT: Final[float] = 5.0
+
+
+def _wait_for(condition: Callable[[], bool]) -> bool:
+    deadline: Final[float] = monotonic() + TIMEOUT
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        sleep(POLL_INTERVAL)
+    return True
+
+
+class TestResourceWatcher:
+    """ResourceWatcher Tests"""
+
+    class TestNominalCase:
+
+        @mark.parametrize("use_inotify", [True, False])
+        def test_message_file_changes__should__be_reloaded(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str], use_inotify: bool
+        ) -> None:
+            """When message files are changed or added, should serve the new messages without file checks"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"message.txt": "Before"})
+            package_path: Final[Path] = Path(str(files(package_name)))
+            message_service: Final[MessageService] = MessageService(package_name, MessageCache(check_files=False))
+            assert "Before" == message_service.get_message("message.txt")
+
+            with ResourceWatcher(message_service, POLL_INTERVAL, use_inotify) as watcher:
+                # WHEN
+                package_path.joinpath("message.txt").write_text("After!", encoding="UTF-8")
+                package_path.joinpath("sub").mkdir()
+                sleep(POLL_INTERVAL * 5)
+                package_path.joinpath("sub", "new.txt").write_text("New", encoding="UTF-8")
+
+                # THEN
+                assert (INOTIFY_BACKEND if use_inotify and platform.startswith('linux') else POLLING_BACKEND) == watcher.backend
+                assert _wait_for(lambda: message_service.get_message("message.txt") == "After!")
+                assert _wait_for(lambda: message_service.get_message_bytes("sub/new.txt") == b"New")
+            assert watcher.backend is None
+
+        @mark.parametrize("use_inotify", [True, False])
+        def test_message_file_change__should__only_invalidate_changed_message(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str], use_inotify: bool
+        ) -> None:
+            """When a message file changes, should push its name only to the message service"""
+            # GIVEN
+            package_name: Final[str] = tmp_resource_package({"a.txt": "A", "b.txt": "B"})
+            message_service: Final[MessageService] = MessageService(package_name)
+            invalidated: Final[list[str]] = []
+            message_service.invalidate = MagicMock(side_effect=invalidated.extend)  # type: ignore[method-assign]
+
+            with ResourceWatcher(message_service, POLL_INTERVAL, use_inotify):
+                # WHEN
+                Path(str(files(package_name))).joinpath("b.txt").write_text("Changed", encoding="UTF-8")
+
+                # THEN
+                assert _wait_for(lambda: bool(invalidated))
+                assert {"b.txt"} == set(invalidated)
+
+        def test_layered_packages__should__serve_new_override(
+                self, tmp_resource_package: Callable[[dict[str, str | bytes]], str]
+        ) -> None:
+            """When a message is added in a first layered package, should serve it instead of the next package one"""
+            # GIVEN
+            overrides: Final[str] = tmp_resource_package({"a.txt": "A"})
+            defaults: Final[str] = tmp_resource_package({"message.txt": "Default"})
+            message_service: Final[MessageService] = MessageService([overrides, defaults], MessageCache(check_files=False))
+            assert "Default" == message_service.get_message("message.txt")
+
+            with ResourceWatcher(message_service, POLL_INTERVAL):
+                # WHEN
+                Path(str(files(overrides))).joinpath("message.txt").write_text("Override", encoding="UTF-8")
+
+                # THEN
+                assert _wait_for(lambda: message_service.get_message("message.txt") == "Override")
+
+    class TestErrorCase:
+
+        def test_invalid_poll_interval__should__raise_valueerror(self) -> None:
+            """When poll_interval is not positive, should raise a ValueError"""
+            # GIVEN / WHEN / THEN
+            with raises(ValueError):
+                ResourceWatcher(MessageService(), poll_interval=0)
+
+        def test_unknown_resource_package__should__raise_modulenotfounderror(self) -> None:
+            """When the resource package doesn't exist, start should raise a ModuleNotFoundError"""
+            # GIVEN
+            watcher: Final[ResourceWatcher] = ResourceWatcher(MessageService("unknown_test_rsrc"))
+
+            # WHEN / THEN
+            with raises(ModuleNotFoundError):
+                watcher.start()
+            assert watcher.backend is None
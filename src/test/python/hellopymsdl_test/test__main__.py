@@ -1,7 +1,45 @@
 """Main file tests"""
+import sys
+from json import loads
+from os import environ, pathsep
+from pathlib import Path
+from shutil import copytree
+from subprocess import run, PIPE
 from typing import Final
 from unittest.mock import patch, MagicMock, call
 
+import hellopymsdl
+import hellopymsdl_rsrc
+from hellopymsdl.service.EmbeddedResources import write_embedded_resources
+
+# Cumulative "-X importtime" budget of the hellopymsdl.__main__ import (interpreter startup excluded)
+IMPORT_TIME_BUDGET_US: Final[int] = 100_000
+# Modules which must not be imported by the hello command common path
+HEAVY_MODULES: Final[tuple[str, ...]] = (
+    'asyncio', 'concurrent.futures', 'importlib.resources', 'zipfile', 'mmap',
+    'hellopymsdl.service.MessageTemplate', 'hellopymsdl.service.ResourceBundle'
+)
+
+
+def _run_importtime(code: str, *paths: Path) -> tuple[str, dict[str, int]]:
+    """
+    Run python code in a new interpreter (without site) with "-X importtime"
+    :param code: the python code to run
+    :param paths: the paths to prepend to sys.path
+    :return: the stdout and the {module: cumulative import time in microseconds} dict of all imported modules
+    """
+    setup: Final[str] = f"import sys; sys.path[:0] = {[str(path) for path in paths]!r}\n"
+    process = run(
+        [sys.executable, '-S', '-X', 'importtime', '-c', setup + code], stdout=PIPE, stderr=PIPE, text=True, check=True
+    )
+    import_times: Final[dict[str, int]] = {}
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields: list[str] = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+    return process.stdout, import_times
+
 
 class TestHello:
     """hello function Tests"""
@@ -35,3 +73,78 @@ class TestHello:
                 call("hello python with Maven Standard Directory Layout"),
                 call(test_message)
             ])
+
+        @patch('hellopymsdl.service.MessageServer.main')
+        @patch('builtins.print')
+        def test_call_hello_with_serve__should__run_message_server(
+                self, print_mock: MagicMock, server_main_mock: MagicMock
+        ) -> None:
+            """When call hello with --serve, should run the message server with the next arguments"""
+            # GIVEN
+            from hellopymsdl.__main__ import hello
+
+            # WHEN
+            hello(["--serve", "--socket", "hello.sock"])
+
+            # THEN
+            server_main_mock.assert_called_once_with(["--socket", "hello.sock"])
+            print_mock.assert_not_called()
+
+        def test_run_hello_serve__should__answer_stdin_requests(self) -> None:
+            """When run hello --serve, should answer each stdin request with a stdout JSON line"""
+            # GIVEN
+            paths: Final[list[Path]] = [
+                Path(hellopymsdl.__file__).parents[1], Path(hellopymsdl_rsrc.__file__).parents[1]
+            ]
+
+            # WHEN
+            stdout: Final[str] = run(
+                [sys.executable, '-m', 'hellopymsdl', '--serve'], input="message.txt\nunknown.txt\n",
+                env={**environ, 'PYTHONPATH': pathsep.join(map(str, paths))}, stdout=PIPE, text=True, check=True
+            ).stdout
+
+            # THEN
+            responses: Final[list[dict[str, str]]] = [loads(line) for line in stdout.splitlines()]
+            assert responses[0] == {
+                "name": "message.txt",
+                "message": Path(hellopymsdl_rsrc.__file__).parent.joinpath("message.txt").read_text(encoding="UTF-8")
+            }
+            assert responses[1]["name"] == "unknown.txt" and "error" in responses[1]
+
+
+class TestStartup:
+    """hello command cold start Tests"""
+
+    class TestNominalCase:
+
+        def test_import_main__should__stay_within_budget_without_heavy_imports(self) -> None:
+            """When import hellopymsdl.__main__, should not import heavy modules and stay within the startup budget"""
+            # GIVEN
+            paths: Final[list[Path]] = [
+                Path(hellopymsdl.__file__).parents[1], Path(hellopymsdl_rsrc.__file__).parents[1]
+            ]
+
+            # WHEN
+            _, import_times = _run_importtime("import hellopymsdl.__main__", *paths)
+
+            # THEN
+            assert not [module for module in HEAVY_MODULES if module in import_times]
+            assert import_times['hellopymsdl.__main__'] < IMPORT_TIME_BUDGET_US
+
+        def test_hello_with_embedded_message__should__not_lookup_resources(self, tmp_path: Path) -> None:
+            """When call hello with an embedded message.txt, should print it without importlib.resources nor pathlib"""
+            # GIVEN
+            rsrc_package_path: Final[Path] = Path(hellopymsdl_rsrc.__file__).parent
+            copytree(rsrc_package_path, tmp_path.joinpath(rsrc_package_path.name))
+            write_embedded_resources(tmp_path.joinpath(rsrc_package_path.name), ["message.txt"])
+
+            # WHEN
+            stdout, import_times = _run_importtime(
+                "from hellopymsdl.__main__ import hello; hello()", tmp_path, Path(hellopymsdl.__file__).parents[1]
+            )
+
+            # THEN
+            assert stdout == "hello python with Maven Standard Directory Layout\n" \
+                + rsrc_package_path.joinpath("message.txt").read_text(encoding="UTF-8") + "\n"
+            assert 'importlib.resources' not in import_times
+            assert 'pathlib' not in import_times
@@ -0,0 +1,78 @@
+"""project.py tests"""
+import sys
+from pathlib import Path
+from shutil import copy2
+from subprocess import run, PIPE, STDOUT
+from typing import Final
+
+PROJECT_PATH: Final[Path] = Path(__file__).parents[3]
+
+
+def _run_project(project_path: Path, *args: str) -> str:
+    """
+    Run project.py in a project directory
+    :param project_path: the project directory
+    :param args: the project.py arguments
+    :return: the project.py output
+    """
+    result: Final = run([sys.executable, 'project.py', *args], cwd=project_path, stdout=PIPE, stderr=STDOUT, check=True)
+    return result.stdout.decode()
+
+
+class TestCleanCommand:
+    """clean command tests"""
+
+    class TestNominalCase:
+
+        def test_clean__should__leave_no_build_directory(self, tmp_path: Path) -> None:
+            """When the project is cleaned, no build directory (ie: timing report) should be written afterward"""
+            # GIVEN
+            copy2(PROJECT_PATH.joinpath('project.py'), tmp_path)
+            copy2(PROJECT_PATH.joinpath('pyproject.toml'), tmp_path)
+            tmp_path.joinpath('build', 'reports').mkdir(parents=True)
+            tmp_path.joinpath('dist').mkdir()
+            tmp_path.joinpath('src', '.pytest_cache').mkdir(parents=True)
+
+            # WHEN
+            output: Final[str] = _run_project(tmp_path, 'clean')
+
+            # THEN
+            assert "freed" in output
+            assert not tmp_path.joinpath('build').exists()
+            assert not tmp_path.joinpath('dist').exists()
+            assert not tmp_path.joinpath('src', '.pytest_cache').exists()
+
+        def test_dry_run_clean__should__not_remove_anything(self, tmp_path: Path) -> None:
+            """When the clean is a dry run, the targets should be reported but not removed"""
+            # GIVEN
+            copy2(PROJECT_PATH.joinpath('project.py'), tmp_path)
+            copy2(PROJECT_PATH.joinpath('pyproject.toml'), tmp_path)
+            tmp_path.joinpath('dist').mkdir()
+
+            # WHEN
+            output: Final[str] = _run_project(tmp_path, 'clean', '--dry-run')
+
+            # THEN
+            assert "Would remove dist directory" in output
+            assert tmp_path.joinpath('dist').is_dir()
+
+        def test_clean_nested_tree__should__free_the_dry_run_size_and_keep_linked_files(self, tmp_path: Path) -> None:
+            """When a nested tree is cleaned, should free the size reported by a dry run without following the links"""
+            # GIVEN
+            copy2(PROJECT_PATH.joinpath('project.py'), tmp_path)
+            copy2(PROJECT_PATH.joinpath('pyproject.toml'), tmp_path)
+            tmp_path.joinpath('dist', 'a', 'b').mkdir(parents=True)
+            tmp_path.joinpath('dist', 'a', 'b', 'file.bin').write_bytes(b'0' * 100_000)
+            tmp_path.joinpath('dist', 'a', 'file.txt').write_text('text')
+            tmp_path.joinpath('kept').mkdir()
+            tmp_path.joinpath('kept', 'file.txt').write_text('kept')
+            tmp_path.joinpath('dist', 'a', 'link').symlink_to(tmp_path.joinpath('kept'))
+            dry_run_output: Final[str] = _run_project(tmp_path, 'clean', '--dry-run')
+
+            # WHEN
+            output: Final[str] = _run_project(tmp_path, 'clean')
+
+            # THEN
+            assert dry_run_output.splitlines()[-1].replace('would be freed', 'freed') == output.splitlines()[-1]
+            assert not tmp_path.joinpath('dist').exists()
+            assert tmp_path.joinpath('kept', 'file.txt').read_text() == 'kept'